@@ -7,11 +7,18 @@ It uses a SequentialAgent to orchestrate 6 specialized sub-agents:
 
 1. MarketResearchAgent - Live web research with Google Search
 2. CompetitorMappingAgent - Competitor mapping with Maps Places API
-3. GapAnalysisAgent - Quantitative analysis with Python code execution
+3. GapAnalysisAgent - Quantitative analysis with deterministic scoring
 4. StrategyAdvisorAgent - Strategic synthesis with extended reasoning
 5. ReportGeneratorAgent - HTML executive report generation
 6. InfographicGeneratorAgent - Visual infographic generation
 
+Stages 1 and 2 have no data dependency on each other, so by default they run
+concurrently in a ParallelAgent that joins before GapAnalysisAgent (set
+PARALLEL_RESEARCH=FALSE to run them one after the other). Likewise stages 5
+and 6 both only consume strategic_report and fan out in parallel, each guarded
+so a failure in one does not cancel the other (PARALLEL_OUTPUTS=FALSE to
+disable).
+
 The pipeline analyzes a target location for a specific business type and
 produces comprehensive location intelligence including recommendations,
 an HTML report, and an infographic.
@@ -34,7 +41,7 @@ Usage:
     - maps_api_key: Google Maps API key for Places search
 """
 
-from google.adk.agents import SequentialAgent
+from google.adk.agents import BaseAgent, ParallelAgent, SequentialAgent
 from google.adk.agents.llm_agent import Agent
 from google.adk.tools.agent_tool import AgentTool
 
@@ -47,7 +54,57 @@ from .sub_agents.strategy_advisor.agent import strategy_advisor_agent
 from .sub_agents.infographic_generator.agent import infographic_generator_agent
 from .sub_agents.report_generator.agent import report_generator_agent
 
-from .config import FAST_MODEL, APP_NAME
+from .sub_agents.fail_safe import fail_safe
+
+from .callbacks import (
+    before_research_phase,
+    after_research_phase,
+    before_output_phase,
+    after_output_phase,
+)
+from .config import FAST_MODEL, APP_NAME, PARALLEL_RESEARCH, PARALLEL_OUTPUTS
+
+# Parts 1 and 2A only read target_location and business_type, so they can run
+# concurrently; the ParallelAgent returns once both have finished.
+if PARALLEL_RESEARCH:
+    research_stages: list[BaseAgent] = [
+        ParallelAgent(
+            name="ResearchPhase",
+            description="Runs market research and competitor mapping concurrently.",
+            sub_agents=[
+                market_research_agent,      # Part 1: Market research with search
+                competitor_mapping_agent,   # Part 2A: Competitor mapping with Maps
+            ],
+            before_agent_callback=before_research_phase,
+            after_agent_callback=after_research_phase,
+        )
+    ]
+else:
+    research_stages = [
+        market_research_agent,      # Part 1: Market research with search
+        competitor_mapping_agent,   # Part 2A: Competitor mapping with Maps
+    ]
+
+# Parts 4 and 5 both consume only strategic_report and save their own
+# artifacts. Each branch is guarded so one failing does not cancel the other.
+if PARALLEL_OUTPUTS:
+    output_stages: list[BaseAgent] = [
+        ParallelAgent(
+            name="OutputPhase",
+            description="Generates the HTML report and infographic concurrently.",
+            sub_agents=[
+                fail_safe(report_generator_agent, "report_generation"),          # Part 4
+                fail_safe(infographic_generator_agent, "infographic_generation"),  # Part 5
+            ],
+            before_agent_callback=before_output_phase,
+            after_agent_callback=after_output_phase,
+        )
+    ]
+else:
+    output_stages = [
+        report_generator_agent,     # Part 4: HTML report generation
+        infographic_generator_agent,  # Part 5: Infographic generation
+    ]
 
 # location_strategy_pipeline
 location_strategy_pipeline = SequentialAgent(
@@ -70,12 +127,10 @@ The analysis runs automatically through all stages and produces artifacts
 including JSON report, HTML report, and infographic image.
 """,
     sub_agents=[
-        market_research_agent,      # Part 1: Market research with search
-        competitor_mapping_agent,   # Part 2A: Competitor mapping with Maps
-        gap_analysis_agent,         # Part 2B: Gap analysis with code exec
+        *research_stages,           # Parts 1 + 2A: Research (parallel or sequential)
+        gap_analysis_agent,         # Part 2B: Gap analysis with scoring engine
         strategy_advisor_agent,     # Part 3: Strategy synthesis
-        report_generator_agent,     # Part 4: HTML report generation
-        infographic_generator_agent,  # Part 5: Infographic generation
+        *output_stages,             # Parts 4 + 5: Report and infographic
     ],
 )
 
@@ -93,9 +148,9 @@ root_agent = Agent(
 5. After the `IntakeAgent` is successful, delegate the full analysis to the `LocationStrategyPipeline`.
 
 **CRITICAL TOOL USAGE INSTRUCTIONS:**
-- When calling the `IntakeAgent`, use the name EXACTLY as "IntakeAgent". 
+- When calling the `IntakeAgent`, use the name EXACTLY as "IntakeAgent".
 - **DO NOT** add prefixes like "default_api.IntakeAgent" or "functions.IntakeAgent".
-- **DO NOT** use "intake_agent" (lowercase). 
+- **DO NOT** use "intake_agent" (lowercase).
 - Correct Format: `IntakeAgent(target_location="...", business_type="...")
 
 Your main function is to manage this workflow conversationally.""",
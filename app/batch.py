@@ -0,0 +1,228 @@
+"""Run the Location Strategy Pipeline over a batch of location/business pairs.
+
+Reads a CSV or JSONL file with ``target_location`` and ``business_type``
+(and optionally ``additional_context``) per row. The rows are fed straight
+to location_strategy_pipeline, without the conversational root agent, with
+at most BATCH_CONCURRENCY runs in flight. Each LocationIntelligenceReport is
+written to the output directory together with a summary.json of throughput
+and failures.
+
+Usage:
+    uv run python -m app.batch candidates.csv --output-dir batch_output
+    uv run python -m app.batch candidates.jsonl --concurrency 8
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from google.adk.artifacts import BaseArtifactService, InMemoryArtifactService
+from google.adk.runners import Runner
+from google.adk.sessions import BaseSessionService, InMemorySessionService
+from google.genai import types
+
+from .agent import location_strategy_pipeline
+from .config import APP_NAME, BATCH_CONCURRENCY
+from .schemas import LocationIntelligenceReport
+from .tools.genai_client import close_genai_client
+from .tools.maps_client import close_maps_clients
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+REQUIRED_FIELDS = ("target_location", "business_type")
+
+
+def load_requests(path: Path) -> list[dict[str, str]]:
+    """Read location/business pairs from a .csv or .jsonl file.
+
+    Raises:
+        ValueError: If a line is not a JSON object or a row is missing
+            target_location or business_type.
+    """
+    rows = []
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}: line {line_number} is not valid JSON: {e}") from e
+                if not isinstance(row, dict):
+                    raise ValueError(
+                        f"{path}: line {line_number} is not a JSON object ({type(row).__name__})"
+                    )
+                rows.append((line_number, row))
+        else:
+            reader = csv.DictReader(f)
+            rows = [(reader.line_num, row) for row in reader]
+
+    requests = []
+    for line_number, row in rows:
+        request = {key: str(row.get(key) or "").strip() for key in (*REQUIRED_FIELDS, "additional_context")}
+        missing = [key for key in REQUIRED_FIELDS if not request[key]]
+        if missing:
+            raise ValueError(f"{path}: line {line_number} is missing {', '.join(missing)}")
+        requests.append(request)
+    return requests
+
+
+def _slug(request: dict[str, str]) -> str:
+    text = f"{request['business_type']} {request['target_location']}".lower()
+    return re.sub(r"[^a-z0-9]+", "-", text).strip("-")[:80]
+
+
+async def _run_one(
+    index: int,
+    request: dict[str, str],
+    runner: Runner,
+    session_service: BaseSessionService,
+    user_id: str,
+    output_dir: Path,
+) -> dict[str, Any]:
+    """Run the pipeline for one request and write its report."""
+    label = f"{request['business_type']} in {request['target_location']}"
+    result = {"index": index, **request}
+    started = time.perf_counter()
+    try:
+        session = await session_service.create_session(
+            app_name=APP_NAME,
+            user_id=user_id,
+            state={**request, "stages_completed": ["intake"]},
+        )
+        message = types.Content(
+            role="user",
+            parts=[types.Part(text=f"Analyze {label}.")],
+        )
+        async for _ in runner.run_async(user_id=user_id, session_id=session.id, new_message=message):
+            pass
+        finished = await session_service.get_session(
+            app_name=APP_NAME, user_id=user_id, session_id=session.id
+        )
+        if finished is None:
+            raise RuntimeError(f"session {session.id} no longer exists after the run")
+        state = finished.state
+
+        report = state.get("strategic_report")
+        if not report:
+            raise RuntimeError("pipeline finished without a strategic report")
+        if hasattr(report, "model_dump"):
+            report = report.model_dump()
+        report = LocationIntelligenceReport.model_validate(report)
+
+        report_path = output_dir / f"{index:03d}-{_slug(request)}.json"
+        report_path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
+
+        result.update({
+            "status": "success",
+            "session_id": session.id,
+            "report_path": str(report_path),
+            "stages_completed": state.get("stages_completed", []),
+        })
+        stage_errors = {
+            key: value for key, value in state.items() if key.endswith("_error") and value
+        }
+        if stage_errors:
+            result["stage_errors"] = stage_errors
+    except Exception as e:
+        logger.error(f"BATCH: {label} failed: {e}")
+        result.update({"status": "error", "error_message": str(e)})
+
+    result["duration_s"] = round(time.perf_counter() - started, 2)
+    logger.info(f"BATCH: {label} - {result['status']} in {result['duration_s']}s")
+    return result
+
+
+async def run_batch(
+    requests: list[dict[str, str]],
+    output_dir: Path,
+    concurrency: int = BATCH_CONCURRENCY,
+    user_id: str = "batch_user",
+    session_service: Optional[BaseSessionService] = None,
+    artifact_service: Optional[BaseArtifactService] = None,
+) -> dict[str, Any]:
+    """Run the pipeline for every request with bounded concurrency.
+
+    Args:
+        requests: Rows as returned by load_requests().
+        output_dir: Directory for the report JSON files and summary.json.
+        concurrency: Maximum pipeline runs in flight.
+        user_id: Owner of the batch sessions.
+        session_service: Where to create sessions (in-memory by default).
+        artifact_service: Where to save artifacts (in-memory by default).
+
+    Returns:
+        dict: The batch summary (also written to output_dir/summary.json).
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    session_service = session_service or InMemorySessionService()
+    runner = Runner(
+        app_name=APP_NAME,
+        agent=location_strategy_pipeline,
+        session_service=session_service,
+        artifact_service=artifact_service or InMemoryArtifactService(),
+    )
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def bounded(index: int, request: dict[str, str]) -> dict[str, Any]:
+        async with semaphore:
+            return await _run_one(index, request, runner, session_service, user_id, output_dir)
+
+    logger.info(f"BATCH: {len(requests)} analyses, concurrency {concurrency}")
+    started = time.perf_counter()
+    results = await asyncio.gather(*(bounded(i, request) for i, request in enumerate(requests, start=1)))
+    elapsed = time.perf_counter() - started
+
+    failures = [result for result in results if result["status"] != "success"]
+    summary = {
+        "finished_at": datetime.now().isoformat(),
+        "total": len(results),
+        "succeeded": len(results) - len(failures),
+        "failed": len(failures),
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 2),
+        "throughput_per_min": round(len(results) / elapsed * 60, 2) if elapsed else 0.0,
+        "failures": [
+            {key: result[key] for key in ("index", *REQUIRED_FIELDS, "error_message")}
+            for result in failures
+        ],
+        "results": results,
+    }
+    (output_dir / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    logger.info(
+        f"BATCH: {summary['succeeded']}/{summary['total']} succeeded in {summary['elapsed_s']}s "
+        f"({summary['throughput_per_min']}/min)"
+    )
+    return summary
+
+
+async def _run_cli_batch(requests: list[dict[str, str]], output_dir: Path, concurrency: int) -> dict[str, Any]:
+    """run_batch, then close the clients bound to this run's event loop."""
+    try:
+        return await run_batch(requests, output_dir, concurrency)
+    finally:
+        await close_maps_clients()
+        await close_genai_client()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", type=Path, help="CSV or JSONL of target_location, business_type")
+    parser.add_argument("--output-dir", type=Path, default=Path("batch_output"))
+    parser.add_argument("--concurrency", type=int, default=BATCH_CONCURRENCY)
+    args = parser.parse_args()
+
+    summary = asyncio.run(_run_cli_batch(load_requests(args.input), args.output_dir, args.concurrency))
+    print(json.dumps({key: value for key, value in summary.items() if key != "results"}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
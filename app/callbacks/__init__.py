@@ -5,30 +5,38 @@ from .pipeline_callbacks import (
     # Before callbacks
     before_market_research,
     before_competitor_mapping,
+    before_research_phase,
     before_gap_analysis,
     before_strategy_advisor,
+    before_output_phase,
     before_report_generator,
     before_infographic_generator,
     # After callbacks
     after_market_research,
     after_competitor_mapping,
+    after_research_phase,
     after_gap_analysis,
     after_strategy_advisor,
     after_report_generator,
     after_infographic_generator,
+    after_output_phase,
 )
 
 __all__ = [
     "before_market_research",
     "before_competitor_mapping",
+    "before_research_phase",
     "before_gap_analysis",
     "before_strategy_advisor",
+    "before_output_phase",
     "before_report_generator",
     "before_infographic_generator",
     "after_market_research",
     "after_competitor_mapping",
+    "after_research_phase",
     "after_gap_analysis",
     "after_strategy_advisor",
     "after_report_generator",
     "after_infographic_generator",
+    "after_output_phase",
 ]
\ No newline at end of file
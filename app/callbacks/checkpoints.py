@@ -0,0 +1,125 @@
+"""Durable per-stage checkpoints for resuming interrupted pipeline runs.
+
+After each stage completes, its output keys are written to an SQLite file
+under CACHE_DIR, grouped by a checkpoint id (the session and invocation
+that started the run). A run resumed from that id restores completed stages
+from the checkpoints instead of re-running them, so a timeout or crash in
+StrategyAdvisor keeps the earlier paid work. See app/resume.py.
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+
+from ..config import CACHE_DIR, CHECKPOINT_ENABLED, CHECKPOINT_TTL_SECONDS
+from ..utils.cache import TTLCache
+from .stage_cache import STAGE_SPECS
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+# State keys restored per stage; the deliverable stages keep artifact
+# references, and copy the referenced artifacts into the new session on restore
+CHECKPOINT_KEYS: dict[str, tuple[str, ...]] = {
+    **{stage: spec.outputs for stage, spec in STAGE_SPECS.items()},
+    "report_generation": ("report_generation_result", "html_report_artifact"),
+    "infographic_generation": ("infographic_result", "infographic_artifact", "infographic_variants"),
+}
+
+# Request fields recorded once per run, enough to rebuild a session
+REQUEST_KEYS = ("target_location", "business_type", "additional_context")
+
+checkpoint_store = (
+    TTLCache(
+        namespace="checkpoints",
+        max_entries=64,
+        ttl_seconds=CHECKPOINT_TTL_SECONDS,
+        db_path=Path(CACHE_DIR) / "checkpoints.sqlite",
+    )
+    if CHECKPOINT_ENABLED
+    else None
+)
+
+
+def checkpoint_id(callback_context: CallbackContext) -> str:
+    """Id this run's checkpoints are stored under.
+
+    Every invocation is a separate run, so a new analysis in the same session
+    never picks up an earlier request's checkpoints. A resumed run carries
+    the original id in state.
+    """
+    return (
+        callback_context.state.get("checkpoint_id")
+        or f"{callback_context.session.id}/{callback_context.invocation_id}"
+    )
+
+
+def is_resuming(callback_context: CallbackContext) -> bool:
+    return bool(callback_context.state.get("resume_from_checkpoint"))
+
+
+def save_request(callback_context: CallbackContext) -> None:
+    """Record the request of a fresh run (no-op when resuming)."""
+    if checkpoint_store is None or is_resuming(callback_context):
+        return
+    state = callback_context.state
+    request = {key: state.get(key) for key in REQUEST_KEYS}
+    request["started_at"] = datetime.now().isoformat()
+    checkpoint_store.set(f"{checkpoint_id(callback_context)}:request", request)
+    logger.info(f"  Checkpoint id: {checkpoint_id(callback_context)}")
+
+
+def save_checkpoint(callback_context: CallbackContext, stage: str) -> None:
+    """Persist the output keys ``stage`` just wrote to state."""
+    if checkpoint_store is None or stage not in CHECKPOINT_KEYS:
+        return
+    state = callback_context.state
+    outputs = {}
+    for key in CHECKPOINT_KEYS[stage]:
+        value = state.get(key)
+        if value is not None:
+            outputs[key] = value.model_dump() if hasattr(value, "model_dump") else value
+    if not outputs:
+        return
+    try:
+        snapshot = json.loads(json.dumps(outputs, default=str))
+        checkpoint_store.set(f"{checkpoint_id(callback_context)}:{stage}", snapshot)
+    except (TypeError, ValueError) as e:
+        logger.warning(f"  Could not checkpoint {stage}: {e}")
+
+
+def load_checkpoint(callback_context: CallbackContext, stage: str) -> Optional[dict[str, Any]]:
+    """Checkpointed outputs of ``stage`` when resuming a run, else None."""
+    if checkpoint_store is None or not is_resuming(callback_context):
+        return None
+    return checkpoint_store.get(f"{checkpoint_id(callback_context)}:{stage}")
+
+
+def load_run(run_id: str) -> Optional[dict[str, Any]]:
+    """Request and completed stages of a checkpointed run, or None if unknown."""
+    if checkpoint_store is None:
+        return None
+    request = checkpoint_store.get(f"{run_id}:request")
+    if request is None:
+        return None
+    completed = [
+        stage for stage in CHECKPOINT_KEYS
+        if checkpoint_store.get(f"{run_id}:{stage}") is not None
+    ]
+    return {"checkpoint_id": run_id, "request": request, "stages_completed": completed}
+
+
+def list_runs() -> list[dict[str, Any]]:
+    """Every checkpointed run that has not expired, newest first."""
+    if checkpoint_store is None:
+        return []
+    runs = [
+        load_run(key.rsplit(":", 1)[0])
+        for key in checkpoint_store.keys()
+        if key.endswith(":request")
+    ]
+    runs = [run for run in runs if run is not None]
+    return sorted(runs, key=lambda run: run["request"].get("started_at") or "", reverse=True)
@@ -0,0 +1,215 @@
+"""Token-budgeted compaction of upstream stage outputs for downstream prompts.
+
+GapAnalysisAgent and StrategyAdvisorAgent template the full market research,
+competitor analysis and gap analysis text into their instructions. Before
+each of them runs, every upstream output is fitted into that consumer's
+token budget (unused budget of short inputs is shared among the long ones)
+and written to ``<key>_compact``, which is what the instruction templates
+read. Compaction is deterministic: headings, tables and sentences
+or list items carrying facts (numbers, verdicts, risks) are kept in order,
+and the remaining prose is dropped first. A pointer to the untouched full
+text in state is appended, and the reduction is logged and recorded in
+``state["context_compaction"]``.
+
+Set CONTEXT_COMPACTION=FALSE to pass the full text through unchanged.
+"""
+
+import json
+import logging
+import re
+from typing import Any
+
+from google.adk.agents.callback_context import CallbackContext
+
+from ..config import (
+    CONTEXT_COMPACTION,
+    GAP_ANALYSIS_CONTEXT_TOKENS,
+    STRATEGY_CONTEXT_TOKENS,
+)
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+# consumer stage -> (total token budget, {upstream key: share of the budget})
+CONTEXT_BUDGETS: dict[str, tuple[int, dict[str, float]]] = {
+    "gap_analysis": (
+        GAP_ANALYSIS_CONTEXT_TOKENS,
+        {"market_research_findings": 0.5, "competitor_analysis": 0.5},
+    ),
+    "strategy_synthesis": (
+        STRATEGY_CONTEXT_TOKENS,
+        {"market_research_findings": 0.3, "competitor_analysis": 0.3, "gap_analysis": 0.4},
+    ),
+}
+
+# Room left for the pointer line appended to compacted text
+_POINTER_TOKENS = 40
+
+_FACT = re.compile(r"\d|%|[$₹€£]")
+_KEY_TERMS = re.compile(
+    r"verdict|recommend|opportunit|risk|saturat|viab|top zone|rank", re.IGNORECASE
+)
+_LIST_ITEM = re.compile(r"^\s*(?:[-*•+]|\d+[.)])\s+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9*\"'(])")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English prose)."""
+    return (len(text) + 3) // 4
+
+
+def _priority(text: str, list_item: bool) -> int:
+    informative = bool(_FACT.search(text) or _KEY_TERMS.search(text))
+    if list_item:
+        return 2 if informative else 4
+    return 3 if informative else 5
+
+
+def _units(text: str) -> list[tuple[int, int, str]]:
+    """Split text into (priority, paragraph, text) units in document order.
+
+    Headings (0) and tables (1) are kept whole; list items are one unit
+    each; prose paragraphs are split into sentences.
+    """
+    units = []
+    paragraph = 0
+    table: list[str] = []
+    prose: list[str] = []
+
+    def flush() -> None:
+        nonlocal paragraph, table, prose
+        if table:
+            units.append((1, paragraph, "\n".join(table)))
+            paragraph += 1
+            table = []
+        if prose:
+            for sentence in _SENTENCE_END.split(" ".join(prose)):
+                units.append((_priority(sentence, False), paragraph, sentence))
+            paragraph += 1
+            prose = []
+
+    in_code = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            # Code blocks are reproducible elsewhere (gap_analysis_code); drop them
+            flush()
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        if not stripped:
+            flush()
+        elif stripped.startswith("|"):
+            if prose:
+                flush()
+            table.append(stripped)
+        elif stripped.startswith("#"):
+            flush()
+            units.append((0, paragraph, stripped))
+            paragraph += 1
+        elif _LIST_ITEM.match(line):
+            flush()
+            units.append((_priority(stripped, True), paragraph, stripped))
+            paragraph += 1
+        else:
+            if table:
+                flush()
+            prose.append(stripped)
+    flush()
+    return units
+
+
+def _truncate_table(table: str, budget_tokens: int) -> str:
+    """Header, separator and as many rows as fit in the budget."""
+    rows = table.splitlines()
+    kept = rows[:2]
+    for row in rows[2:]:
+        if estimate_tokens("\n".join([*kept, row])) > budget_tokens:
+            kept.append(f"| ... {len(rows) - len(kept)} more rows |")
+            break
+        kept.append(row)
+    return "\n".join(kept)
+
+
+def compact_text(text: str, budget_tokens: int, source_key: str = "") -> str:
+    """Fit ``text`` into ``budget_tokens``, keeping structure and facts.
+
+    Text that already fits is returned unchanged.
+    """
+    original_tokens = estimate_tokens(text)
+    if original_tokens <= budget_tokens:
+        return text
+
+    budget = max(budget_tokens - _POINTER_TOKENS, 0)
+    units = _units(text)
+    kept: dict[int, str] = {}
+    used = 0
+    for index in sorted(range(len(units)), key=lambda i: (units[i][0], i)):
+        priority, _, unit = units[index]
+        cost = estimate_tokens(unit) + 1
+        if used + cost > budget:
+            if priority == 1 and budget - used > 50:
+                unit = _truncate_table(unit, budget - used)
+                cost = estimate_tokens(unit) + 1
+            else:
+                continue
+        kept[index] = unit
+        used += cost
+
+    paragraphs: dict[int, list[str]] = {}
+    for index in sorted(kept):
+        paragraphs.setdefault(units[index][1], []).append(kept[index])
+    body = "\n".join(" ".join(parts) for parts in paragraphs.values())
+
+    pointer = f"[Compacted from ~{original_tokens:,} to ~{estimate_tokens(body):,} tokens"
+    pointer += f"; full text in state['{source_key}']]" if source_key else "]"
+    return f"{body}\n{pointer}"
+
+
+def compact_context(callback_context: CallbackContext, consumer: str) -> dict[str, Any]:
+    """Write ``<key>_compact`` for every upstream output ``consumer`` reads.
+
+    Returns:
+        dict: Per-key original and compacted token estimates.
+    """
+    total_budget, shares = CONTEXT_BUDGETS[consumer]
+    state = callback_context.state
+    texts = {}
+    for key in shares:
+        value = state.get(key, "")
+        texts[key] = value if isinstance(value, str) else json.dumps(value, default=str)
+
+    # Budget left unused by short inputs goes to the ones that overflow
+    budgets = {key: int(total_budget * share) for key, share in shares.items()}
+    surplus = sum(max(budgets[key] - estimate_tokens(text), 0) for key, text in texts.items())
+    overflowing = [key for key, text in texts.items() if estimate_tokens(text) > budgets[key]]
+    for key in overflowing:
+        budgets[key] += int(surplus * shares[key] / sum(shares[k] for k in overflowing))
+
+    report: dict[str, Any] = {}
+    for key, text in texts.items():
+        compacted = compact_text(text, budgets[key], key) if CONTEXT_COMPACTION else text
+        state[f"{key}_compact"] = compacted
+        report[key] = {
+            "original_tokens": estimate_tokens(text),
+            "compact_tokens": estimate_tokens(compacted),
+        }
+
+    original = sum(entry["original_tokens"] for entry in report.values())
+    compact = sum(entry["compact_tokens"] for entry in report.values())
+    report["reduction_pct"] = round(100 * (1 - compact / original), 1) if original else 0.0
+
+    summary = dict(state.get("context_compaction") or {})
+    summary[consumer] = report
+    state["context_compaction"] = summary
+
+    details = ", ".join(
+        f"{key} {entry['original_tokens']:,}->{entry['compact_tokens']:,}"
+        for key, entry in report.items()
+        if isinstance(entry, dict)
+    )
+    logger.info(
+        f"  Context for {consumer}: ~{original:,} -> ~{compact:,} tokens "
+        f"(-{report['reduction_pct']}%): {details}"
+    )
+    return report
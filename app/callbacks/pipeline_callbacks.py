@@ -9,12 +9,32 @@ Location Strategy Pipeline. Callbacks handle:
 
 import json
 import logging
+import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional
 
 from google.adk.agents.callback_context import CallbackContext
 from google.genai import types
 
+from ..config import HTML_REPORT_MODE, INFOGRAPHIC_MODE, PARALLEL_OUTPUTS
+from ..schemas.competitor_schema import CompetitorSet
+from ..tools.gap_scoring import locality_counts
+from ..tools.html_report_generator import render_html_report
+from ..tools.image_generator import render_infographic
+from .checkpoints import load_checkpoint, save_checkpoint, save_request
+from .context_compaction import compact_context
+from ..utils.artifacts import (
+    HTML_REPORT_REF_KEY,
+    INFOGRAPHIC_REF_KEY,
+    INFOGRAPHIC_VARIANTS_KEY,
+    load_artifact_ref,
+    save_artifact_ref,
+)
+from ..utils.telemetry import finish_stage, start_stage
+from .stage_cache import agent_model_name, lookup_stage, store_stage
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +42,105 @@ logging.basicConfig(
 )
 logger = logging.getLogger("LocationStrategyPipeline")
 
+# Stage keys in pipeline order (matches the frontend's stages_completed keys)
+PIPELINE_STAGES = (
+    "intake",
+    "market_research",
+    "competitor_mapping",
+    "gap_analysis",
+    "strategy_synthesis",
+    "report_generation",
+    "infographic_generation",
+)
+
+# session_id -> stages completed in this process. Parallel branches share the
+# session but their state deltas land one event at a time, so a plain
+# read-append-write of stages_completed can drop a stage finished concurrently.
+_completed_stages: OrderedDict[str, set[str]] = OrderedDict()
+_stages_lock = threading.Lock()
+_MAX_TRACKED_SESSIONS = 1024
+
+
+def _mark_stage_completed(callback_context: CallbackContext, stage: str) -> list[str]:
+    """Add a stage to stages_completed; safe for concurrently finishing stages.
+
+    Writes a fresh list (the shared one is never mutated in place) holding every
+    stage recorded for the session so far, in pipeline order.
+    """
+    session_id = callback_context.session.id
+    with _stages_lock:
+        done = _completed_stages.pop(session_id, set())
+        done.update(callback_context.state.get("stages_completed") or [])
+        done.add(stage)
+        _completed_stages[session_id] = done
+        while len(_completed_stages) > _MAX_TRACKED_SESSIONS:
+            _completed_stages.popitem(last=False)
+
+    stages = [name for name in PIPELINE_STAGES if name in done]
+    stages += sorted(done.difference(PIPELINE_STAGES))
+    callback_context.state["stages_completed"] = stages
+    return stages
+
+
+def _begin_stage(callback_context: CallbackContext, stage: str) -> None:
+    """Start timing a stage and open its trace span."""
+    start_stage(
+        callback_context.session.id,
+        stage,
+        callback_context.agent_name,
+        agent_model_name(callback_context),
+    )
+
+
+def _end_stage(callback_context: CallbackContext, stage: str, status: str = "ok") -> None:
+    """Close a stage's ledger entry from its events and store the ledger in state."""
+    events = [
+        event for event in callback_context.session.events
+        if event.invocation_id == callback_context.invocation_id
+        and event.author == callback_context.agent_name
+    ]
+    ledger = finish_stage(callback_context.session.id, stage, status, events)
+    callback_context.state["stage_ledger"] = ledger
+
+    entry = ledger.get(stage)
+    if entry:
+        logger.info(
+            f"  Ledger: {entry['duration_s']:.1f}s, tokens in/out/thinking "
+            f"{entry['input_tokens']}/{entry['output_tokens']}/{entry['thinking_tokens']}, "
+            f"{entry['tool_calls']} tool calls, {entry['retries']} retries, "
+            f"~${entry['est_cost_usd']:.4f} ({status})"
+        )
+
+
+def _restore_stage(callback_context: CallbackContext, stage: str) -> Optional[types.Content]:
+    """Short-circuit a stage whose outputs are already known.
+
+    A resumed run restores the stage from its checkpoint; otherwise the stage
+    cache is consulted for identical inputs. Restores the stage's output keys,
+    marks it completed and returns its primary output as the agent's response,
+    which makes ADK skip the agent (and its after callback). Returns None when
+    the stage has to run.
+    """
+    outputs = load_checkpoint(callback_context, stage)
+    source = "checkpoint"
+    if outputs is None:
+        outputs = lookup_stage(callback_context, stage)
+        source = "stage_cache"
+    if outputs is None:
+        return None
+
+    for key, value in outputs.items():
+        callback_context.state[key] = value
+    # Keep the restored stage resumable under this run's checkpoint id too
+    save_checkpoint(callback_context, stage)
+    _mark_stage_completed(callback_context, stage)
+    logger.info(f"  Restored {stage} outputs from {source}")
+    _end_stage(callback_context, stage, status=source)
+
+    primary = next(iter(outputs.values()))
+    text = primary if isinstance(primary, str) else json.dumps(primary, default=str)
+    return types.Content(role="model", parts=[types.Part(text=text)])
+
 
 # ============================================================================
 # BEFORE AGENT CALLBACKS
@@ -29,6 +148,7 @@ logger = logging.getLogger("LocationStrategyPipeline")
 
 def before_market_research(callback_context: CallbackContext) -> Optional[types.Content]:
     """Log start of market research phase and initialize pipeline tracking."""
+    _begin_stage(callback_context, "market_research")
     logger.info("=" * 60)
     logger.info("STAGE 1: MARKET RESEARCH - Starting")
     logger.info(f"  Target Location: {callback_context.state.get('target_location', 'Not set')}")
@@ -44,12 +164,75 @@ def before_market_research(callback_context: CallbackContext) -> Optional[types.
     # Don't reset stages_completed - intake stage may already be tracked
     if "stages_completed" not in callback_context.state:
         callback_context.state["stages_completed"] = []
+    save_request(callback_context)
 
-    return None  # Allow agent to proceed
+    restored = _restore_stage(callback_context, "market_research")
+    if restored is None:
+        _prepare_area_profile(callback_context)
+    return restored
+
+
+def _same_text(a: Optional[str], b: Optional[str]) -> bool:
+    return " ".join(str(a or "").lower().split()) == " ".join(str(b or "").lower().split())
+
+
+def _prepare_area_profile(callback_context: CallbackContext) -> None:
+    """Reuse the location-level research of an earlier run for this location.
+
+    The area profile (demographics, market growth) does not depend on the
+    business type. When it is known - from an earlier analysis in this
+    session or from the stage cache - it is handed to the agent through
+    ``area_profile_note`` so only the business-specific research runs again.
+    """
+    state = callback_context.state
+    previous = state.get("analyzed_request") or {}
+    location = state.get("target_location")
+    business = state.get("business_type")
+    state["analyzed_request"] = {"target_location": location, "business_type": business}
+
+    profile = None
+    if previous and _same_text(previous.get("target_location"), location):
+        if not _same_text(previous.get("business_type"), business):
+            logger.info(
+                f"  Re-analysis: business type changed ({previous.get('business_type')} -> "
+                f"{business}); reusing location-level results"
+            )
+        profile = state.get("area_profile")
+    if not profile:
+        cached = lookup_stage(callback_context, "area_profile")
+        profile = cached.get("area_profile") if cached else None
+
+    if not profile:
+        state["area_profile"] = ""
+        state["area_profile_note"] = ""
+        return
+
+    logger.info(f"  Reusing area profile ({len(profile)} characters); researching business market only")
+    state["area_profile"] = profile
+    state["area_profile_note"] = (
+        "## Known Area Profile\n"
+        "The location-level research for this area was completed in an earlier analysis:\n\n"
+        f"{profile}\n\n"
+        "Do NOT research DEMOGRAPHICS or MARKET GROWTH again. Spend your searches on "
+        "INDUSTRY PRESENCE and COMMERCIAL VIABILITY, and output only the "
+        "## BUSINESS MARKET section.\n"
+    )
+
+
+def _split_findings(findings: str) -> tuple[str, str]:
+    """Split market research into its (area profile, business market) sections."""
+    area = re.search(r"^#+\s*AREA PROFILE\b", findings, re.MULTILINE | re.IGNORECASE)
+    business = re.search(r"^#+\s*BUSINESS MARKET\b", findings, re.MULTILINE | re.IGNORECASE)
+    if area is None:
+        return "", findings
+    if business is None or business.start() < area.start():
+        return findings[area.start():].strip(), ""
+    return findings[area.start():business.start()].strip(), findings[business.start():].strip()
 
 
 def before_competitor_mapping(callback_context: CallbackContext) -> Optional[types.Content]:
     """Log start of competitor mapping phase."""
+    _begin_stage(callback_context, "competitor_mapping")
     logger.info("=" * 60)
     logger.info("STAGE 2A: COMPETITOR MAPPING - Starting")
     logger.info("  Using Google Maps Places API for real competitor data...")
@@ -64,29 +247,56 @@ def before_competitor_mapping(callback_context: CallbackContext) -> Optional[typ
     if "competitor_analysis" not in callback_context.state:
         callback_context.state["competitor_analysis"] = "Competitor data being collected via Google Maps API..."
 
+    # search_places merges into this set; start each analysis from an empty one
+    # so an earlier request's city and business type never leak into this one
+    callback_context.state["competitor_places"] = None
+
+    return _restore_stage(callback_context, "competitor_mapping")
+
+
+def before_research_phase(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Log start of the parallel research phase (stages 1 and 2A)."""
+    logger.info("=" * 60)
+    logger.info("RESEARCH PHASE: Running market research and competitor mapping in parallel")
+    logger.info("=" * 60)
+
+    callback_context.state["research_phase_start_time"] = datetime.now().isoformat()
+
     return None
 
 
 def before_gap_analysis(callback_context: CallbackContext) -> Optional[types.Content]:
     """Log start of gap analysis phase."""
+    _begin_stage(callback_context, "gap_analysis")
     logger.info("=" * 60)
     logger.info("STAGE 2B: GAP ANALYSIS - Starting")
-    logger.info("  Executing Python code for quantitative market analysis...")
+    logger.info("  Scoring sub-zones with the deterministic gap scoring engine...")
     logger.info("=" * 60)
 
     # Set current date for state injection in agent instruction
     callback_context.state["current_date"] = datetime.now().strftime("%Y-%m-%d")
     callback_context.state["pipeline_stage"] = "gap_analysis"
 
+    # Localities seen in competitor addresses, so zone names match the data
+    localities = locality_counts(CompetitorSet.from_state(callback_context.state))
+    callback_context.state["competitor_localities"] = (
+        "\n".join(f"- {name}: {count}" for name, count in localities[:25])
+        or "No structured competitor data available"
+    )
+
     # Workaround for AG-UI middleware issue: initialize state variable
     if "gap_analysis" not in callback_context.state:
         callback_context.state["gap_analysis"] = "Gap analysis being computed..."
 
-    return None
+    restored = _restore_stage(callback_context, "gap_analysis")
+    if restored is None:
+        compact_context(callback_context, "gap_analysis")
+    return restored
 
 
-def before_strategy_advisor(callback_context: CallbackContext) -> Optional[types.Content]:
+async def before_strategy_advisor(callback_context: CallbackContext) -> Optional[types.Content]:
     """Log start of strategy synthesis phase."""
+    _begin_stage(callback_context, "strategy_synthesis")
     logger.info("=" * 60)
     logger.info("STAGE 3: STRATEGY SYNTHESIS - Starting")
     logger.info("  Using extended reasoning with thinking mode...")
@@ -97,11 +307,77 @@ def before_strategy_advisor(callback_context: CallbackContext) -> Optional[types
     callback_context.state["current_date"] = datetime.now().strftime("%Y-%m-%d")
     callback_context.state["pipeline_stage"] = "strategy_synthesis"
 
+    cached = _restore_stage(callback_context, "strategy_synthesis")
+    if cached is not None:
+        # after_strategy_advisor is skipped on a hit, so save the artifact here
+        await _save_report_artifact(callback_context, callback_context.state.get("strategic_report"))
+    else:
+        compact_context(callback_context, "strategy_synthesis")
+    return cached
+
+
+async def _copy_artifact(callback_context: CallbackContext, ref: dict) -> Optional[dict]:
+    """Copy one referenced artifact into this session; returns its new reference."""
+    session = callback_context.session
+    if ref.get("session_id") == session.id and ref.get("user_id") == session.user_id:
+        return ref
+    artifact_service = callback_context._invocation_context.artifact_service
+    loaded = await load_artifact_ref(artifact_service, ref) if artifact_service else None
+    if loaded is None:
+        logger.warning(f"  Artifact {ref['filename']} of the interrupted run is no longer available")
+        return None
+    data, mime_type = loaded
+    copied = await save_artifact_ref(callback_context, ref["filename"], data, mime_type)
+    logger.info(f"  Saved artifact: {ref['filename']}")
+    # Keep extra fields such as image dimensions
+    return {**ref, **copied}
+
+
+async def _resave_artifact(callback_context: CallbackContext, ref_key: str) -> bool:
+    """Copy a restored stage's artifacts into this session and update their references.
+
+    The references in a checkpoint point at the interrupted run's session;
+    ``ref_key`` holds one reference or a list of them. Returns False if there
+    is nothing to copy or any artifact can no longer be loaded (e.g. the
+    original run used an in-memory artifact service).
+    """
+    refs = callback_context.state.get(ref_key)
+    if not refs:
+        return False
+    try:
+        if isinstance(refs, list):
+            copied = [await _copy_artifact(callback_context, ref) for ref in refs]
+            if None in copied:
+                return False
+        else:
+            copied = await _copy_artifact(callback_context, refs)
+            if copied is None:
+                return False
+        callback_context.state[ref_key] = copied
+        return True
+    except Exception as e:
+        logger.warning(f"  Failed to save {ref_key} artifacts: {e}")
+        return False
+
+
+def before_output_phase(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Log start of the parallel output phase (stages 4 and 5)."""
+    logger.info("=" * 60)
+    logger.info("OUTPUT PHASE: Generating HTML report and infographic in parallel")
+    logger.info("=" * 60)
+
+    callback_context.state["output_phase_start_time"] = datetime.now().isoformat()
+    # Clear failures recorded by a previous run of this session
+    for stage in ("report_generation", "infographic_generation"):
+        if callback_context.state.get(f"{stage}_error"):
+            callback_context.state[f"{stage}_error"] = None
+
     return None
 
 
-def before_report_generator(callback_context: CallbackContext) -> Optional[types.Content]:
+async def before_report_generator(callback_context: CallbackContext) -> Optional[types.Content]:
     """Log start of report generation phase."""
+    _begin_stage(callback_context, "report_generation")
     logger.info("=" * 60)
     logger.info("STAGE 4: REPORT GENERATION - Starting")
     logger.info("  Generating McKinsey/BCG style HTML executive report...")
@@ -111,23 +387,108 @@ def before_report_generator(callback_context: CallbackContext) -> Optional[types
     callback_context.state["current_date"] = datetime.now().strftime("%Y-%m-%d")
     callback_context.state["pipeline_stage"] = "report_generation"
 
+    restored = _restore_stage(callback_context, "report_generation")
+    if restored is not None:
+        # The artifact lives in the interrupted run's session; if it cannot be
+        # copied from there, render the deck from the template (in any mode)
+        if not await _resave_artifact(callback_context, HTML_REPORT_REF_KEY):
+            await render_html_report(callback_context)
+        return restored
+    if HTML_REPORT_MODE == "template":
+        return await _render_report_from_template(callback_context)
     return None
 
 
-def before_infographic_generator(callback_context: CallbackContext) -> Optional[types.Content]:
+async def _render_report_from_template(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Render the deck locally and skip ReportGeneratorAgent's model calls.
+
+    Returns None (the agent runs in "creative" mode) if rendering fails.
+    Returning content skips the agent and after_report_generator, so the
+    stage is closed here.
+    """
+    result = await render_html_report(callback_context)
+    if result["status"] != "success":
+        logger.warning(f"  Template render failed, falling back to Gemini: {result['error_message']}")
+        return None
+
+    message = (
+        f"{result['message']} (rendered from template in {result['render_ms']} ms, "
+        f"{result['html_length']:,} characters)."
+    )
+    callback_context.state["report_generation_result"] = message
+    logger.info("STAGE 4: COMPLETE - HTML report rendered from template")
+
+    _end_stage(callback_context, "report_generation")
+    save_checkpoint(callback_context, "report_generation")
+    _mark_stage_completed(callback_context, "report_generation")
+    return types.Content(role="model", parts=[types.Part(text=message)])
+
+
+async def before_infographic_generator(callback_context: CallbackContext) -> Optional[types.Content]:
     """Log start of infographic generation phase."""
+    _begin_stage(callback_context, "infographic_generation")
     logger.info("=" * 60)
     logger.info("STAGE 5: INFOGRAPHIC GENERATION - Starting")
-    logger.info("  Calling Gemini image generation API...")
+    if INFOGRAPHIC_MODE == "template":
+        logger.info("  Rendering SVG infographic from the strategic report...")
+    else:
+        logger.info("  Calling Gemini image generation API...")
     logger.info("=" * 60)
 
     # Set current date for state injection in agent instruction
     callback_context.state["current_date"] = datetime.now().strftime("%Y-%m-%d")
     callback_context.state["pipeline_stage"] = "infographic_generation"
 
+    restored = _restore_stage(callback_context, "infographic_generation")
+    if restored is not None:
+        # The artifacts live in the interrupted run's session; if they cannot
+        # be copied from there, draw the infographic from the template (in any mode)
+        if callback_context.state.get(INFOGRAPHIC_VARIANTS_KEY):
+            # The full-size image is the first variant
+            resaved = await _resave_artifact(callback_context, INFOGRAPHIC_VARIANTS_KEY)
+            if resaved:
+                callback_context.state[INFOGRAPHIC_REF_KEY] = callback_context.state[INFOGRAPHIC_VARIANTS_KEY][0]
+        else:
+            resaved = await _resave_artifact(callback_context, INFOGRAPHIC_REF_KEY)
+        if not resaved:
+            callback_context.state[INFOGRAPHIC_VARIANTS_KEY] = None
+            result = await render_infographic(callback_context)
+            if not result.get("artifact_saved"):
+                # Don't point clients at an artifact this session does not have
+                logger.warning(f"  Infographic could not be re-created: {result.get('error_message')}")
+                callback_context.state[INFOGRAPHIC_REF_KEY] = None
+        return restored
+    if INFOGRAPHIC_MODE == "template":
+        return await _render_infographic_from_template(callback_context)
     return None
 
 
+async def _render_infographic_from_template(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Draw the SVG infographic locally and skip InfographicGeneratorAgent.
+
+    Returns None (the agent calls the image model) if rendering fails.
+    Returning content skips the agent and after_infographic_generator, so
+    the stage is closed here.
+    """
+    result = await render_infographic(callback_context)
+    if result["status"] != "success" or not result.get("artifact_saved"):
+        logger.warning(
+            f"  SVG infographic not saved, falling back to the image model: {result.get('error_message')}"
+        )
+        return None
+
+    message = f"{result['message']} (SVG rendered in {result['render_ms']} ms)."
+    callback_context.state["infographic_result"] = message
+    logger.info("STAGE 5: COMPLETE - Infographic rendered from template")
+
+    _end_stage(callback_context, "infographic_generation")
+    save_checkpoint(callback_context, "infographic_generation")
+    stages = _mark_stage_completed(callback_context, "infographic_generation")
+    if not PARALLEL_OUTPUTS:
+        _log_pipeline_summary(stages)
+    return types.Content(role="model", parts=[types.Part(text=message)])
+
+
 # ============================================================================
 # AFTER AGENT CALLBACKS
 # ============================================================================
@@ -139,10 +500,24 @@ def after_market_research(callback_context: CallbackContext) -> Optional[types.C
 
     logger.info(f"STAGE 1: COMPLETE - Market research findings: {findings_len} characters")
 
+    if isinstance(findings, str) and findings:
+        area, _ = _split_findings(findings)
+        if callback_context.state.get("area_profile_note"):
+            # Only the business market was researched; put the known profile back in front
+            if not area:
+                callback_context.state["market_research_findings"] = (
+                    f"{callback_context.state['area_profile']}\n\n{findings}"
+                )
+        elif area:
+            callback_context.state["area_profile"] = area
+            store_stage(callback_context, "area_profile")
+
+    _end_stage(callback_context, "market_research")
+    store_stage(callback_context, "market_research")
+    save_checkpoint(callback_context, "market_research")
+
     # Update stages completed
-    stages = callback_context.state.get("stages_completed", [])
-    stages.append("market_research")
-    callback_context.state["stages_completed"] = stages
+    _mark_stage_completed(callback_context, "market_research")
 
     return None
 
@@ -154,22 +529,49 @@ def after_competitor_mapping(callback_context: CallbackContext) -> Optional[type
 
     logger.info(f"STAGE 2A: COMPLETE - Competitor analysis: {analysis_len} characters")
 
-    stages = callback_context.state.get("stages_completed", [])
-    stages.append("competitor_mapping")
-    callback_context.state["stages_completed"] = stages
+    _end_stage(callback_context, "competitor_mapping")
+    store_stage(callback_context, "competitor_mapping")
+    save_checkpoint(callback_context, "competitor_mapping")
+    _mark_stage_completed(callback_context, "competitor_mapping")
+
+    return None
+
+
+def after_research_phase(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Join point of the parallel research phase; runs once both branches finish."""
+    stages = callback_context.state.get("stages_completed") or []
+    missing = [
+        stage for stage in ("market_research", "competitor_mapping") if stage not in stages
+    ]
+
+    elapsed = ""
+    started = callback_context.state.get("research_phase_start_time")
+    if started:
+        seconds = (datetime.now() - datetime.fromisoformat(started)).total_seconds()
+        elapsed = f" in {seconds:.1f}s"
+
+    logger.info(f"RESEARCH PHASE: COMPLETE{elapsed}")
+    if missing:
+        logger.warning(f"  Research branches without completion callback: {missing}")
 
     return None
 
 
 def after_gap_analysis(callback_context: CallbackContext) -> Optional[types.Content]:
-    """Log completion of gap analysis and extract executed Python code."""
+    """Log completion of gap analysis and record the scoring code for display."""
     gap = callback_context.state.get("gap_analysis", "")
     gap_len = len(gap) if isinstance(gap, str) else 0
 
     logger.info(f"STAGE 2B: COMPLETE - Gap analysis: {gap_len} characters")
 
-    # Extract Python code from the gap_analysis content first
-    extracted_code = _extract_python_code_from_content(gap)
+    gap_scores = callback_context.state.get("gap_scores")
+    if isinstance(gap_scores, dict) and gap_scores.get("status") == "success":
+        logger.info(f"  Top zones: {', '.join(gap_scores.get('top_zones', []))}")
+
+    # Prefer the reproducible scoring call, then any code in the content
+    extracted_code = _gap_scoring_code(gap_scores)
+    if not extracted_code:
+        extracted_code = _extract_python_code_from_content(gap)
 
     # Try to extract from invocation context (BuiltInCodeExecutor uses executable_code parts)
     if not extracted_code:
@@ -181,13 +583,30 @@ def after_gap_analysis(callback_context: CallbackContext) -> Optional[types.Cont
     else:
         logger.info("  No Python code blocks found to extract")
 
-    stages = callback_context.state.get("stages_completed", [])
-    stages.append("gap_analysis")
-    callback_context.state["stages_completed"] = stages
+    _end_stage(callback_context, "gap_analysis")
+    store_stage(callback_context, "gap_analysis")
+    save_checkpoint(callback_context, "gap_analysis")
+    _mark_stage_completed(callback_context, "gap_analysis")
 
     return None
 
 
+def _gap_scoring_code(gap_scores) -> str:
+    """Python snippet that reproduces the deterministic gap scores."""
+    if not isinstance(gap_scores, dict) or not gap_scores.get("zone_inputs"):
+        return ""
+
+    zones = json.dumps(gap_scores["zone_inputs"], indent=4)
+    return (
+        "# Deterministic gap scoring (app/tools/gap_scoring.py)\n"
+        "from app.schemas import CompetitorSet, ZoneInput\n"
+        "from app.tools.gap_scoring import score_zones\n\n"
+        f"zones = [ZoneInput(**zone) for zone in {zones}]\n\n"
+        "competitors = CompetitorSet.from_state(state)\n"
+        "scores, unassigned = score_zones(competitors, zones)\n"
+    )
+
+
 def _extract_code_from_invocation(callback_context: CallbackContext) -> str:
     """Extract Python code from invocation context session events."""
     code_blocks = []
@@ -295,33 +714,37 @@ async def after_strategy_advisor(callback_context: CallbackContext) -> Optional[
     report = callback_context.state.get("strategic_report", {})
     logger.info("STAGE 3: COMPLETE - Strategic report generated")
 
-    # Save JSON artifact
-    if report:
-        try:
-            # Handle both dict and Pydantic model
-            if hasattr(report, "model_dump"):
-                report_dict = report.model_dump()
-            else:
-                report_dict = report
-
-            json_str = json.dumps(report_dict, indent=2, default=str)
-            json_artifact = types.Part.from_bytes(
-                data=json_str.encode('utf-8'),
-                mime_type="application/json"
-            )
-            # SOTA FIX: Await the async artifact saving
-            await callback_context.save_artifact("intelligence_report.json", json_artifact)
-            logger.info("  Saved artifact: intelligence_report.json")
-        except Exception as e:
-            logger.warning(f"  Failed to save JSON artifact: {e}")
-
-    stages = callback_context.state.get("stages_completed", [])
-    stages.append("strategy_synthesis")
-    callback_context.state["stages_completed"] = stages
+    await _save_report_artifact(callback_context, report)
+
+    _end_stage(callback_context, "strategy_synthesis")
+    store_stage(callback_context, "strategy_synthesis")
+    save_checkpoint(callback_context, "strategy_synthesis")
+    _mark_stage_completed(callback_context, "strategy_synthesis")
     
     return None
 
 
+async def _save_report_artifact(callback_context: CallbackContext, report) -> None:
+    """Save the strategic report as the intelligence_report.json artifact."""
+    if not report:
+        return
+    try:
+        # Handle both dict and Pydantic model
+        if hasattr(report, "model_dump"):
+            report_dict = report.model_dump()
+        else:
+            report_dict = report
+
+        json_str = json.dumps(report_dict, indent=2, default=str)
+        # Skips the upload when the same report was already saved in this session
+        await save_artifact_ref(
+            callback_context, "intelligence_report.json", json_str.encode("utf-8"), "application/json"
+        )
+        logger.info("  Saved artifact: intelligence_report.json")
+    except Exception as e:
+        logger.warning(f"  Failed to save JSON artifact: {e}")
+
+
 def after_report_generator(callback_context: CallbackContext) -> Optional[types.Content]:
     """Log completion of report generation.
 
@@ -333,9 +756,9 @@ def after_report_generator(callback_context: CallbackContext) -> Optional[types.
     logger.info("STAGE 4: COMPLETE - HTML report generation finished")
     logger.info("  (Artifact saved directly by generate_html_report tool)")
 
-    stages = callback_context.state.get("stages_completed", [])
-    stages.append("report_generation")
-    callback_context.state["stages_completed"] = stages
+    _end_stage(callback_context, "report_generation")
+    save_checkpoint(callback_context, "report_generation")
+    _mark_stage_completed(callback_context, "report_generation")
 
     return None
 
@@ -351,15 +774,39 @@ def after_infographic_generator(callback_context: CallbackContext) -> Optional[t
     logger.info("STAGE 5: COMPLETE - Infographic generation finished")
     logger.info("  (Artifact saved directly by generate_infographic tool)")
 
-    stages = callback_context.state.get("stages_completed", [])
-    stages.append("infographic_generation")
-    callback_context.state["stages_completed"] = stages
+    _end_stage(callback_context, "infographic_generation")
+    save_checkpoint(callback_context, "infographic_generation")
+    stages = _mark_stage_completed(callback_context, "infographic_generation")
 
-    # Log final pipeline summary
+    # In parallel mode the summary is logged by the output phase join instead
+    if not PARALLEL_OUTPUTS:
+        _log_pipeline_summary(stages)
+
+    return None
+
+
+def after_output_phase(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Join point of the parallel output phase; logs the final pipeline summary."""
+    elapsed = ""
+    started = callback_context.state.get("output_phase_start_time")
+    if started:
+        seconds = (datetime.now() - datetime.fromisoformat(started)).total_seconds()
+        elapsed = f" in {seconds:.1f}s"
+    logger.info(f"OUTPUT PHASE: COMPLETE{elapsed}")
+
+    for stage in ("report_generation", "infographic_generation"):
+        error = callback_context.state.get(f"{stage}_error")
+        if error:
+            logger.warning(f"  {stage} failed: {error}")
+
+    _log_pipeline_summary(callback_context.state.get("stages_completed") or [])
+
+    return None
+
+
+def _log_pipeline_summary(stages: list[str]) -> None:
     logger.info("=" * 60)
     logger.info("PIPELINE COMPLETE")
     logger.info(f"  Stages completed: {stages}")
-    logger.info(f"  Total stages: {len(stages)}/7")
-    logger.info("=" * 60)
-
-    return None
\ No newline at end of file
+    logger.info(f"  Total stages: {len(stages)}/{len(PIPELINE_STAGES)}")
+    logger.info("=" * 60)
\ No newline at end of file
@@ -0,0 +1,184 @@
+"""Memoization of pipeline stage outputs keyed by a request fingerprint.
+
+Re-running an analysis for the same location and business type on the same
+day would otherwise repeat every LLM stage. Each cacheable stage declares the
+request fields and state keys it reads (upstream outputs) and the keys it
+writes; the fingerprint covers those, the stage's model and the date, so any
+upstream change or a new day invalidates downstream entries naturally. Results
+that depend only on the location (the area profile part of market research)
+are keyed without the business type, so a follow-up for another business in
+the same city reuses them.
+
+The backend is chosen with STAGE_CACHE_BACKEND: "memory" keeps an in-process
+LRU, "sqlite" adds a file under CACHE_DIR shared across restarts, and "off"
+disables memoization.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+
+from ..config import (
+    CACHE_DIR,
+    STAGE_CACHE_BACKEND,
+    STAGE_CACHE_MAX_ENTRIES,
+    STAGE_CACHE_TTL_SECONDS,
+)
+from ..utils.cache import TTLCache
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+
+@dataclass(frozen=True)
+class StageSpec:
+    """State keys a stage reads from upstream and writes for downstream."""
+
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    request_keys: tuple[str, ...] = ("target_location", "business_type")
+
+
+# The deliverable stages (HTML report, infographic) are not memoized: their
+# results are artifacts, which are too large for this cache.
+STAGE_SPECS: dict[str, StageSpec] = {
+    # Location-level section of the market research findings
+    "area_profile": StageSpec(
+        inputs=(),
+        outputs=("area_profile",),
+        request_keys=("target_location",),
+    ),
+    "market_research": StageSpec(
+        inputs=(),
+        outputs=("market_research_findings",),
+    ),
+    "competitor_mapping": StageSpec(
+        inputs=(),
+        outputs=("competitor_analysis", "competitor_places"),
+    ),
+    "gap_analysis": StageSpec(
+        inputs=("market_research_findings", "competitor_analysis", "competitor_places"),
+        outputs=("gap_analysis", "gap_scores", "gap_analysis_code"),
+    ),
+    "strategy_synthesis": StageSpec(
+        inputs=("market_research_findings", "competitor_analysis", "gap_analysis"),
+        outputs=("strategic_report",),
+    ),
+}
+
+# Values written by before_* callbacks as AG-UI workarounds; never cache them
+_PLACEHOLDERS = {
+    "Competitor data being collected via Google Maps API...",
+    "Gap analysis being computed...",
+}
+
+
+def _build_cache() -> Optional[TTLCache]:
+    if STAGE_CACHE_BACKEND == "off":
+        return None
+    if STAGE_CACHE_BACKEND not in ("memory", "sqlite"):
+        logger.warning(f"Unknown STAGE_CACHE_BACKEND '{STAGE_CACHE_BACKEND}', using memory")
+    return TTLCache(
+        namespace="stage_outputs",
+        max_entries=STAGE_CACHE_MAX_ENTRIES,
+        ttl_seconds=STAGE_CACHE_TTL_SECONDS,
+        db_path=Path(CACHE_DIR) / "stage_cache.sqlite" if STAGE_CACHE_BACKEND == "sqlite" else None,
+    )
+
+
+stage_cache = _build_cache()
+
+# stage -> {"hits", "misses", "stores"}
+_stage_counters: dict[str, dict[str, int]] = {
+    stage: {"hits": 0, "misses": 0, "stores": 0} for stage in STAGE_SPECS
+}
+_counters_lock = threading.Lock()
+
+
+def _count(stage: str, counter: str) -> None:
+    with _counters_lock:
+        _stage_counters[stage][counter] += 1
+
+
+def _normalize(text: Any) -> str:
+    return " ".join(str(text or "").lower().split())
+
+
+def agent_model_name(callback_context: CallbackContext) -> str:
+    """Model name of the agent the callback runs for ("" for non-LLM agents)."""
+    agent = callback_context._invocation_context.agent
+    model = getattr(agent, "model", "")
+    return str(getattr(model, "model", model))
+
+
+def stage_fingerprint(callback_context: CallbackContext, stage: str) -> str:
+    """Hash of everything that determines a stage's output."""
+    state = callback_context.state
+    spec = STAGE_SPECS[stage]
+    payload = {
+        "stage": stage,
+        "model": agent_model_name(callback_context),
+        "date": datetime.now().strftime("%Y-%m-%d"),
+        **{key: _normalize(state.get(key)) for key in spec.request_keys},
+        "inputs": {key: state.get(key) for key in spec.inputs},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def lookup_stage(callback_context: CallbackContext, stage: str) -> Optional[dict[str, Any]]:
+    """Cached outputs of ``stage`` for the current inputs, or None."""
+    if stage_cache is None or stage not in STAGE_SPECS:
+        return None
+    outputs = stage_cache.get(stage_fingerprint(callback_context, stage))
+    _count(stage, "hits" if outputs is not None else "misses")
+    # Callers write these into session state; keep the cached copy pristine
+    return copy.deepcopy(outputs)
+
+
+def store_stage(callback_context: CallbackContext, stage: str) -> None:
+    """Remember the outputs ``stage`` just wrote to state."""
+    if stage_cache is None or stage not in STAGE_SPECS:
+        return
+    spec = STAGE_SPECS[stage]
+    state = callback_context.state
+    primary = state.get(spec.outputs[0])
+    if not primary or (isinstance(primary, str) and primary in _PLACEHOLDERS):
+        return
+
+    outputs = {}
+    for key in spec.outputs:
+        value = state.get(key)
+        if value is not None:
+            outputs[key] = value.model_dump() if hasattr(value, "model_dump") else value
+    try:
+        # Snapshot through JSON so later in-place edits of state never leak in
+        snapshot = json.loads(json.dumps(outputs, default=str))
+        stage_cache.set(stage_fingerprint(callback_context, stage), snapshot)
+        _count(stage, "stores")
+    except (TypeError, ValueError) as e:
+        logger.warning(f"  Could not cache {stage} outputs: {e}")
+
+
+def stage_cache_stats() -> dict[str, Any]:
+    """Per-stage hit rates plus the backend's own counters."""
+    with _counters_lock:
+        stages = {}
+        for stage, counters in _stage_counters.items():
+            lookups = counters["hits"] + counters["misses"]
+            stages[stage] = {
+                **counters,
+                "hit_rate": round(counters["hits"] / lookups, 3) if lookups else 0.0,
+            }
+    return {
+        "backend": STAGE_CACHE_BACKEND,
+        "stages": stages,
+        "cache": stage_cache.stats() if stage_cache is not None else None,
+    }
@@ -53,6 +53,15 @@ class AgentConfig:
     RETRY_ATTEMPTS: int = 5
     RETRY_MAX_DELAY: int = 60
 
+    # Pipeline execution: run market research and competitor mapping concurrently
+    PARALLEL_RESEARCH: bool = os.environ.get(
+        "PARALLEL_RESEARCH", "TRUE"
+    ).upper() == "TRUE"
+    # Same for the HTML report and infographic, which both read strategic_report
+    PARALLEL_OUTPUTS: bool = os.environ.get(
+        "PARALLEL_OUTPUTS", "TRUE"
+    ).upper() == "TRUE"
+
     # Cloud
     GOOGLE_CLOUD_PROJECT: str | None = None
     GOOGLE_CLOUD_LOCATION: str = "us-central1"
@@ -62,6 +71,88 @@ class AgentConfig:
     GOOGLE_API_KEY: str = ""
     MAPS_API_KEY: str = os.environ.get("MAPS_API_KEY", "")
 
+    # Local caches (SQLite files live under CACHE_DIR)
+    CACHE_DIR: str = os.environ.get(
+        "LOCUS_CACHE_DIR", str(Path.home() / ".cache" / "locus")
+    )
+    GEOCODE_CACHE_TTL_SECONDS: int = int(
+        os.environ.get("GEOCODE_CACHE_TTL_SECONDS", 30 * 24 * 3600)
+    )
+    GEOCODE_CACHE_MAX_ENTRIES: int = 1024
+    # Nearby Search responses; 3 decimals of lat/lng is roughly a 100m grid
+    PLACES_CACHE_TTL_SECONDS: int = int(
+        os.environ.get("PLACES_CACHE_TTL_SECONDS", 7 * 24 * 3600)
+    )
+    PLACES_CACHE_MAX_ENTRIES: int = 512
+    PLACES_CACHE_COORD_PRECISION: int = int(
+        os.environ.get("PLACES_CACHE_COORD_PRECISION", 3)
+    )
+    PLACES_CACHE_PERSIST: bool = os.environ.get(
+        "PLACES_CACHE_PERSIST", "TRUE"
+    ).upper() == "TRUE"
+
+    # Maps sweep search (tiled Nearby Search for large radii)
+    SWEEP_TILE_RADIUS_METERS: int = 1500
+    SWEEP_MAX_TILES: int = 19
+    SWEEP_MAX_WORKERS: int = 4
+
+    # Stage result memoization: "memory" (in-process LRU), "sqlite" (under
+    # CACHE_DIR, shared across restarts) or "off"
+    STAGE_CACHE_BACKEND: str = os.environ.get("STAGE_CACHE_BACKEND", "memory").lower()
+    STAGE_CACHE_TTL_SECONDS: int = int(
+        os.environ.get("STAGE_CACHE_TTL_SECONDS", 24 * 3600)
+    )
+    STAGE_CACHE_MAX_ENTRIES: int = 256
+
+    # Durable per-stage checkpoints used to resume interrupted runs
+    CHECKPOINT_ENABLED: bool = os.environ.get(
+        "CHECKPOINT_ENABLED", "TRUE"
+    ).upper() == "TRUE"
+    CHECKPOINT_TTL_SECONDS: int = int(
+        os.environ.get("CHECKPOINT_TTL_SECONDS", 7 * 24 * 3600)
+    )
+
+    # Maps request budget, shared by every session in the process
+    MAPS_RATE_LIMIT_QPS: float = float(os.environ.get("MAPS_RATE_LIMIT_QPS", 10))
+    MAPS_RATE_LIMIT_BURST: int = int(os.environ.get("MAPS_RATE_LIMIT_BURST", 20))
+    MAPS_SESSION_REQUEST_CAP: int = int(
+        os.environ.get("MAPS_SESSION_REQUEST_CAP", 200)
+    )
+    MAPS_QUEUE_TIMEOUT_SECONDS: float = float(
+        os.environ.get("MAPS_QUEUE_TIMEOUT_SECONDS", 120)
+    )
+
+    # Token budgets for the upstream outputs templated into each consumer's
+    # prompt (see app/callbacks/context_compaction.py)
+    CONTEXT_COMPACTION: bool = os.environ.get(
+        "CONTEXT_COMPACTION", "TRUE"
+    ).upper() == "TRUE"
+    GAP_ANALYSIS_CONTEXT_TOKENS: int = int(
+        os.environ.get("GAP_ANALYSIS_CONTEXT_TOKENS", 6000)
+    )
+    STRATEGY_CONTEXT_TOKENS: int = int(
+        os.environ.get("STRATEGY_CONTEXT_TOKENS", 10000)
+    )
+
+    # Batch mode (app/batch.py): pipeline runs in flight at once
+    BATCH_CONCURRENCY: int = int(os.environ.get("BATCH_CONCURRENCY", 4))
+
+    # HTML report: "template" renders the slides locally from the strategic
+    # report; "creative" has Gemini write the deck (slower, varies per run)
+    HTML_REPORT_MODE: str = os.environ.get("HTML_REPORT_MODE", "template").lower()
+
+    # Infographic: "template" draws an SVG locally from the strategic report;
+    # "image_model" asks IMAGE_MODEL for a raster image
+    INFOGRAPHIC_MODE: str = os.environ.get("INFOGRAPHIC_MODE", "template").lower()
+    # Raster infographic post-processing (needs Pillow): WebP quality and
+    # the widths of the WebP thumbnails saved next to the full-size image
+    INFOGRAPHIC_WEBP_QUALITY: int = int(os.environ.get("INFOGRAPHIC_WEBP_QUALITY", 80))
+    INFOGRAPHIC_THUMBNAIL_WIDTHS: tuple[int, ...] = tuple(
+        int(width)
+        for width in os.environ.get("INFOGRAPHIC_THUMBNAIL_WIDTHS", "320,640").split(",")
+        if width.strip()
+    )
+
     def __post_init__(self) -> None:
         if USE_VERTEX_AI:
             # Vertex AI mode
@@ -128,7 +219,45 @@ RETRY_INITIAL_DELAY = config.RETRY_INITIAL_DELAY
 RETRY_ATTEMPTS = config.RETRY_ATTEMPTS
 RETRY_MAX_DELAY = config.RETRY_MAX_DELAY
 
+PARALLEL_RESEARCH = config.PARALLEL_RESEARCH
+PARALLEL_OUTPUTS = config.PARALLEL_OUTPUTS
+
 GOOGLE_API_KEY = config.GOOGLE_API_KEY
 GOOGLE_CLOUD_PROJECT = config.GOOGLE_CLOUD_PROJECT
 GOOGLE_CLOUD_LOCATION = config.GOOGLE_CLOUD_LOCATION
 MAPS_API_KEY = config.MAPS_API_KEY
+
+CACHE_DIR = config.CACHE_DIR
+GEOCODE_CACHE_TTL_SECONDS = config.GEOCODE_CACHE_TTL_SECONDS
+GEOCODE_CACHE_MAX_ENTRIES = config.GEOCODE_CACHE_MAX_ENTRIES
+PLACES_CACHE_TTL_SECONDS = config.PLACES_CACHE_TTL_SECONDS
+PLACES_CACHE_MAX_ENTRIES = config.PLACES_CACHE_MAX_ENTRIES
+PLACES_CACHE_COORD_PRECISION = config.PLACES_CACHE_COORD_PRECISION
+PLACES_CACHE_PERSIST = config.PLACES_CACHE_PERSIST
+
+SWEEP_TILE_RADIUS_METERS = config.SWEEP_TILE_RADIUS_METERS
+SWEEP_MAX_TILES = config.SWEEP_MAX_TILES
+SWEEP_MAX_WORKERS = config.SWEEP_MAX_WORKERS
+
+STAGE_CACHE_BACKEND = config.STAGE_CACHE_BACKEND
+STAGE_CACHE_TTL_SECONDS = config.STAGE_CACHE_TTL_SECONDS
+STAGE_CACHE_MAX_ENTRIES = config.STAGE_CACHE_MAX_ENTRIES
+
+CHECKPOINT_ENABLED = config.CHECKPOINT_ENABLED
+CHECKPOINT_TTL_SECONDS = config.CHECKPOINT_TTL_SECONDS
+
+MAPS_RATE_LIMIT_QPS = config.MAPS_RATE_LIMIT_QPS
+MAPS_RATE_LIMIT_BURST = config.MAPS_RATE_LIMIT_BURST
+MAPS_SESSION_REQUEST_CAP = config.MAPS_SESSION_REQUEST_CAP
+MAPS_QUEUE_TIMEOUT_SECONDS = config.MAPS_QUEUE_TIMEOUT_SECONDS
+
+CONTEXT_COMPACTION = config.CONTEXT_COMPACTION
+GAP_ANALYSIS_CONTEXT_TOKENS = config.GAP_ANALYSIS_CONTEXT_TOKENS
+STRATEGY_CONTEXT_TOKENS = config.STRATEGY_CONTEXT_TOKENS
+
+BATCH_CONCURRENCY = config.BATCH_CONCURRENCY
+
+HTML_REPORT_MODE = config.HTML_REPORT_MODE
+INFOGRAPHIC_MODE = config.INFOGRAPHIC_MODE
+INFOGRAPHIC_WEBP_QUALITY = config.INFOGRAPHIC_WEBP_QUALITY
+INFOGRAPHIC_THUMBNAIL_WIDTHS = config.INFOGRAPHIC_THUMBNAIL_WIDTHS
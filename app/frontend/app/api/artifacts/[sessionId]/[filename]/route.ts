@@ -0,0 +1,31 @@
+/**
+ * Artifact API Route - Proxies artifact downloads to the backend
+ *
+ * Agent state only carries artifact references; the report and infographic
+ * bytes are fetched from the backend's /artifacts endpoint on demand.
+ */
+
+import { NextRequest } from "next/server";
+
+export const runtime = "nodejs";
+
+const backendUrl = process.env.REMOTE_ACTION_URL || "http://localhost:8000";
+
+export const GET = async (
+  req: NextRequest,
+  { params }: { params: { sessionId: string; filename: string } }
+) => {
+  const { sessionId, filename } = params;
+  const version = req.nextUrl.searchParams.get("version");
+  const url =
+    `${backendUrl.replace(/\/$/, "")}/artifacts/${encodeURIComponent(sessionId)}/${encodeURIComponent(filename)}` +
+    (version ? `?version=${encodeURIComponent(version)}` : "");
+
+  const upstream = await fetch(url, { cache: "no-store" });
+  const headers = new Headers();
+  for (const name of ["content-type", "cache-control", "etag"]) {
+    const value = upstream.headers.get(name);
+    if (value) headers.set(name, value);
+  }
+  return new Response(upstream.body, { status: upstream.status, headers });
+};
@@ -134,11 +134,12 @@ Provide your **business idea** and **geographic region clearly** and I will anal
                 />
               )}
 
-              {(state.html_report_content ||
-                state.infographic_base64) && (
+              {(state.html_report_artifact ||
+                state.infographic_artifact) && (
                 <ArtifactViewer
-                  htmlReport={state.html_report_content}
-                  infographic={state.infographic_base64}
+                  htmlReport={state.html_report_artifact}
+                  infographic={state.infographic_artifact}
+                  infographicVariants={state.infographic_variants}
                 />
               )}
             </div>
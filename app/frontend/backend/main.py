@@ -88,14 +88,18 @@
 
 
 
+import hashlib
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from ag_ui_adk import ADKAgent, add_adk_fastapi_endpoint
+from google.adk.artifacts import InMemoryArtifactService
+from ag_ui_adk import add_adk_fastapi_endpoint
 
 # 1. Setup Paths
 app_dir = Path(__file__).parent.parent.parent
@@ -110,24 +114,44 @@ if env_path.exists():
 # 3. Import Agent
 try:
     from app.agent import root_agent
+    from app.frontend.backend.streaming import IncrementalADKAgent, stream_stats
+    from app.callbacks.stage_cache import stage_cache_stats
+    from app.tools.genai_client import close_genai_client
+    from app.tools.maps_client import close_maps_clients
+    from app.tools.places_search import geocode_cache, places_cache
+    from app.tools.request_budget import maps_budget
+    from app.utils.artifacts import artifact_stats, load_artifact_ref
 except ImportError as e:
     print(f"Error importing agent: {e}")
     sys.exit(1)
 
-# 4. Initialize Wrapper
-adk_agent = ADKAgent(
+# 4. Initialize Wrapper (minimal JSON-patch state deltas + stage progress events)
+# Shared with the /artifacts endpoint; session state only holds references
+artifact_service = InMemoryArtifactService()
+
+adk_agent = IncrementalADKAgent(
     adk_agent=root_agent,
     app_name="locus",  # Matches the key in route.ts
     user_id="demo_user",
+    artifact_service=artifact_service,
     execution_timeout_seconds=1800,
     tool_timeout_seconds=600,
 )
 
 # 5. Create App
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the pooled Maps and Gemini HTTP connections shared by all sessions
+    await close_maps_clients()
+    await close_genai_client()
+
+
 app = FastAPI(
     title="Locus API",
     description="AG-UI compatible API for Locus AI Location Strategy agent",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # 6. Unified CORS Configuration
@@ -148,7 +172,43 @@ app.add_middleware(
 async def health_check():
     return {"status": "healthy", "agent": "LocationStrategyPipeline"}
 
+@app.get("/stats")
+async def stats():
+    """Maps request budget, cache, stage memoization, streaming and artifact counters for operators."""
+    return {
+        "maps_budget": maps_budget.stats(),
+        "streaming": stream_stats.stats(),
+        "artifacts": artifact_stats.stats(),
+        "stage_cache": stage_cache_stats(),
+        "caches": {
+            "geocode": geocode_cache.stats(),
+            "places_nearby": places_cache.stats(),
+        },
+    }
+
 # 7. Add Endpoint
+@app.get("/artifacts/{session_id}/{filename}")
+async def get_artifact(session_id: str, filename: str, version: Optional[int] = None):
+    """Bytes of an artifact referenced from session state (html_report_artifact, infographic_artifact)."""
+    ref = {
+        "app_name": "locus",
+        "user_id": "demo_user",
+        "session_id": session_id,
+        "filename": filename,
+        "version": version,
+    }
+    loaded = await load_artifact_ref(artifact_service, ref)
+    if loaded is None:
+        raise HTTPException(status_code=404, detail="Artifact not found")
+    data, mime_type = loaded
+    # A versioned artifact never changes; the latest version may
+    cache_control = "private, max-age=31536000, immutable" if version is not None else "no-cache"
+    return Response(
+        content=data,
+        media_type=mime_type,
+        headers={"Cache-Control": cache_control, "ETag": f'"{hashlib.sha256(data).hexdigest()}"'},
+    )
+
 add_adk_fastapi_endpoint(app, adk_agent, path="/")
 
 if __name__ == "__main__":
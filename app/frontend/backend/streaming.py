@@ -0,0 +1,251 @@
+"""Incremental AG-UI state streaming for the Locus backend.
+
+ag_ui_adk turns every ADK state_delta into JSON Patch "add" operations that
+carry the whole value of each touched key, and ends each run with a full
+STATE_SNAPSHOT of the session. Over a 30-minute analysis that re-sends the
+stage ledger, the completed-stages list and, at the end of every run, every
+stage output including the HTML report and the infographic.
+
+IncrementalADKAgent keeps a mirror of the state the client holds (seeded
+from the state the client sends with each run) and rewrites the outgoing
+stream so that:
+
+* state updates are minimal RFC 6902 patches against that mirror: nested
+  dicts are diffed per key, lists that grow are appended to, and values the
+  client already has are never sent again;
+* the end-of-run STATE_SNAPSHOT becomes a delta as well;
+* server-only keys (the ``*_compact`` prompt inputs and the
+  ``artifact_ref:*`` save bookkeeping) are not sent at all;
+* keys removed on the server are removed on the client too;
+* every stage start and completion is announced with a ``stage_progress``
+  CUSTOM event (with the stage's ledger entry once it finishes), and the
+  stage that was running is attached to each streamed text message's
+  metadata. Partial model text itself is already streamed by ag_ui_adk as
+  TEXT_MESSAGE_CONTENT events (SSE streaming mode).
+"""
+
+import copy
+import logging
+import threading
+from typing import Any, AsyncGenerator
+
+from ag_ui.core import (
+    BaseEvent,
+    CustomEvent,
+    EventType,
+    RunAgentInput,
+    StateDeltaEvent,
+)
+from ag_ui_adk import ADKAgent
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+# Derived copies of stage outputs that only the prompts read
+SERVER_ONLY_SUFFIXES = ("_compact",)
+# Artifact save bookkeeping (app/utils/artifacts.py); the client uses the
+# deliverables' own references
+SERVER_ONLY_PREFIXES = ("artifact_ref:",)
+
+PROGRESS_EVENT = "stage_progress"
+
+_MISSING = object()
+
+
+def _escape(token: str) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _server_only(key: str) -> bool:
+    return key.endswith(SERVER_ONLY_SUFFIXES) or key.startswith(SERVER_ONLY_PREFIXES)
+
+
+def diff_value(old: Any, new: Any, path: str) -> list[dict[str, Any]]:
+    """Minimal JSON Patch turning ``old`` (at ``path``) into ``new``."""
+    if old is _MISSING:
+        return [{"op": "add", "path": path, "value": new}]
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = [{"op": "remove", "path": f"{path}/{_escape(key)}"} for key in old if key not in new]
+        for key, value in new.items():
+            ops += diff_value(old.get(key, _MISSING), value, f"{path}/{_escape(key)}")
+        return ops
+    if isinstance(old, list) and isinstance(new, list) and len(new) > len(old) and new[: len(old)] == old:
+        return [{"op": "add", "path": f"{path}/-", "value": item} for item in new[len(old):]]
+    return [{"op": "add", "path": path, "value": new}]
+
+
+def diff_state(
+    old: dict[str, Any], new: dict[str, Any], remove_missing: bool = False
+) -> list[dict[str, Any]]:
+    """Patch for the client-visible top-level keys of ``new``.
+
+    With ``remove_missing`` (``new`` is a full snapshot), keys the client
+    holds that are no longer in ``new`` are removed.
+    """
+    ops = []
+    if remove_missing:
+        ops += [{"op": "remove", "path": f"/{_escape(key)}"} for key in old if key not in new]
+    for key, value in new.items():
+        if not _server_only(key):
+            ops += diff_value(old.get(key, _MISSING), value, f"/{_escape(key)}")
+    return ops
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _upstream_changes(patches: list[Any]) -> tuple[dict[str, Any], list[str]]:
+    """Whole-key values set, and paths removed, by the patches ag_ui_adk emits."""
+    updates, removed = {}, []
+    for patch in patches:
+        # Operation models in newer ag-ui-protocol releases, plain dicts before
+        patch = patch.model_dump() if hasattr(patch, "model_dump") else patch
+        path = patch.get("path", "")
+        if patch.get("op") == "remove":
+            removed.append(path)
+        elif patch.get("op") in ("add", "replace") and path.count("/") == 1:
+            updates[_unescape(path[1:])] = patch.get("value")
+    return updates, removed
+
+
+def _removals(state: dict[str, Any], paths: list[str]) -> list[dict[str, Any]]:
+    """Remove operations for the client-visible paths the mirror holds."""
+    ops = []
+    for path in paths:
+        tokens = [_unescape(token) for token in path.split("/")[1:]]
+        if not tokens or _server_only(tokens[0]):
+            continue
+        target: Any = state
+        for token in tokens[:-1]:
+            target = target.get(token) if isinstance(target, dict) else None
+        if isinstance(target, dict) and tokens[-1] in target:
+            ops.append({"op": "remove", "path": path})
+    return ops
+
+
+def _apply(state: dict[str, Any], ops: list[dict[str, Any]]) -> None:
+    """Apply the patches produced by diff_state to the mirror."""
+    for op in ops:
+        *parents, last = [_unescape(token) for token in op["path"].split("/")[1:]]
+        target = state
+        for token in parents:
+            target = target[token]
+        if op["op"] == "remove":
+            target.pop(last, None)
+        elif isinstance(target, list):
+            target.append(copy.deepcopy(op["value"]))
+        else:
+            target[last] = copy.deepcopy(op["value"])
+
+
+def _progress_events(before: dict[str, Any], after: dict[str, Any]) -> list[CustomEvent]:
+    """stage_progress events for stages that started or completed."""
+    events = []
+    done_before = set(before.get("stages_completed") or [])
+    ledger = after.get("stage_ledger") or {}
+    for finished in after.get("stages_completed") or []:
+        if finished not in done_before:
+            events.append({"status": "completed", "stage": finished, "ledger": ledger.get(finished)})
+
+    # A delta that finishes one stage usually starts the next; announce in that order
+    stage = after.get("pipeline_stage")
+    if stage and stage != before.get("pipeline_stage"):
+        events.append({"status": "started", "stage": stage})
+
+    return [
+        CustomEvent(
+            type=EventType.CUSTOM,
+            name=PROGRESS_EVENT,
+            value={**event, "stages_completed": after.get("stages_completed") or []},
+        )
+        for event in events
+    ]
+
+
+def _size(event: BaseEvent) -> int:
+    return len(event.model_dump_json(by_alias=True, exclude_none=True))
+
+
+class StreamStats:
+    """Bytes the rewritten event streams sent, and what they would have sent."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.bytes_upstream = 0
+        self.bytes_sent = 0
+        self.progress_events = 0
+
+    def record(self, upstream: int, sent: int, progress: int) -> None:
+        with self._lock:
+            self.runs += 1
+            self.bytes_upstream += upstream
+            self.bytes_sent += sent
+            self.progress_events += progress
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "bytes_upstream": self.bytes_upstream,
+                "bytes_sent": self.bytes_sent,
+                "reduction_pct": (
+                    round(100 * (1 - self.bytes_sent / self.bytes_upstream), 1)
+                    if self.bytes_upstream else 0.0
+                ),
+                "progress_events": self.progress_events,
+            }
+
+
+stream_stats = StreamStats()
+
+
+class IncrementalADKAgent(ADKAgent):
+    """ADKAgent whose state updates are minimal JSON patches plus progress events."""
+
+    async def run(self, input: RunAgentInput) -> AsyncGenerator[BaseEvent, None]:
+        # What the client holds; kept in step with every patch we send
+        mirror = copy.deepcopy(input.state) if isinstance(input.state, dict) else {}
+        upstream = sent = progress = 0
+        try:
+            async for event in super().run(input):
+                upstream += _size(event)
+                outgoing: list[BaseEvent] = []
+
+                if event.type in (EventType.STATE_DELTA, EventType.STATE_SNAPSHOT):
+                    before = copy.deepcopy(
+                        {key: mirror.get(key) for key in ("pipeline_stage", "stages_completed")}
+                    )
+                    if event.type == EventType.STATE_DELTA:
+                        updates, removed = _upstream_changes(event.delta)
+                        ops = _removals(mirror, removed)
+                        _apply(mirror, ops)
+                        changes = diff_state(mirror, updates)
+                    else:
+                        ops = []
+                        changes = diff_state(mirror, event.snapshot or {}, remove_missing=True)
+                    _apply(mirror, changes)
+                    ops += changes
+                    if ops:
+                        outgoing.append(StateDeltaEvent(type=EventType.STATE_DELTA, delta=ops))
+                        progress_events = _progress_events(before, mirror)
+                        progress += len(progress_events)
+                        outgoing += progress_events
+                else:
+                    if event.type == EventType.TEXT_MESSAGE_START and mirror.get("pipeline_stage"):
+                        event = event.model_copy(
+                            update={"metadata": {**(event.metadata or {}), "stage": mirror["pipeline_stage"]}}
+                        )
+                    outgoing.append(event)
+
+                for out in outgoing:
+                    sent += _size(out)
+                    yield out
+        finally:
+            stream_stats.record(upstream, sent, progress)
+            logger.info(
+                f"AG-UI run {input.run_id}: {sent:,} bytes sent "
+                f"(upstream stream {upstream:,} bytes), {progress} progress events"
+            )
@@ -1,17 +1,20 @@
 "use client";
 
 import { useState } from "react";
+import { artifactUrl, variantSrcSet } from "@/lib/artifacts";
+import type { ArtifactRef } from "@/lib/types";
 
 interface ArtifactViewerProps {
-  htmlReport?: string;
-  infographic?: string;
+  htmlReport?: ArtifactRef;
+  infographic?: ArtifactRef;
+  infographicVariants?: ArtifactRef[];
 }
 
 /**
  * ArtifactViewer provides a tabbed interface to view the generated
  * HTML executive report and infographic image.
  */
-export function ArtifactViewer({ htmlReport, infographic }: ArtifactViewerProps) {
+export function ArtifactViewer({ htmlReport, infographic, infographicVariants }: ArtifactViewerProps) {
   const [activeTab, setActiveTab] = useState<"report" | "infographic">("report");
 
   if (!htmlReport && !infographic) return null;
@@ -53,23 +56,16 @@ export function ArtifactViewer({ htmlReport, infographic }: ArtifactViewerProps)
         {activeTab === "report" && htmlReport && (
           <div className="space-y-4">
             <div className="flex justify-end">
-              <button
-                onClick={() => {
-                  const blob = new Blob([htmlReport], { type: "text/html" });
-                  const url = URL.createObjectURL(blob);
-                  const a = document.createElement("a");
-                  a.href = url;
-                  a.download = "executive_report.html";
-                  a.click();
-                  URL.revokeObjectURL(url);
-                }}
+              <a
+                href={artifactUrl(htmlReport)}
+                download={htmlReport.filename}
                 className="px-3 py-1.5 text-sm bg-blue-500 text-white/90 rounded-lg hover:bg-blue-600 transition-colors"
               >
                 Download HTML
-              </button>
+              </a>
             </div>
             <iframe
-              srcDoc={htmlReport}
+              src={artifactUrl(htmlReport)}
               className="w-full h-[600px] border rounded-lg"
               title="Executive Report"
               sandbox="allow-same-origin"
@@ -81,15 +77,17 @@ export function ArtifactViewer({ htmlReport, infographic }: ArtifactViewerProps)
           <div className="space-y-4">
             <div className="flex justify-end">
               <a
-                href={infographic}
-                download="infographic.png"
+                href={artifactUrl(infographic)}
+                download={infographic.filename}
                 className="px-3 py-1.5 text-sm bg-blue-500 text-white/90 rounded-lg hover:bg-blue-600 transition-colors"
               >
                 Download Image
               </a>
             </div>
             <img
-              src={infographic}
+              src={artifactUrl(infographic)}
+              srcSet={variantSrcSet(infographicVariants)}
+              sizes="(min-width: 1024px) 960px, 100vw"
               alt="Location Strategy Infographic"
               className="w-full rounded-lg shadow-sm"
             />
@@ -1,6 +1,7 @@
 "use client";
 
 import type { AgentState } from "@/lib/types";
+import { artifactUrl, pickVariant } from "@/lib/artifacts";
 import {
   summarizeCompetitorAnalysis,
 } from "@/lib/summaryHelpers";
@@ -84,43 +85,34 @@ export function StepOutputContent({ stepId, state }: StepOutputContentProps) {
       );
 
     case "report_generation":
-      if (!state.html_report_content) {
+      if (!state.html_report_artifact) {
         return <p className="text-gray-500 text-sm italic">Generating report...</p>;
       }
       return (
         <div className="flex items-center gap-3">
           <span className="text-sm text-green-700">7-slide McKinsey-style presentation ready</span>
           <div className="flex gap-2">
-            <button
-              onClick={() => {
-                const blob = new Blob([state.html_report_content!], { type: "text/html" });
-                const url = URL.createObjectURL(blob);
-                window.open(url, "_blank");
-              }}
+            <a
+              href={artifactUrl(state.html_report_artifact)}
+              target="_blank"
+              rel="noopener noreferrer"
               className="px-3 py-1 text-xs bg-blue-500 text-white/90 rounded hover:bg-blue-600 transition-colors"
             >
               View Report
-            </button>
-            <button
-              onClick={() => {
-                const blob = new Blob([state.html_report_content!], { type: "text/html" });
-                const url = URL.createObjectURL(blob);
-                const a = document.createElement("a");
-                a.href = url;
-                a.download = "executive_report.html";
-                a.click();
-                URL.revokeObjectURL(url);
-              }}
+            </a>
+            <a
+              href={artifactUrl(state.html_report_artifact)}
+              download={state.html_report_artifact.filename}
               className="px-3 py-1 text-xs bg-gray-200 text-gray-700 rounded hover:bg-gray-300 transition-colors"
             >
               Download HTML
-            </button>
+            </a>
           </div>
         </div>
       );
 
     case "infographic_generation":
-      if (!state.infographic_base64) {
+      if (!state.infographic_artifact) {
         return <p className="text-gray-500 text-sm italic">Creating infographic...</p>;
       }
       return (
@@ -128,29 +120,26 @@ export function StepOutputContent({ stepId, state }: StepOutputContentProps) {
           <div className="flex items-center gap-3">
             <span className="text-sm text-green-700">Executive infographic generated</span>
             <div className="flex gap-2">
-              <button
-                onClick={() => {
-                  const win = window.open("", "_blank");
-                  if (win) {
-                    win.document.write(`<img src="${state.infographic_base64}" style="max-width:100%;"/>`);
-                  }
-                }}
+              <a
+                href={artifactUrl(state.infographic_artifact)}
+                target="_blank"
+                rel="noopener noreferrer"
                 className="px-3 py-1 text-xs bg-blue-500 text-white/90 rounded hover:bg-blue-600 transition-colors"
               >
                 View Image
-              </button>
+              </a>
               <a
-                href={state.infographic_base64}
-                download="infographic.png"
+                href={artifactUrl(state.infographic_artifact)}
+                download={state.infographic_artifact.filename}
                 className="px-3 py-1 text-xs bg-gray-200 text-gray-700 rounded hover:bg-gray-300 transition-colors"
               >
-                Download PNG
+                Download Image
               </a>
             </div>
           </div>
-          {/* Small thumbnail preview */}
+          {/* Small thumbnail preview (w-32, so 256px covers 2x displays) */}
           <img
-            src={state.infographic_base64}
+            src={artifactUrl(pickVariant(state.infographic_variants, state.infographic_artifact, 256))}
             alt="Infographic preview"
             className="w-32 h-auto rounded shadow-sm border"
           />
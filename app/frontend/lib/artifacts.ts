@@ -0,0 +1,47 @@
+/**
+ * Helpers for artifacts referenced from agent state.
+ *
+ * The agent keeps only references (see ArtifactRef) in state; the bytes are
+ * served by the backend and proxied through /api/artifacts.
+ */
+
+import type { ArtifactRef } from "./types";
+
+/**
+ * URL of the referenced artifact version.
+ */
+export function artifactUrl(ref: ArtifactRef): string {
+  return `/api/artifacts/${encodeURIComponent(ref.session_id)}/${encodeURIComponent(
+    ref.filename
+  )}?version=${ref.version}`;
+}
+
+/**
+ * Smallest image variant at least `minWidth` pixels wide.
+ * Falls back to the full-size image when no variant is wide enough.
+ */
+export function pickVariant(
+  variants: ArtifactRef[] | undefined,
+  fallback: ArtifactRef,
+  minWidth: number
+): ArtifactRef {
+  const candidates = (variants ?? []).filter((v) => (v.width ?? fallback.width ?? 0) >= minWidth);
+  if (candidates.length === 0) return fallback;
+  return candidates.reduce((best, v) => (v.size_bytes < best.size_bytes ? v : best));
+}
+
+/**
+ * srcSet listing the smallest variant at each width, for <img srcSet>.
+ */
+export function variantSrcSet(variants: ArtifactRef[] | undefined): string | undefined {
+  const byWidth = new Map<number, ArtifactRef>();
+  for (const v of variants ?? []) {
+    if (!v.width) continue;
+    const current = byWidth.get(v.width);
+    if (!current || v.size_bytes < current.size_bytes) byWidth.set(v.width, v);
+  }
+  if (byWidth.size === 0) return undefined;
+  return Array.from(byWidth.values())
+    .map((v) => `${artifactUrl(v)} ${v.width}w`)
+    .join(", ");
+}
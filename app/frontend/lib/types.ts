@@ -142,14 +142,33 @@ export interface AgentState {
   // Final strategic report (set by StrategyAdvisorAgent)
   strategic_report?: LocationIntelligenceReport;
 
-  // Artifact content (set by tools for AG-UI frontend display)
-  html_report_content?: string;
-  infographic_base64?: string;
+  // Artifact references (set by tools; fetch the bytes with artifactUrl)
+  html_report_artifact?: ArtifactRef;
+  infographic_artifact?: ArtifactRef;
+  infographic_variants?: ArtifactRef[]; // Full size first, then WebP and thumbnails
 
   // Metadata
   current_date?: string;
 }
 
+/**
+ * Reference to an artifact saved by the agent; the bytes are not in state.
+ * Matches: save_artifact_ref in app/utils/artifacts.py
+ */
+export interface ArtifactRef {
+  filename: string;
+  version: number;
+  mime_type: string;
+  size_bytes: number;
+  sha256: string;
+  app_name: string;
+  user_id: string;
+  session_id: string;
+  // Pixel size of image variants (see app/tools/image_variants.py)
+  width?: number;
+  height?: number;
+}
+
 // =============================================================================
 // UI Helper Types
 // =============================================================================
@@ -0,0 +1,126 @@
+"""Resume an interrupted Location Strategy Pipeline run from its checkpoints.
+
+Every run checkpoints each completed stage (see app/callbacks/checkpoints.py)
+and logs its checkpoint id at start. Resuming rebuilds a session from the
+recorded request, runs the pipeline again, and restores every checkpointed
+stage instead of re-running it, so work restarts at the first incomplete
+stage.
+
+Usage:
+    uv run python -m app.resume --list
+    uv run python -m app.resume <checkpoint_id>
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+from typing import Optional
+
+from google.adk.artifacts import BaseArtifactService, InMemoryArtifactService
+from google.adk.runners import Runner
+from google.adk.sessions import BaseSessionService, InMemorySessionService, Session
+from google.genai import types
+
+from .agent import location_strategy_pipeline
+from .callbacks.checkpoints import list_runs, load_run
+from .config import APP_NAME
+from .tools.genai_client import close_genai_client
+from .tools.maps_client import close_maps_clients
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+
+async def resume_pipeline(
+    checkpoint_id: str,
+    user_id: str = "resume_user",
+    session_service: Optional[BaseSessionService] = None,
+    artifact_service: Optional[BaseArtifactService] = None,
+) -> Session:
+    """Re-run the pipeline for a checkpointed run, skipping completed stages.
+
+    Args:
+        checkpoint_id: Id logged when the original run started.
+        user_id: Owner of the new session.
+        session_service: Where to create the resumed session (in-memory by default).
+        artifact_service: Where to save artifacts (in-memory by default).
+
+    Returns:
+        Session: The resumed session, with the final pipeline state.
+
+    Raises:
+        ValueError: No checkpoints exist for ``checkpoint_id``.
+        RuntimeError: The resumed session is gone once the run finishes.
+    """
+    run = load_run(checkpoint_id)
+    if run is None:
+        raise ValueError(f"No checkpoints found for run '{checkpoint_id}'")
+
+    logger.info(f"Resuming run {checkpoint_id}; checkpointed stages: {run['stages_completed']}")
+
+    session_service = session_service or InMemorySessionService()
+    artifact_service = artifact_service or InMemoryArtifactService()
+    session = await session_service.create_session(
+        app_name=APP_NAME,
+        user_id=user_id,
+        state={
+            **{key: value for key, value in run["request"].items() if key != "started_at"},
+            "checkpoint_id": checkpoint_id,
+            "resume_from_checkpoint": True,
+            "stages_completed": ["intake"],
+        },
+    )
+
+    runner = Runner(
+        app_name=APP_NAME,
+        agent=location_strategy_pipeline,
+        session_service=session_service,
+        artifact_service=artifact_service,
+    )
+    message = types.Content(
+        role="user",
+        parts=[types.Part(text="Resume the location strategy analysis.")],
+    )
+    async for _ in runner.run_async(user_id=user_id, session_id=session.id, new_message=message):
+        pass
+
+    resumed = await session_service.get_session(
+        app_name=APP_NAME, user_id=user_id, session_id=session.id
+    )
+    if resumed is None:
+        raise RuntimeError(f"Resumed session {session.id} no longer exists")
+    return resumed
+
+
+async def _resume_cli(checkpoint_id: str) -> Session:
+    """resume_pipeline, then close the clients bound to this run's event loop."""
+    try:
+        return await resume_pipeline(checkpoint_id)
+    finally:
+        await close_maps_clients()
+        await close_genai_client()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("checkpoint_id", nargs="?", help="Run to resume")
+    parser.add_argument("--list", action="store_true", help="List resumable runs")
+    args = parser.parse_args()
+
+    if args.list or not args.checkpoint_id:
+        print(json.dumps(list_runs(), indent=2))
+        return
+
+    try:
+        session = asyncio.run(_resume_cli(args.checkpoint_id))
+    except (ValueError, RuntimeError) as e:
+        parser.exit(1, f"error: {e}\n")
+    print(json.dumps({
+        "checkpoint_id": args.checkpoint_id,
+        "session_id": session.id,
+        "stages_completed": session.state.get("stages_completed", []),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ from .report_schema import (
     AlternativeLocation,
     LocationIntelligenceReport,
 )
+from .competitor_schema import CompetitorSet
+from .gap_schema import ZoneInput, ZoneScore
 
 __all__ = [
     "StrengthAnalysis",
@@ -18,4 +20,7 @@ __all__ = [
     "LocationRecommendation",
     "AlternativeLocation",
     "LocationIntelligenceReport",
+    "CompetitorSet",
+    "ZoneInput",
+    "ZoneScore",
 ]
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""Columnar (struct-of-arrays) schema for Google Maps competitor data."""
+
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, Field
+
+# Index in this list is the code stored in CompetitorSet.status
+BUSINESS_STATUS_CODES = [
+    "UNKNOWN",
+    "OPERATIONAL",
+    "CLOSED_TEMPORARILY",
+    "CLOSED_PERMANENTLY",
+]
+
+# Places types that carry no information about the business itself
+_GENERIC_TYPES = {"point_of_interest", "establishment"}
+
+
+def _match_score(keyword: str, name: str, types: List[str]) -> tuple[int, int]:
+    """How well a place fits a search keyword: (keyword is one of its types, keyword words in its name)."""
+    words = keyword.lower().split()
+    if words and words[-1].endswith("s") and not words[-1].endswith("ss"):
+        words[-1] = words[-1][:-1]
+    name = name.lower()
+    return int("_".join(words) in types), sum(word in name for word in words)
+
+
+class CompetitorSet(BaseModel):
+    """Competitor places as parallel arrays: index i describes one place.
+
+    Missing ratings are stored as 0.0, unknown price levels as -1 and missing
+    coordinates as None (NaN once loaded into numpy, so spatial queries skip
+    the place). Bit j of ``type_mask[i]`` is set when place i has type
+    ``type_vocab[j]``, and ``category[i]`` indexes the search keyword in
+    ``keywords``.
+    """
+
+    center_lat: Optional[float] = Field(default=None, description="Latitude of the search center")
+    center_lng: Optional[float] = Field(default=None, description="Longitude of the search center")
+    radius_meters: int = Field(default=0, description="Search radius in meters")
+    keywords: List[str] = Field(default_factory=list, description="Search keywords, indexed by category")
+    type_vocab: List[str] = Field(default_factory=list, description="Place types, indexed by type_mask bit")
+    status_codes: List[str] = Field(default_factory=lambda: list(BUSINESS_STATUS_CODES), description="Business status names, indexed by status")
+    ids: List[str] = Field(default_factory=list, description="Google place_id")
+    names: List[str] = Field(default_factory=list, description="Business name")
+    addresses: List[str] = Field(default_factory=list, description="Vicinity address")
+    lat: List[Optional[float]] = Field(default_factory=list, description="Latitude (None if missing)")
+    lng: List[Optional[float]] = Field(default_factory=list, description="Longitude (None if missing)")
+    rating: List[float] = Field(default_factory=list, description="Rating out of 5 (0 if unrated)")
+    reviews: List[int] = Field(default_factory=list, description="Total user ratings")
+    price_level: List[int] = Field(default_factory=list, description="Price level 0-4 (-1 if unknown)")
+    status: List[int] = Field(default_factory=list, description="Business status code")
+    type_mask: List[int] = Field(default_factory=list, description="Bitmask over type_vocab")
+    category: List[int] = Field(default_factory=list, description="Index into keywords")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_places(
+        cls,
+        places: List[dict],
+        keyword: str,
+        center: Optional[dict] = None,
+        radius_meters: int = 0,
+    ) -> "CompetitorSet":
+        """Build a set from raw Nearby Search results for one keyword."""
+        result = cls(
+            center_lat=center.get("lat") if center else None,
+            center_lng=center.get("lng") if center else None,
+            radius_meters=radius_meters,
+            keywords=[keyword],
+        )
+        for place in places:
+            result._append(place, category=0)
+        return result
+
+    def _append(self, place: dict, category: int) -> None:
+        location = place.get("geometry", {}).get("location", {})
+        status = place.get("business_status") or "UNKNOWN"
+        price_level = place.get("price_level")
+
+        self.ids.append(place.get("place_id") or f"{place.get('name')}|{place.get('vicinity')}")
+        self.names.append(place.get("name") or "")
+        self.addresses.append(place.get("vicinity") or "")
+        has_coords = location.get("lat") is not None and location.get("lng") is not None
+        self.lat.append(float(location["lat"]) if has_coords else None)
+        self.lng.append(float(location["lng"]) if has_coords else None)
+        self.rating.append(float(place.get("rating") or 0.0))
+        self.reviews.append(int(place.get("user_ratings_total") or 0))
+        self.price_level.append(int(price_level) if isinstance(price_level, int) else -1)
+        self.status.append(
+            BUSINESS_STATUS_CODES.index(status) if status in BUSINESS_STATUS_CODES else 0
+        )
+        self.type_mask.append(self._mask_for(place.get("types", [])))
+        self.category.append(category)
+
+    def _mask_for(self, types: List[str]) -> int:
+        mask = 0
+        for place_type in types:
+            if place_type in _GENERIC_TYPES:
+                continue
+            if place_type not in self.type_vocab:
+                self.type_vocab.append(place_type)
+            mask |= 1 << self.type_vocab.index(place_type)
+        return mask
+
+    def types_of(self, i: int) -> List[str]:
+        """Decode the type bitmask of place ``i``."""
+        mask = self.type_mask[i]
+        return [name for bit, name in enumerate(self.type_vocab) if mask >> bit & 1]
+
+    def _keyword_code(self, keyword: str) -> int:
+        if keyword not in self.keywords:
+            self.keywords.append(keyword)
+        return self.keywords.index(keyword)
+
+    def merge(self, other: "CompetitorSet") -> "CompetitorSet":
+        """Return a new set with ``other``'s places appended, deduplicated by id.
+
+        A place found by several keywords is categorized under the keyword it
+        matches best (see ``_match_score``); ties go to the keyword searched
+        first. Missing coordinates are filled in from ``other`` when it has them.
+        """
+        merged = self.model_copy(deep=True)
+        if merged.center_lat is None:
+            merged.center_lat, merged.center_lng = other.center_lat, other.center_lng
+        merged.radius_meters = max(merged.radius_meters, other.radius_meters)
+
+        position = {place_id: j for j, place_id in enumerate(merged.ids)}
+        for i, place_id in enumerate(other.ids):
+            code = merged._keyword_code(other.keywords[other.category[i]])
+            j = position.get(place_id)
+            if j is not None:
+                name, types = merged.names[j], merged.types_of(j)
+                current = merged.category[j]
+                if (_match_score(merged.keywords[code], name, types), -code) > (
+                    _match_score(merged.keywords[current], name, types), -current
+                ):
+                    merged.category[j] = code
+                if merged.lat[j] is None and other.lat[i] is not None:
+                    merged.lat[j], merged.lng[j] = other.lat[i], other.lng[i]
+                continue
+            position[place_id] = len(merged.ids)
+            merged.ids.append(place_id)
+            merged.names.append(other.names[i])
+            merged.addresses.append(other.addresses[i])
+            merged.lat.append(other.lat[i])
+            merged.lng.append(other.lng[i])
+            merged.rating.append(other.rating[i])
+            merged.reviews.append(other.reviews[i])
+            merged.price_level.append(other.price_level[i])
+            merged.status.append(other.status[i])
+            merged.type_mask.append(merged._mask_for(other.types_of(i)))
+            merged.category.append(code)
+        return merged
+
+    def select(self, keyword: str) -> "CompetitorSet":
+        """Return only the places found by ``keyword``."""
+        if keyword not in self.keywords:
+            return CompetitorSet(
+                center_lat=self.center_lat,
+                center_lng=self.center_lng,
+                radius_meters=self.radius_meters,
+            )
+        code = self.keywords.index(keyword)
+        rows = [i for i, category in enumerate(self.category) if category == code]
+        return CompetitorSet(
+            center_lat=self.center_lat,
+            center_lng=self.center_lng,
+            radius_meters=self.radius_meters,
+            keywords=[keyword],
+            type_vocab=list(self.type_vocab),
+            ids=[self.ids[i] for i in rows],
+            names=[self.names[i] for i in rows],
+            addresses=[self.addresses[i] for i in rows],
+            lat=[self.lat[i] for i in rows],
+            lng=[self.lng[i] for i in rows],
+            rating=[self.rating[i] for i in rows],
+            reviews=[self.reviews[i] for i in rows],
+            price_level=[self.price_level[i] for i in rows],
+            status=[self.status[i] for i in rows],
+            type_mask=[self.type_mask[i] for i in rows],
+            category=[0] * len(rows),
+        )
+
+    @classmethod
+    def from_state(cls, state: Any, key: str = "competitor_places") -> "CompetitorSet":
+        """Load the set stored in session state (empty if absent)."""
+        value = state.get(key)
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls.model_validate(value)
+        return cls()
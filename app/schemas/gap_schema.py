@@ -0,0 +1,43 @@
+"""Pydantic schemas for the deterministic gap analysis scoring engine."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ZoneInput(BaseModel):
+    """Market fundamentals for one sub-zone, as extracted from market research."""
+
+    name: str = Field(description="Zone or neighborhood name as it appears in competitor addresses")
+    population_density: float = Field(description="Population density score (1-10)", ge=0, le=10)
+    income_score: float = Field(description="Income level score (1-10)", ge=0, le=10)
+    infrastructure: float = Field(description="Infrastructure quality score (1-10)", ge=0, le=10)
+    rental_cost_tier: Optional[str] = Field(default=None, description="Rental cost tier (Low/Medium/High)")
+    lat: Optional[float] = Field(default=None, description="Zone center latitude, if known")
+    lng: Optional[float] = Field(default=None, description="Zone center longitude, if known")
+    radius_meters: Optional[float] = Field(default=None, description="Zone catchment radius in meters")
+    address_terms: Optional[List[str]] = Field(
+        default=None,
+        description="Extra address substrings identifying the zone (defaults to its name)",
+    )
+
+
+class ZoneScore(BaseModel):
+    """Computed gap analysis metrics for one sub-zone."""
+
+    name: str = Field(description="Zone name")
+    rank: int = Field(description="Rank by viability score (1 = best)")
+    competitor_count: int = Field(description="Direct competitors assigned to the zone")
+    avg_rating: float = Field(description="Average competitor rating (missing ratings imputed)")
+    total_reviews: int = Field(description="Total competitor review count")
+    high_performers: int = Field(description="Competitors rated 4.5 or higher")
+    chain_dominance_pct: float = Field(description="Percentage of competitors that are chains")
+    density_per_km2: Optional[float] = Field(default=None, description="Competitors per square km (zones with coordinates)")
+    nearest_competitor_m: Optional[float] = Field(default=None, description="Distance from zone center to nearest competitor")
+    competition_intensity: float = Field(description="CI = (competitors * avg rating) / ln(total reviews + 2)")
+    demand_signal: float = Field(description="DS = 0.4 * population + 0.4 * income + 0.2 * infrastructure")
+    market_saturation_index: float = Field(description="MSI = CI / DS")
+    viability_score: float = Field(description="Weighted viability score (0-100)")
+    category: str = Field(description="OPPORTUNITY, MODERATE or SATURATED")
+    risk_level: str = Field(description="Low, Medium or High")
+    investment_tier: str = Field(description="Investment tier from rental costs")
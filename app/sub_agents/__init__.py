@@ -4,7 +4,7 @@ This module exports all specialized agents that form the pipeline:
 0. IntakeAgent - Parses user request to extract location and business type
 1. MarketResearchAgent - Live web research with Google Search
 2. CompetitorMappingAgent - Competitor mapping with Maps API
-3. GapAnalysisAgent - Quantitative analysis with code execution
+3. GapAnalysisAgent - Quantitative analysis with deterministic scoring
 4. StrategyAdvisorAgent - Strategic synthesis with extended reasoning
 5. ReportGeneratorAgent - HTML report generation
 6. InfographicGeneratorAgent - Visual infographic generation
@@ -0,0 +1,66 @@
+"""Failure isolation for pipeline stages that run in a ParallelAgent.
+
+ParallelAgent runs its branches in one asyncio.TaskGroup, so an exception
+in one branch cancels every sibling. Wrapping each branch in a
+FailSafeAgent turns a failure into an error event and a
+``<stage>_error`` state key (and an "error" stage ledger entry) instead,
+letting the other branches finish.
+"""
+
+import logging
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.utils.context_utils import Aclosing
+from google.genai import types
+
+from ..utils.telemetry import finish_stage
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+
+class FailSafeAgent(BaseAgent):
+    """Runs a single sub-agent and contains any exception it raises."""
+
+    stage: str
+    """Pipeline stage key used for the ``<stage>_error`` state entry."""
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        agent = self.sub_agents[0]
+        try:
+            async with Aclosing(agent.run_async(ctx)) as agen:
+                async for event in agen:
+                    yield event
+        except Exception as e:
+            logger.error(f"STAGE FAILED: {agent.name} ({self.stage}): {e}")
+            events = [
+                event for event in ctx.session.events
+                if event.invocation_id == ctx.invocation_id and event.author == agent.name
+            ]
+            ledger = finish_stage(ctx.session.id, self.stage, "error", events, error=str(e))
+            yield Event(
+                author=self.name,
+                invocation_id=ctx.invocation_id,
+                branch=ctx.branch,
+                content=types.Content(
+                    role="model",
+                    parts=[types.Part(text=f"{agent.name} failed: {e}")],
+                ),
+                actions=EventActions(
+                    state_delta={f"{self.stage}_error": str(e), "stage_ledger": ledger}
+                ),
+            )
+
+
+def fail_safe(agent: BaseAgent, stage: str) -> FailSafeAgent:
+    """Wrap ``agent`` so its failure does not cancel parallel siblings."""
+    return FailSafeAgent(
+        name=f"{agent.name}Guard",
+        description=agent.description,
+        sub_agents=[agent],
+        stage=stage,
+    )
@@ -121,21 +121,22 @@
 
 """Gap Analysis Agent - Part 2B of the Location Strategy Pipeline.
 
-This agent performs quantitative gap analysis using Python code execution
-to calculate saturation indices, viability scores, and zone rankings.
+This agent performs quantitative gap analysis with the deterministic
+compute_gap_scores tool to calculate saturation indices, viability scores,
+and zone rankings, then narrates the precomputed results.
 """
 
 from google.adk.agents import LlmAgent
-from google.adk.code_executors import BuiltInCodeExecutor
 from google.genai import types
 
 from ...config import CODE_EXEC_MODEL, RETRY_INITIAL_DELAY, RETRY_ATTEMPTS
+from ...tools import compute_gap_scores
 from ...callbacks import before_gap_analysis, after_gap_analysis
 
 
 GAP_ANALYSIS_INSTRUCTION = """You are a senior data scientist specializing in retail site selection.
 
-Your task is to execute Python code to perform a SOTA quantitative gap analysis using data from previous stages.
+Your task is to run a SOTA quantitative gap analysis with the `compute_gap_scores` tool using data from previous stages.
 
 TARGET LOCATION: {target_location?}
 BUSINESS TYPE: {business_type?}
@@ -144,51 +145,43 @@ CURRENT DATE: {current_date}
 ## Input Data Context
 
 ### MARKET RESEARCH FINDINGS:
-{market_research_findings}
+{market_research_findings_compact?}
 
 ### COMPETITOR ANALYSIS (Multi-Call Results):
-{competitor_analysis}
+{competitor_analysis_compact?}
+
+### LOCALITIES IN COMPETITOR ADDRESSES (name: competitor count):
+{competitor_localities?}
 
 ## Your Mission
-Write and execute high-quality Python code using pandas to calculate a deterministic 'Viability Score' for multiple sub-zones.
-
-## Step 1: Structured Data Parsing
-- Extract competitor details (name, rating, reviews, status, and category).
-- Extract macro indicators: population density (1-10), income score (1-10), and infrastructure quality (1-10).
-
-## Step 2: SOTA Metric Calculations
-For each sub-zone identified, compute the following metrics:
-
-1. **Competition Intensity (CI):** - CI = (Number of Competitors * Avg Rating) / log(Total Reviews + 2).
-2. **Demand Signal (DS):** - DS = (Population Density * 0.4) + (Income Score * 0.4) + (Infrastructure * 0.2).
-3. **Market Saturation Index (MSI):** - MSI = CI / DS. (MSI > 1.5 indicates high saturation; MSI < 0.8 indicates a gap).
-4. **Viability Score (0-100):**
-   - Use a weighted average: (30% Low MSI) + (30% High DS) + (20% Review Volume Growth) + (20% Low Chain Dominance).
-
-## Step 3: Zone Categorization & Risk Matrix
-- **OPPORTUNITY (Viability > 75):** High demand, manageable competition.
-- **MODERATE (50-75):** Balanced market.
-- **SATURATED (< 50):** High barrier to entry.
-- Assign Risk Levels (Low/Medium/High) and Investment Tiers based on rental cost tiers from research.
-
-## Step 4: Python Code Execution Guidelines
-- Use `pandas.DataFrame` for all calculations.
-- Handle missing rating or review data by using the median value of the dataset.
-- **CRITICAL:** The last part of your code must print a final summary table in JSON-like format or a Markdown table that clearly ranks the Top 3 Zones by Viability Score.
-
-## Step 5: Output Requirements
-1. **The Python Code Block:** Containing all logic and calculations.
+Produce a deterministic 'Viability Score' for multiple sub-zones. The scoring engine already has the structured competitor data (coordinates, ratings, reviews, names); your job is to supply the market fundamentals and explain the results.
+
+## Step 1: Define Sub-Zones
+- Pick 4-8 sub-zones of the target location, using locality names exactly as they appear in the list above so competitors can be matched to them.
+- For each zone, extract macro indicators from the market research: population density (1-10), income score (1-10), infrastructure quality (1-10), and rental cost tier (Low/Medium/High).
+
+## Step 2: Compute Scores
+Call `compute_gap_scores` once with all zones. It computes, per zone:
+1. **Competition Intensity (CI):** CI = (Number of Competitors * Avg Rating) / log(Total Reviews + 2).
+2. **Demand Signal (DS):** DS = (Population Density * 0.4) + (Income Score * 0.4) + (Infrastructure * 0.2).
+3. **Market Saturation Index (MSI):** MSI = CI / DS. (MSI > 1.5 indicates high saturation; MSI < 0.8 indicates a gap).
+4. **Viability Score (0-100):** (30% Low MSI) + (30% High DS) + (20% Review Volume) + (20% Low Chain Dominance).
+It also categorizes zones (OPPORTUNITY > 75, MODERATE 50-75, SATURATED < 50) and assigns Risk Levels and Investment Tiers.
+
+## Step 3: Output Requirements
+Do NOT recompute or alter any number returned by the tool.
+1. **Zone Metrics Table:** A Markdown table of every zone with its computed metrics, ranked by Viability Score.
 2. **Analysis Summary:** A written explanation of the 'why' behind the top-ranked zones.
 3. **Viability Heatmap Data:** A list of zones and their scores (0-100) for the strategy synthesis stage.
-
-Execute the code now to produce the quantitative foundation for the final strategic report.
 """
 
 gap_analysis_agent = LlmAgent(
     name="GapAnalysisAgent",
     model=CODE_EXEC_MODEL,
-    description="Performs quantitative gap analysis using Python code execution for zone rankings and viability scores",
+    description="Performs quantitative gap analysis with a deterministic scoring engine for zone rankings and viability scores",
     instruction=GAP_ANALYSIS_INSTRUCTION,
+    # Upstream outputs arrive compacted through the instruction; skip the raw history
+    include_contents="none",
     generate_content_config=types.GenerateContentConfig(
         http_options=types.HttpOptions(
             retry_options=types.HttpRetryOptions(
@@ -197,8 +190,8 @@ gap_analysis_agent = LlmAgent(
             ),
         ),
     ),
-    code_executor=BuiltInCodeExecutor(),
+    tools=[compute_gap_scores],
     output_key="gap_analysis",
     before_agent_callback=before_gap_analysis,
     after_agent_callback=after_gap_analysis,
-)
\ No newline at end of file
+)
@@ -1,7 +1,11 @@
 """Infographic Generator Agent - Part 5 (Bonus) of the Location Strategy Pipeline.
 
-This agent creates a visual infographic summary using Gemini's image generation
-capabilities to provide an executive-ready visual summary of the analysis.
+This agent provides an executive-ready visual summary of the analysis.
+
+With INFOGRAPHIC_MODE=template (the default) before_infographic_generator
+draws an SVG infographic locally from the strategic report and the agent
+itself is skipped. With INFOGRAPHIC_MODE=image_model the agent runs and
+generates a raster infographic with the image model.
 """
 
 from google.adk.agents import LlmAgent
@@ -78,7 +82,8 @@ If failed, report the error for troubleshooting.
 ## Output
 The generate_infographic tool will return a result dict containing:
 - status: "success" or "error"
-- image_data: Base64 encoded PNG (if successful)
+- artifact_filename: Name of the saved infographic artifact (if successful)
+- mime_type: Image format of the saved infographic (if successful)
 - error_message: Error details (if failed)
 
 Store this result so the after_agent_callback can save the artifact.
@@ -87,7 +92,7 @@ Store this result so the after_agent_callback can save the artifact.
 infographic_generator_agent = LlmAgent(
     name="InfographicGeneratorAgent",
     model=FAST_MODEL,
-    description="Generates visual infographic summary using Gemini image generation",
+    description="Generates a visual infographic summary: a template-rendered SVG by default, or an image-model raster image in image_model mode",
     instruction=INFOGRAPHIC_GENERATOR_INSTRUCTION,
     generate_content_config=types.GenerateContentConfig(
         http_options=types.HttpOptions(
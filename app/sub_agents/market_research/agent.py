@@ -1,7 +1,9 @@
 """Market Research Agent - Part 1 of the Location Strategy Pipeline.
 
 This agent validates macro market viability using live web data from Google Search.
-It researches demographics, market trends, and commercial viability.
+It researches demographics, market trends, and commercial viability. The
+location-level AREA PROFILE section of its findings is reused when the same
+area is re-analyzed for another business type.
 """
 
 from google.adk.agents import LlmAgent
@@ -52,8 +54,21 @@ CURRENT DATE: {current_date}
 3. Focus on information from the last 1-2 years for relevance
 4. Be factual and data-driven, avoid speculation
 
+{area_profile_note?}
 ## Output Format
-Provide a structured analysis covering all four focus areas.
+If a Known Area Profile is given above, write ONLY the ## BUSINESS MARKET
+section described below; the known profile is added back in front of it.
+
+Otherwise, provide a structured analysis covering all four focus areas in two
+sections, using these exact headings:
+
+## AREA PROFILE
+Demographics and market growth of the location. Keep this section independent
+of the business type; it is reused when the same area is analyzed for another
+business.
+
+## BUSINESS MARKET
+Industry presence and commercial viability for {business_type}.
 Conclude with a clear verdict: Is this a strong market for {business_type}? Why or why not?
 Include specific recommendations for market entry strategy.
 """
@@ -3,6 +3,10 @@
 This agent generates a professional HTML executive report from the
 structured LocationIntelligenceReport data using the generate_html_report tool.
 
+With HTML_REPORT_MODE=template (the default) before_report_generator renders
+the deck locally from the report and the agent itself is skipped; the
+LLM path below is the "creative" mode.
+
 The tool handles:
 - Calling Gemini to generate 7-slide McKinsey/BCG style HTML
 - Saving the HTML as an artifact for download in adk web
@@ -25,13 +25,13 @@ CURRENT DATE: {current_date}
 ## Available Data
 
 ### MARKET RESEARCH FINDINGS (Part 1):
-{market_research_findings}
+{market_research_findings_compact?}
 
 ### COMPETITOR ANALYSIS (Part 2A):
-{competitor_analysis}
+{competitor_analysis_compact?}
 
 ### GAP ANALYSIS (Part 2B):
-{gap_analysis}
+{gap_analysis_compact?}
 
 ## Your Mission
 Synthesize all findings into a comprehensive strategic recommendation.
@@ -86,6 +86,8 @@ strategy_advisor_agent = LlmAgent(
     model=CODE_EXEC_MODEL,
     description="Synthesizes findings into strategic recommendations using extended reasoning and structured output",
     instruction=STRATEGY_ADVISOR_INSTRUCTION,
+    # Upstream outputs arrive compacted through the instruction; skip the raw history
+    include_contents="none",
     generate_content_config=types.GenerateContentConfig(
         http_options=types.HttpOptions(
             retry_options=types.HttpRetryOptions(
@@ -1,11 +1,15 @@
 """Custom tools for the Location Strategy Pipeline."""
 
 from .places_search import search_places
-from .image_generator import generate_infographic
-from .html_report_generator import generate_html_report
+from .image_generator import generate_infographic, render_infographic
+from .html_report_generator import generate_html_report, render_html_report
+from .gap_scoring import compute_gap_scores
 
 __all__ = [
     "search_places",
     "generate_infographic",
+    "render_infographic",
     "generate_html_report",
+    "render_html_report",
+    "compute_gap_scores",
 ]
\ No newline at end of file
@@ -0,0 +1,287 @@
+"""Deterministic gap analysis scoring engine.
+
+Implements the Competition Intensity, Demand Signal, Market Saturation Index
+and Viability Score formulas natively with NumPy over the structured
+competitor data that search_places stores in session state. The
+GapAnalysisAgent calls it as a tool and only narrates the results, so the
+numbers are reproducible and no model-written code has to be executed.
+"""
+
+import logging
+import re
+from collections import Counter
+from typing import List
+
+import numpy as np
+from google.adk.tools import ToolContext
+
+from ..schemas.competitor_schema import CompetitorSet
+from ..schemas.gap_schema import ZoneInput, ZoneScore
+from ..utils.spatial_index import SpatialIndex, index_for
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+DEFAULT_ZONE_RADIUS_M = 1500.0
+HIGH_PERFORMER_RATING = 4.5
+
+# Viability Score weights
+W_LOW_MSI = 0.30
+W_HIGH_DEMAND = 0.30
+W_REVIEW_VOLUME = 0.20
+W_LOW_CHAIN = 0.20
+
+
+def _brand_key(name: str) -> str:
+    """Reduce a business name to its brand, e.g. 'Cult.fit - HSR' -> 'cultfit'."""
+    brand = re.split(r"\s[-|@\u2013]\s|,|\(", name.lower())[0]
+    return re.sub(r"[^a-z0-9]", "", brand)
+
+
+def chain_flags(names: List[str]) -> np.ndarray:
+    """Mark businesses whose brand appears more than once in the set."""
+    brands = [_brand_key(name) for name in names]
+    counts = Counter(brand for brand in brands if brand)
+    return np.array([bool(brand) and counts[brand] > 1 for brand in brands], dtype=bool)
+
+
+def locality_counts(competitors: CompetitorSet) -> list[tuple[str, int]]:
+    """Most common localities in competitor addresses (second-to-last component)."""
+    localities = []
+    for address in competitors.addresses:
+        parts = [part.strip() for part in address.split(",") if part.strip()]
+        if parts:
+            localities.append(parts[-2] if len(parts) > 1 else parts[-1])
+    return Counter(localities).most_common()
+
+
+def _assign_zones(competitors: CompetitorSet, zones: List[ZoneInput]) -> np.ndarray:
+    """Zone index for every competitor (-1 when it falls in no zone).
+
+    Zones with coordinates claim the competitors within their radius (the
+    nearest zone wins); the rest are matched by address substrings.
+    """
+    n = len(competitors)
+    assignment = np.full(n, -1, dtype=np.int64)
+    if not n or not zones:
+        return assignment
+
+    located = [i for i, zone in enumerate(zones) if zone.lat is not None and zone.lng is not None]
+    if located:
+        zone_index = SpatialIndex(
+            [zones[i].lat for i in located],
+            [zones[i].lng for i in located],
+            origin=(zones[located[0]].lat, zones[located[0]].lng),
+        )
+        distance, nearest = zone_index.k_nearest(competitors.lat, competitors.lng, k=1)
+        radius = np.array(
+            [zones[i].radius_meters or DEFAULT_ZONE_RADIUS_M for i in located]
+        )[nearest[:, 0]]
+        inside = distance[:, 0] <= radius
+        assignment[inside] = np.array(located)[nearest[inside, 0]]
+
+    addresses = [address.lower() for address in competitors.addresses]
+    for zone_id, zone in enumerate(zones):
+        if zone_id in located:
+            continue
+        terms = [term.lower() for term in (zone.address_terms or [zone.name]) if term.strip()]
+        for i, address in enumerate(addresses):
+            if assignment[i] == -1 and any(term in address for term in terms):
+                assignment[i] = zone_id
+    return assignment
+
+
+def _risk_level(msi: float) -> str:
+    if msi < 0.8:
+        return "Low"
+    if msi <= 1.5:
+        return "Medium"
+    return "High"
+
+
+def _category(viability: float) -> str:
+    if viability > 75:
+        return "OPPORTUNITY"
+    if viability >= 50:
+        return "MODERATE"
+    return "SATURATED"
+
+
+def score_zones(competitors: CompetitorSet, zones: List[ZoneInput]) -> tuple[List[ZoneScore], int]:
+    """Score every zone and rank them by Viability Score.
+
+    Formulas (per zone):
+        CI  = (competitors * avg rating) / ln(total reviews + 2)
+        DS  = 0.4 * population density + 0.4 * income + 0.2 * infrastructure
+        MSI = CI / DS
+        Viability = 30% low MSI + 30% high DS + 20% review volume + 20% low chain dominance
+
+    Component scales (0-100): low MSI = 100 * (1 - MSI / 2), high DS = 10 * DS,
+    review volume = log10(1 + reviews per competitor) / 3 (1000 reviews per
+    competitor scores 100; Places exposes no review history, so volume stands
+    in for growth), low chain dominance = 100 - chain %.
+    Missing ratings are imputed with the median rating of the dataset.
+
+    Returns:
+        tuple: (zone scores sorted best first, competitors not in any zone)
+    """
+    rating = np.asarray(competitors.rating, dtype=np.float64)
+    reviews = np.asarray(competitors.reviews, dtype=np.float64)
+    rated = rating > 0
+    median_rating = float(np.median(rating[rated])) if rated.any() else 0.0
+    rating = np.where(rated, rating, median_rating)
+    chains = chain_flags(competitors.names)
+
+    assignment = _assign_zones(competitors, zones)
+    index = index_for(competitors) if len(competitors) else None
+    z = len(zones)
+
+    # Per-zone aggregates in one pass each via bincount
+    assigned = assignment >= 0
+    bins = assignment[assigned]
+    count = np.bincount(bins, minlength=z).astype(np.float64)
+    rating_sum = np.bincount(bins, weights=rating[assigned], minlength=z)
+    review_sum = np.bincount(bins, weights=reviews[assigned], minlength=z)
+    high_perf = np.bincount(bins, weights=(rating[assigned] >= HIGH_PERFORMER_RATING), minlength=z)
+    chain_count = np.bincount(bins, weights=chains[assigned], minlength=z)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg_rating = np.where(count > 0, rating_sum / count, 0.0)
+        chain_pct = np.where(count > 0, 100.0 * chain_count / count, 0.0)
+        reviews_per = np.where(count > 0, review_sum / count, 0.0)
+
+    ci = count * avg_rating / np.log(review_sum + 2.0)
+    ds = np.array(
+        [0.4 * zone.population_density + 0.4 * zone.income_score + 0.2 * zone.infrastructure for zone in zones]
+    )
+    msi = ci / np.maximum(ds, 0.1)
+
+    low_msi = 100.0 * np.clip(1.0 - msi / 2.0, 0.0, 1.0)
+    high_ds = np.clip(10.0 * ds, 0.0, 100.0)
+    review_volume = 100.0 * np.clip(np.log10(1.0 + reviews_per) / 3.0, 0.0, 1.0)
+    low_chain = 100.0 - chain_pct
+    viability = (
+        W_LOW_MSI * low_msi
+        + W_HIGH_DEMAND * high_ds
+        + W_REVIEW_VOLUME * review_volume
+        + W_LOW_CHAIN * low_chain
+    )
+
+    scores = []
+    for i, zone in enumerate(zones):
+        density = nearest = None
+        if zone.lat is not None and zone.lng is not None:
+            radius = zone.radius_meters or DEFAULT_ZONE_RADIUS_M
+            density = round(float(count[i]) / (np.pi * (radius / 1000.0) ** 2), 2)
+            if index is not None and len(index):
+                nearest = round(float(index.nearest_distance(zone.lat, zone.lng)[0]), 1)
+        scores.append(ZoneScore(
+            name=zone.name,
+            rank=0,
+            competitor_count=int(count[i]),
+            avg_rating=round(float(avg_rating[i]), 2),
+            total_reviews=int(review_sum[i]),
+            high_performers=int(high_perf[i]),
+            chain_dominance_pct=round(float(chain_pct[i]), 1),
+            density_per_km2=density,
+            nearest_competitor_m=nearest,
+            competition_intensity=round(float(ci[i]), 3),
+            demand_signal=round(float(ds[i]), 2),
+            market_saturation_index=round(float(msi[i]), 3),
+            viability_score=round(float(viability[i]), 1),
+            category=_category(float(viability[i])),
+            risk_level=_risk_level(float(msi[i])),
+            investment_tier=(zone.rental_cost_tier or "Unknown").title(),
+        ))
+
+    # Stable sort: ties keep the order the zones were given in
+    scores.sort(key=lambda score: -score.viability_score)
+    for rank, score in enumerate(scores, start=1):
+        score.rank = rank
+    return scores, int((~assigned).sum())
+
+
+def _keyword_key(text: str) -> str:
+    """Comparable form of a search keyword: lowercase, single spaces, singular last word."""
+    words = str(text or "").lower().split()
+    if words and words[-1].endswith("s") and not words[-1].endswith("ss"):
+        words[-1] = words[-1][:-1]
+    return " ".join(words)
+
+
+def _direct_competitors(competitors: CompetitorSet, business_type: str) -> CompetitorSet:
+    """Restrict to places found by the search for the requested business type.
+
+    Keywords match ignoring case, spacing and a plural "s". If no search was
+    for this business type, no place counts as a direct competitor.
+    """
+    target = _keyword_key(business_type)
+    for keyword in competitors.keywords:
+        if _keyword_key(keyword) == target:
+            return competitors.select(keyword)
+    if competitors.keywords:
+        logger.warning(
+            f"No competitor search matches business type '{business_type}' "
+            f"(searched: {competitors.keywords}); scoring without direct competitors"
+        )
+    return competitors.select(business_type)
+
+
+def compute_gap_scores(zones: List[ZoneInput], tool_context: ToolContext) -> dict:
+    """Compute deterministic gap analysis scores for candidate sub-zones.
+
+    Uses the competitor data collected by search_places in this session
+    (coordinates, ratings, review counts, names) and the market fundamentals
+    you provide per zone. Scores are reproducible; report them as returned.
+
+    Args:
+        zones: Sub-zones to score. For each give `name` (as it appears in
+            competitor addresses), `population_density`, `income_score` and
+            `infrastructure` (each 1-10, from the market research), and
+            optionally `rental_cost_tier` (Low/Medium/High), `address_terms`
+            (alternative spellings to match addresses), or `lat`/`lng`/
+            `radius_meters` if the zone center is known.
+        tool_context: ADK ToolContext for reading competitor data from state.
+
+    Returns:
+        dict: A dictionary containing:
+            - status: "success" or "error"
+            - zones: Zone metrics ranked by viability score
+            - top_zones: Names of the top 3 zones
+            - competitors_scored: Direct competitors considered
+            - unassigned_competitors: Competitors not matched to any zone
+            - error_message: Error details (if failed)
+    """
+    try:
+        zone_inputs = [
+            zone if isinstance(zone, ZoneInput) else ZoneInput.model_validate(zone)
+            for zone in zones
+        ]
+        if not zone_inputs:
+            return {"status": "error", "error_message": "Provide at least one zone to score."}
+
+        competitors = _direct_competitors(
+            CompetitorSet.from_state(tool_context.state),
+            tool_context.state.get("business_type", ""),
+        )
+        scores, unassigned = score_zones(competitors, zone_inputs)
+
+        result = {
+            "status": "success",
+            "zones": [score.model_dump() for score in scores],
+            "top_zones": [score.name for score in scores[:3]],
+            "competitors_scored": len(competitors),
+            "unassigned_competitors": unassigned,
+        }
+        tool_context.state["gap_scores"] = {
+            **result,
+            "zone_inputs": [zone.model_dump(exclude_none=True) for zone in zone_inputs],
+        }
+        logger.info(
+            f"  Scored {len(scores)} zones over {len(competitors)} competitors "
+            f"({unassigned} unassigned)"
+        )
+        return result
+
+    except Exception as e:
+        logger.error(f"Failed to compute gap scores: {e}")
+        return {"status": "error", "error_message": f"Failed to compute gap scores: {e!s}"}
@@ -0,0 +1,87 @@
+"""Shared async Gemini client for the tools that call the API directly.
+
+generate_html_report and generate_infographic make their own Gemini calls
+outside ADK's model layer. They share one lazily created genai.Client per
+event loop (and its HTTP connection pool) and call it through
+``client.aio``, so a generation that takes tens of seconds awaits instead of
+blocking the event loop for every other session on the server.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Optional
+
+from google import genai
+from google.genai import types
+from google.genai.errors import ServerError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from ..utils.telemetry import record_retry, record_usage
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+# One client per event loop; its async HTTP pool is bound to that loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, genai.Client]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def get_genai_client() -> genai.Client:
+    """The shared Gemini client for the running event loop (uses GOOGLE_API_KEY).
+
+    Like get_maps_client, the client's async connection pool is bound to the
+    loop that created it, so each loop (the server's, batch and resume runs,
+    each Agent Engine query thread) gets its own client. Clients are never
+    closed from another loop: the loop's owner closes its client with
+    close_genai_client, and clients of loops that are gone are dropped.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None:
+            for stale in [other for other in _clients if other.is_closed()]:
+                del _clients[stale]
+            # AI Studio (not Vertex AI), configured from the environment
+            client = _clients[loop] = genai.Client()
+    return client
+
+
+async def close_genai_client() -> None:
+    """Close the running loop's client, if it has one (e.g. on server shutdown)."""
+    with _clients_lock:
+        client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aio.aclose()
+
+
+def _log_retry(retry_state) -> None:
+    record_retry()
+    logger.warning(
+        f"Gemini API error, retrying in {retry_state.next_action.sleep} seconds... "
+        f"(attempt {retry_state.attempt_number}/3)"
+    )
+
+
+# Retries model overload errors; tenacity sleeps with asyncio for coroutines
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=2, min=2, max=30),
+    retry=retry_if_exception_type(ServerError),
+    before_sleep=lambda retry_state: _log_retry(retry_state),
+)
+async def generate_content(
+    model: str,
+    contents: Any,
+    config: Optional[types.GenerateContentConfig] = None,
+) -> types.GenerateContentResponse:
+    """Await one generate_content call and attribute its usage to the current stage."""
+    response = await get_genai_client().aio.models.generate_content(
+        model=model,
+        contents=contents,
+        config=config,
+    )
+    record_usage(model, response.usage_metadata)
+    return response
@@ -1,22 +1,93 @@
 """HTML Report Generator tool for creating executive reports.
 
-Uses direct text generation (same as original notebook Part 4) to create
-McKinsey/BCG style 7-slide HTML presentations from strategic report data.
-Saves the generated HTML as an artifact for download in adk web.
+Creates McKinsey/BCG style 7-slide HTML presentations from strategic report
+data and saves them as an artifact for download in adk web. By default
+(HTML_REPORT_MODE=template) render_html_report builds the deck locally from
+the LocationIntelligenceReport in state; the "creative" mode uses direct
+text generation (same as original notebook Part 4) through the
+generate_html_report tool.
 """
 
 import logging
+import time
 from datetime import datetime
+from typing import Union
+
+from google.adk.agents.callback_context import CallbackContext
 from google.adk.tools import ToolContext
 from google.genai import types
-from google.genai.errors import ServerError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from ..config import PRO_MODEL
+from ..schemas import LocationIntelligenceReport
+from ..utils.artifacts import HTML_REPORT_REF_KEY, save_artifact_ref
+from .genai_client import generate_content
+from .report_renderer import render_report_html
 
 logger = logging.getLogger("LocationStrategyPipeline")
 
 
+async def _save_html_report(
+    html_code: str, context: Union[ToolContext, CallbackContext]
+) -> dict:
+    """Save the deck as an artifact and reference it in state; returns the tool result dict."""
+    # Save as artifact with proper MIME type so it appears in ADK web UI
+    artifact_filename = "executive_report.html"
+    ref = await save_artifact_ref(
+        context, artifact_filename, html_code.encode("utf-8"), "text/html"
+    )
+
+    # State only carries the reference; the AG-UI frontend fetches the deck by it
+    context.state[HTML_REPORT_REF_KEY] = ref
+
+    logger.info(
+        f"Saved HTML report artifact: {artifact_filename} "
+        f"(version {ref['version']}, {ref['size_bytes']:,} bytes)"
+    )
+
+    return {
+        "status": "success",
+        "message": f"HTML report generated and saved as artifact '{artifact_filename}'",
+        "artifact_filename": artifact_filename,
+        "artifact_version": ref["version"],
+        "artifact_sha256": ref["sha256"],
+        "html_length": len(html_code),
+    }
+
+
+async def render_html_report(context: Union[ToolContext, CallbackContext]) -> dict:
+    """Render the 7-slide HTML report from state["strategic_report"] without a model call.
+
+    Args:
+        context: Tool or callback context holding the strategic report.
+
+    Returns:
+        dict: Same shape as generate_html_report's result, plus render_ms.
+    """
+    try:
+        report = context.state.get("strategic_report")
+        if not report:
+            return {"status": "error", "error_message": "No strategic report in state to render"}
+        if hasattr(report, "model_dump"):
+            report = report.model_dump()
+        report = LocationIntelligenceReport.model_validate(report)
+
+        started = time.perf_counter()
+        html_code = render_report_html(report, context.state.get("current_date"))
+        render_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"Rendered HTML report from template in {render_ms:.1f} ms")
+
+        result = await _save_html_report(html_code, context)
+        result["render_ms"] = round(render_ms, 2)
+        return result
+
+    except Exception as e:
+        logger.error(f"Failed to render HTML report: {e}")
+        return {
+            "status": "error",
+            "error_message": f"Failed to render HTML report: {e!s}",
+        }
+
+
 async def generate_html_report(report_data: str, tool_context: ToolContext) -> dict:
     """Generate a McKinsey/BCG style HTML executive report and save as artifact.
 
@@ -40,11 +111,6 @@ async def generate_html_report(report_data: str, tool_context: ToolContext) -> d
             - error_message: Error details (if failed)
     """
     try:
-        from google import genai
-
-        # Initialize client (uses GOOGLE_API_KEY from env)
-        client = genai.Client()
-
         current_date = datetime.now().strftime("%Y-%m-%d")
 
         # Comprehensive prompt for multi-slide HTML generation
@@ -131,26 +197,14 @@ Current date: {current_date}
 
         logger.info("Generating HTML report using Gemini...")
 
-        # Retry wrapper for handling model overload errors
-        @retry(
-            stop=stop_after_attempt(3),
-            wait=wait_exponential(multiplier=2, min=2, max=30),
-            retry=retry_if_exception_type(ServerError),
-            before_sleep=lambda retry_state: logger.warning(
-                f"Gemini API error, retrying in {retry_state.next_action.sleep} seconds... "
-                f"(attempt {retry_state.attempt_number}/3)"
-            ),
-        )
-        def generate_with_retry():
-            return client.models.generate_content(
-                model=PRO_MODEL,
-                contents=prompt,
-                config=types.GenerateContentConfig(temperature=1.0),
-            )
-
         # Direct text generation (NOT code execution)
         # Same as original notebook: types.GenerateContentConfig(temperature=1.0)
-        response = generate_with_retry()
+        # Awaited on the shared async client, with retries on model overload
+        response = await generate_content(
+            model=PRO_MODEL,
+            contents=prompt,
+            config=types.GenerateContentConfig(temperature=1.0),
+        )
 
         # Extract HTML from response.text
         html_code = response.text
@@ -174,34 +228,11 @@ Current date: {current_date}
         if not html_code.strip().startswith("<!DOCTYPE") and not html_code.strip().startswith("<html"):
             logger.warning("Generated content may not be valid HTML")
 
-        # Save as artifact with proper MIME type so it appears in ADK web UI
-        html_artifact = types.Part.from_bytes(
-            data=html_code.encode('utf-8'),
-            mime_type="text/html"
-        )
-        artifact_filename = "executive_report.html"
-
-        version = await tool_context.save_artifact(
-            filename=artifact_filename,
-            artifact=html_artifact
-        )
-
-        # Also store in state for AG-UI frontend display
-        tool_context.state["html_report_content"] = html_code
-
-        logger.info(f"Saved HTML report artifact: {artifact_filename} (version {version})")
-
-        return {
-            "status": "success",
-            "message": f"HTML report generated and saved as artifact '{artifact_filename}'",
-            "artifact_filename": artifact_filename,
-            "artifact_version": version,
-            "html_length": len(html_code),
-        }
+        return await _save_html_report(html_code, tool_context)
 
     except Exception as e:
         logger.error(f"Failed to generate HTML report: {e}")
         return {
             "status": "error",
-            "error_message": f"Failed to generate HTML report: {str(e)}",
+            "error_message": f"Failed to generate HTML report: {e!s}",
         }
\ No newline at end of file
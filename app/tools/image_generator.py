@@ -1,33 +1,139 @@
-"""Gemini image generation tool for creating infographics.
+"""Infographic generation tools.
 
-Uses Google AI Studio (API key) for authentication.
-Uses gemini-3-pro-image-preview model for image generation.
-Requires GOOGLE_API_KEY environment variable to be set.
+By default (INFOGRAPHIC_MODE=template) render_infographic draws the
+infographic locally as SVG from the strategic report, with no model call.
 
-Saves the generated infographic directly as an artifact using tool_context.save_artifact()
-so it's accessible in adk web UI.
+With INFOGRAPHIC_MODE=image_model, generate_infographic asks IMAGE_MODEL for
+a raster image instead, using Google AI Studio (API key) authentication;
+GOOGLE_API_KEY must be set.
+
+Either way the infographic is saved directly as an artifact (with its
+smaller variants) so it's accessible in adk web UI.
 """
 
-import base64
+import asyncio
 import logging
+import time
+from typing import Union
+
+from google.adk.agents.callback_context import CallbackContext
 from google.adk.tools import ToolContext
 from google.genai import types
-from google.genai.errors import ServerError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from ..config import IMAGE_MODEL
+from ..schemas import LocationIntelligenceReport
+from ..utils.artifacts import INFOGRAPHIC_REF_KEY, INFOGRAPHIC_VARIANTS_KEY, save_artifact_ref
+from .genai_client import generate_content
+from .image_variants import build_variants
+from .infographic_renderer import render_infographic_svg
 
 logger = logging.getLogger("LocationStrategyPipeline")
 
 
+async def _save_infographic(
+    image_bytes: bytes,
+    mime_type: str,
+    context: Union[ToolContext, CallbackContext],
+    artifact_stem: str = "infographic",
+) -> dict:
+    """Save the image and its smaller variants as artifacts and reference them in state.
+
+    Returns the tool result dict. The artifact is named after its MIME type
+    (infographic.png, infographic.svg, ...); see image_variants for the
+    WebP and thumbnail variants saved next to raster images.
+    """
+    # Save the image directly as an artifact using tool_context
+    # This is the recommended ADK pattern for saving binary artifacts
+    # Note: save_artifact is async, so we must await it
+    try:
+        # Re-encoding and resizing is CPU-bound; keep it off the event loop
+        variants = await asyncio.to_thread(build_variants, image_bytes, mime_type)
+        refs = []
+        for variant in variants:
+            ref = await save_artifact_ref(
+                context, variant.filename(artifact_stem), variant.data, variant.mime_type
+            )
+            if variant.width:
+                ref.update(width=variant.width, height=variant.height)
+            refs.append(ref)
+        artifact_filename = refs[0]["filename"]
+        logger.info(
+            f"Saved infographic artifact: {artifact_filename} (version {refs[0]['version']}, "
+            f"{refs[0]['size_bytes']:,} bytes) and {len(refs) - 1} smaller variants"
+        )
+
+        # State only carries references; the AG-UI frontend fetches the image by them
+        context.state[INFOGRAPHIC_REF_KEY] = refs[0]
+        context.state[INFOGRAPHIC_VARIANTS_KEY] = refs
+
+        return {
+            "status": "success",
+            "message": f"Infographic generated and saved as artifact '{artifact_filename}'",
+            "artifact_saved": True,
+            "artifact_filename": artifact_filename,
+            "artifact_version": refs[0]["version"],
+            "artifact_sha256": refs[0]["sha256"],
+            "mime_type": refs[0]["mime_type"],
+            "original_bytes": len(image_bytes),
+            "variants": [
+                {key: ref.get(key) for key in ("filename", "mime_type", "width", "size_bytes")}
+                for ref in refs
+            ],
+        }
+    except Exception as save_error:
+        logger.warning(f"Failed to save artifact: {save_error}")
+        # Without the artifact no client can fetch the image, so this is a failure
+        return {
+            "status": "error",
+            "error_message": f"Infographic generated but artifact save failed: {save_error}",
+            "artifact_saved": False,
+            "mime_type": mime_type,
+        }
+
+
+async def render_infographic(context: Union[ToolContext, CallbackContext]) -> dict:
+    """Draw the infographic as SVG from state["strategic_report"] without a model call.
+
+    Args:
+        context: Tool or callback context holding the strategic report.
+
+    Returns:
+        dict: Same shape as generate_infographic's result, plus render_ms.
+    """
+    try:
+        report = context.state.get("strategic_report")
+        if not report:
+            return {"status": "error", "error_message": "No strategic report in state to render"}
+        if hasattr(report, "model_dump"):
+            report = report.model_dump()
+        report = LocationIntelligenceReport.model_validate(report)
+
+        started = time.perf_counter()
+        svg = render_infographic_svg(report, context.state.get("current_date"))
+        render_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"Rendered SVG infographic in {render_ms:.1f} ms")
+
+        result = await _save_infographic(svg.encode("utf-8"), "image/svg+xml", context)
+        result["render_ms"] = round(render_ms, 2)
+        return result
+
+    except Exception as e:
+        logger.error(f"Failed to render infographic: {e}")
+        return {
+            "status": "error",
+            "error_message": f"Failed to render infographic: {e!s}",
+        }
+
+
 async def generate_infographic(data_summary: str, tool_context: ToolContext) -> dict:
-    """Generate an infographic image using Gemini's image generation capabilities.
+    """Generate an infographic image with the image model (INFOGRAPHIC_MODE=image_model).
 
     This tool creates a professional infographic visualizing the location
-    intelligence report data using Gemini 3 Pro Image model via AI Studio.
+    intelligence report data using IMAGE_MODEL via AI Studio.
 
-    The generated image is automatically saved as an artifact named "infographic.png"
-    which can be viewed in the adk web UI.
+    The generated image is automatically saved as an artifact named after its
+    MIME type ("infographic.png" for PNG), together with WebP and thumbnail
+    variants when Pillow is installed, and can be viewed in the adk web UI.
 
     Args:
         data_summary: A concise summary of the location intelligence report
@@ -45,12 +151,6 @@ async def generate_infographic(data_summary: str, tool_context: ToolContext) ->
             - error_message: Error details (if failed)
     """
     try:
-        from google import genai
-
-        # Initialize Gemini client using AI Studio (not Vertex AI)
-        # This uses GOOGLE_API_KEY from environment automatically
-        client = genai.Client()
-
         # Create the prompt for infographic generation
         prompt = f"""Generate a professional business infographic for a location intelligence report.
 
@@ -69,30 +169,18 @@ DESIGN REQUIREMENTS:
 Create an infographic that a business executive would use in a board presentation.
 """
 
-        # Retry wrapper for handling model overload errors
-        @retry(
-            stop=stop_after_attempt(3),
-            wait=wait_exponential(multiplier=2, min=2, max=30),
-            retry=retry_if_exception_type(ServerError),
-            before_sleep=lambda retry_state: logger.warning(
-                f"Gemini API error, retrying in {retry_state.next_action.sleep} seconds... "
-                f"(attempt {retry_state.attempt_number}/3)"
+        # Generate the image with IMAGE_MODEL
+        # Awaited on the shared async client, with retries on model overload
+        response = await generate_content(
+            model=IMAGE_MODEL,
+            contents=prompt,
+            config=types.GenerateContentConfig(
+                response_modalities=["TEXT", "IMAGE"],
+                image_config=types.ImageConfig(
+                    aspect_ratio="16:9",
+                ),
             ),
         )
-        def generate_with_retry():
-            return client.models.generate_content(
-                model=IMAGE_MODEL,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_modalities=["TEXT", "IMAGE"],
-                    image_config=types.ImageConfig(
-                        aspect_ratio="16:9",
-                    ),
-                ),
-            )
-
-        # Generate the image using Gemini 3 Pro Image model
-        response = generate_with_retry()
 
         # Check for successful generation
         if response.candidates and len(response.candidates) > 0:
@@ -101,44 +189,7 @@ Create an infographic that a business executive would use in a board presentatio
                     image_bytes = part.inline_data.data
                     mime_type = part.inline_data.mime_type or "image/png"
 
-                    # Save the image directly as an artifact using tool_context
-                    # This is the recommended ADK pattern for saving binary artifacts
-                    # Note: save_artifact is async, so we must await it
-                    try:
-                        image_artifact = types.Part.from_bytes(
-                            data=image_bytes,
-                            mime_type=mime_type
-                        )
-                        artifact_filename = "infographic.png"
-                        version = await tool_context.save_artifact(
-                            filename=artifact_filename,
-                            artifact=image_artifact
-                        )
-                        logger.info(f"Saved infographic artifact: {artifact_filename} (version {version})")
-
-                        # Also store base64 in state for AG-UI frontend display
-                        b64_image = base64.b64encode(image_bytes).decode('utf-8')
-                        tool_context.state["infographic_base64"] = f"data:{mime_type};base64,{b64_image}"
-
-                        return {
-                            "status": "success",
-                            "message": f"Infographic generated and saved as artifact '{artifact_filename}'",
-                            "artifact_saved": True,
-                            "artifact_filename": artifact_filename,
-                            "artifact_version": version,
-                            "mime_type": mime_type,
-                        }
-                    except Exception as save_error:
-                        logger.warning(f"Failed to save artifact: {save_error}")
-                        # Still return success with base64 data as fallback
-                        return {
-                            "status": "success",
-                            "message": "Infographic generated but artifact save failed",
-                            "artifact_saved": False,
-                            "image_data": base64.b64encode(image_bytes).decode("utf-8"),
-                            "mime_type": mime_type,
-                            "save_error": str(save_error),
-                        }
+                    return await _save_infographic(image_bytes, mime_type, tool_context)
 
         # No image found in response
         return {
@@ -150,5 +201,5 @@ Create an infographic that a business executive would use in a board presentatio
         logger.error(f"Failed to generate infographic: {e}")
         return {
             "status": "error",
-            "error_message": f"Failed to generate infographic: {str(e)}",
+            "error_message": f"Failed to generate infographic: {e!s}",
         }
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""Infographic post-processing: optimized full-size image, WebP and thumbnails.
+
+The image model returns a large full-resolution PNG. When Pillow is
+installed (the "images" extra), a raster infographic is re-encoded as an
+optimized full-size image in its own format, a full-size WebP (unless it
+already is one) and WebP thumbnails at INFOGRAPHIC_THUMBNAIL_WIDTHS.
+Each is saved as a separate artifact so
+clients can fetch the smallest one that fits where it is shown. SVG
+infographics are already small and scale without loss. They pass through
+as the only variant, and so does everything when Pillow is not installed.
+"""
+
+import io
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    from PIL import Image
+except ImportError:  # Optional: pip install locus[images]
+    Image = None
+
+from ..config import INFOGRAPHIC_THUMBNAIL_WIDTHS, INFOGRAPHIC_WEBP_QUALITY
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+# Artifact file extension per MIME type
+EXTENSIONS = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/webp": "webp",
+    "image/gif": "gif",
+    "image/svg+xml": "svg",
+}
+
+
+def extension_for(mime_type: str) -> str:
+    """File extension for an image MIME type (e.g. "jpg" for image/jpeg)."""
+    return EXTENSIONS.get(mime_type, mime_type.rsplit("/", 1)[-1].split("+")[0])
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    """One encoding of an image; ``suffix`` is appended to the artifact name."""
+
+    suffix: str
+    data: bytes
+    mime_type: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+
+    def filename(self, stem: str) -> str:
+        return f"{stem}{self.suffix}.{extension_for(self.mime_type)}"
+
+
+def _encode(image, format: str, **options) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=format, **options)
+    return buffer.getvalue()
+
+
+def _webp(image) -> bytes:
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info or "A" in image.getbands() else "RGB")
+    return _encode(image, "WEBP", quality=INFOGRAPHIC_WEBP_QUALITY, method=4)
+
+
+def _optimized(image, mime_type: str) -> Optional[bytes]:
+    """Losslessly recompressed PNG, or a progressive JPEG; None for other formats."""
+    if mime_type == "image/png":
+        return _encode(image, "PNG", optimize=True)
+    if mime_type == "image/jpeg":
+        return _encode(image, "JPEG", quality=85, optimize=True, progressive=True)
+    return None
+
+
+def build_variants(image_bytes: bytes, mime_type: str) -> list[ImageVariant]:
+    """Full-size image first, then smaller encodings; CPU-bound, run it off the event loop."""
+    original = ImageVariant("", image_bytes, mime_type)
+    if Image is None or mime_type == "image/svg+xml":
+        return [original]
+
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            image.load()
+            width, height = image.size
+
+            full = _optimized(image, mime_type)
+            if full is None or len(full) >= len(image_bytes):
+                full = image_bytes
+            variants = [ImageVariant("", full, mime_type, width, height)]
+
+            # A WebP source is already the full-size WebP (and would share its name)
+            if mime_type != "image/webp":
+                webp = _webp(image)
+                if len(webp) < len(full):
+                    variants.append(ImageVariant("", webp, "image/webp", width, height))
+
+            for thumb_width in sorted(set(INFOGRAPHIC_THUMBNAIL_WIDTHS)):
+                if thumb_width >= width:
+                    continue
+                thumb_height = max(1, round(height * thumb_width / width))
+                thumbnail = image.resize((thumb_width, thumb_height), Image.Resampling.LANCZOS)
+                variants.append(ImageVariant(
+                    f"_{thumb_width}w", _webp(thumbnail), "image/webp", thumb_width, thumb_height
+                ))
+    except Exception as e:
+        logger.warning(f"Image post-processing failed, keeping the original: {e}")
+        return [original]
+
+    logger.info(
+        f"Infographic variants: {len(image_bytes):,} bytes -> "
+        + ", ".join(f"{v.mime_type} {v.width}px {len(v.data):,}" for v in variants)
+    )
+    return variants
@@ -0,0 +1,181 @@
+"""Local vector infographic renderer.
+
+Lays out the key metrics of a LocationIntelligenceReport (top location and
+score, competition numbers, zones analyzed, alternatives and insights) on a
+16:9 SVG template, as a fast and deterministic alternative to asking the
+image model for a raster infographic. Text is XML-escaped and wrapped to
+fixed column widths, since SVG has no automatic line breaking.
+"""
+
+import textwrap
+from datetime import datetime
+from html import escape
+from string import Template
+from typing import Optional
+
+from ..schemas.report_schema import LocationIntelligenceReport
+
+WIDTH, HEIGHT = 1600, 900
+
+_NAVY = "#1e3a8a"
+_BLUE = "#3b82f6"
+_GREEN = "#059669"
+_AMBER = "#d97706"
+_GRAY = "#6b7280"
+
+_SVG = Template("""<svg xmlns="http://www.w3.org/2000/svg" width="$width" height="$height" viewBox="0 0 $width $height" font-family="-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif">
+<title>$title</title>
+<defs>
+  <linearGradient id="band" x1="0" y1="0" x2="1" y2="1">
+    <stop offset="0" stop-color="$navy"/><stop offset="1" stop-color="$blue"/>
+  </linearGradient>
+  <linearGradient id="bar" x1="0" y1="0" x2="1" y2="0">
+    <stop offset="0" stop-color="$blue"/><stop offset="1" stop-color="#10b981"/>
+  </linearGradient>
+</defs>
+<rect width="$width" height="$height" fill="#f3f4f6"/>
+<rect width="$width" height="150" fill="url(#band)"/>
+<text x="60" y="72" font-size="40" font-weight="700" fill="#ffffff">$heading</text>
+<text x="60" y="116" font-size="22" fill="#dbeafe">Location intelligence report &#183; $analysis_date</text>
+$body
+<text x="60" y="${footer_y}" font-size="16" fill="$gray">Generated $generated_on from the structured analysis &#183; $zones zones analyzed &#183; $competitors competitors mapped</text>
+</svg>
+""")
+
+_PANEL = Template("""<rect x="$x" y="$y" width="$w" height="$h" rx="18" fill="#ffffff" stroke="#e5e7eb"/>
+<text x="${label_x}" y="${label_y}" font-size="18" font-weight="600" fill="$gray" letter-spacing="2">$label</text>""")
+
+_SCORE = Template("""<circle cx="$cx" cy="$cy" r="$r" fill="none" stroke="#e5e7eb" stroke-width="22"/>
+<circle cx="$cx" cy="$cy" r="$r" fill="none" stroke="$color" stroke-width="22" stroke-linecap="round"
+  stroke-dasharray="$dash $circumference" transform="rotate(-90 $cx $cy)"/>
+<text x="$cx" y="${score_y}" font-size="72" font-weight="700" fill="$navy" text-anchor="middle">$score</text>
+<text x="$cx" y="${caption_y}" font-size="18" fill="$gray" text-anchor="middle">out of 100</text>""")
+
+_STAT = Template("""<rect x="$x" y="$y" width="$w" height="$h" rx="12" fill="#f9fafb"/>
+<text x="${text_x}" y="${value_y}" font-size="40" font-weight="700" fill="$color">$value</text>
+<text x="${text_x}" y="${label_y}" font-size="16" fill="$gray">$label</text>""")
+
+_BAR = Template("""<text x="$x" y="$y" font-size="17" fill="#1f2937">$name</text>
+<rect x="$x" y="${bar_y}" width="$track" height="14" rx="7" fill="#e5e7eb"/>
+<rect x="$x" y="${bar_y}" width="$fill" height="14" rx="7" fill="$color"/>
+<text x="${score_x}" y="${score_y}" font-size="17" font-weight="700" fill="$navy" text-anchor="end">$score</text>""")
+
+
+def _text(value) -> str:
+    return escape(str(value if value is not None else ""))
+
+
+def _lines(
+    text: str, x: int, y: int, width_chars: int, max_lines: int,
+    size: int = 18, color: str = "#1f2937", weight: str = "400", line_height: float = 1.35,
+) -> str:
+    """A <text> element with ``text`` wrapped into at most ``max_lines`` tspans."""
+    lines = textwrap.wrap(str(text or ""), width_chars) or [""]
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        lines[-1] = textwrap.shorten(lines[-1] + " …", width_chars - 1, placeholder=" …")
+    spans = "".join(
+        f'<tspan x="{x}" dy="{0 if i == 0 else round(size * line_height)}">{_text(line)}</tspan>'
+        for i, line in enumerate(lines)
+    )
+    return f'<text x="{x}" y="{y}" font-size="{size}" font-weight="{weight}" fill="{color}">{spans}</text>'
+
+
+def _score_color(score: int) -> str:
+    return _GREEN if score >= 75 else _BLUE if score >= 50 else _AMBER
+
+
+def _panel(x: int, y: int, w: int, h: int, label: str) -> str:
+    return _PANEL.substitute(
+        x=x, y=y, w=w, h=h, label=_text(label.upper()), label_x=x + 28, label_y=y + 40, gray=_GRAY
+    )
+
+
+def render_infographic_svg(
+    report: LocationIntelligenceReport, generated_on: Optional[str] = None
+) -> str:
+    """Render the 16:9 infographic for ``report`` as a standalone SVG document."""
+    top = report.top_recommendation
+    competition = top.competition
+    parts = []
+
+    # Left: top recommendation with its score gauge
+    parts.append(_panel(60, 190, 480, 620, "Top recommendation"))
+    radius = 110
+    circumference = 2 * 3.14159265 * radius
+    parts.append(_SCORE.substitute(
+        cx=300, cy=390, r=radius,
+        dash=round(circumference * max(0, min(top.overall_score, 100)) / 100, 1),
+        circumference=round(circumference, 1),
+        color=_score_color(top.overall_score),
+        score=top.overall_score, score_y=410, caption_y=445,
+        navy=_NAVY, gray=_GRAY,
+    ))
+    y = 560
+    for text, width, max_lines, style in (
+        (top.location_name, 30, 2, {"size": 30, "color": _NAVY, "weight": "700"}),
+        (top.area, 40, 1, {"size": 20, "color": _GRAY}),
+        (f"Opportunity: {top.opportunity_type}", 40, 2, {"size": 20, "color": _GREEN, "weight": "600"}),
+        (f"Target: {top.best_customer_segment}", 44, 2, {"size": 17}),
+    ):
+        parts.append(_lines(text, 88, y, width, max_lines, **style))
+        lines = min(len(textwrap.wrap(str(text or ""), width)) or 1, max_lines)
+        y += round(lines * style["size"] * 1.35) + 16
+
+    # Middle: competition metrics
+    parts.append(_panel(580, 190, 460, 400, "Competition"))
+    stats = [
+        (f"{competition.total_competitors:,}", "competitors in zone", _NAVY),
+        (f"{competition.density_per_km2:.1f}", "per km²", _NAVY),
+        (f"{competition.avg_competitor_rating:.1f}★", "average rating", _NAVY),
+        (f"{competition.high_performers_count:,}", "rated 4.5+", _GREEN),
+        (f"{competition.chain_dominance_pct:.0f}%", "chain share", _AMBER),
+        (f"{report.total_competitors_found:,}", "found city-wide", _NAVY),
+    ]
+    for i, (value, label, color) in enumerate(stats):
+        x = 604 + (i % 2) * 210
+        y = 250 + (i // 2) * 110
+        parts.append(_STAT.substitute(
+            x=x, y=y, w=196, h=96, text_x=x + 20, value_y=y + 52, label_y=y + 80,
+            value=_text(value), label=_text(label), color=color, gray=_GRAY,
+        ))
+
+    # Middle bottom: how the shortlisted zones compare
+    parts.append(_panel(580, 620, 460, 190, "Zone scores"))
+    ranked = [(top.location_name, top.overall_score)] + [
+        (alt.location_name, alt.overall_score) for alt in report.alternative_locations
+    ]
+    for i, (name, score) in enumerate(ranked[:3]):
+        y = 704 + i * 36
+        track = 300
+        parts.append(_BAR.substitute(
+            x=608, y=y - 6, bar_y=y + 2, track=track,
+            fill=round(track * max(0, min(score, 100)) / 100), color="url(#bar)" if i == 0 else "#93c5fd",
+            name=_text(textwrap.shorten(str(name), 34, placeholder="…")),
+            score=score, score_x=1010, score_y=y + 14, navy=_NAVY,
+        ))
+
+    # Right: key insights
+    parts.append(_panel(1080, 190, 460, 620, "Key insights"))
+    y = 260
+    for insight in report.key_insights[:4]:
+        parts.append(f'<circle cx="1110" cy="{y - 6}" r="6" fill="{_BLUE}"/>')
+        parts.append(_lines(insight, 1128, y, 36, 4, size=17))
+        lines = min(len(textwrap.wrap(str(insight), 36)), 4)
+        y += lines * 23 + 30
+        if y > 760:
+            break
+
+    return _SVG.substitute(
+        width=WIDTH, height=HEIGHT, navy=_NAVY, blue=_BLUE, gray=_GRAY,
+        title=_text(f"{report.business_type} in {report.target_location}"),
+        heading=_text(textwrap.shorten(
+            f"{report.business_type} in {report.target_location}", 64, placeholder="…"
+        )),
+        analysis_date=_text(report.analysis_date),
+        body="\n".join(parts),
+        footer_y=HEIGHT - 40,
+        generated_on=_text(generated_on or datetime.now().strftime("%Y-%m-%d")),
+        zones=report.zones_analyzed,
+        competitors=report.total_competitors_found,
+    )
@@ -0,0 +1,163 @@
+"""Async Google Maps web-service client with pooled HTTP connections.
+
+One httpx.AsyncClient (and therefore one keep-alive connection pool) is
+kept per API key and event loop and reused by every tool call and session
+on that loop, instead of building a new blocking googlemaps.Client per
+search. Each
+request (including retries) is admitted by the process-wide request budget.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from ..utils.telemetry import record_retry
+from .request_budget import maps_budget
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+NEARBY_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
+
+# Statuses the web services use for transient conditions worth retrying
+RETRYABLE_STATUSES = {"OVER_QUERY_LIMIT", "UNKNOWN_ERROR"}
+
+
+class MapsApiError(Exception):
+    """A non-OK status returned by a Maps web-service endpoint."""
+
+    def __init__(self, status: str, message: str | None = None) -> None:
+        super().__init__(f"{status}: {message}" if message else status)
+        self.status = status
+        self.message = message
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, MapsApiError):
+        return exc.status in RETRYABLE_STATUSES
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _log_retry(retry_state) -> None:
+    record_retry()
+    logger.warning(
+        f"Maps API error, retrying in {retry_state.next_action.sleep} seconds... "
+        f"(attempt {retry_state.attempt_number}/3)"
+    )
+
+
+class AsyncMapsClient:
+    """Minimal async client for the Geocoding and Places Nearby Search APIs."""
+
+    def __init__(
+        self,
+        api_key: str,
+        timeout_seconds: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.api_key = api_key
+        # ``transport`` lets offline benchmarks serve canned responses
+        self._http = httpx.AsyncClient(
+            timeout=timeout_seconds,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            transport=transport,
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        return self._http.is_closed
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_exception(_is_retryable),
+        reraise=True,
+        before_sleep=lambda retry_state: _log_retry(retry_state),
+    )
+    async def _get(self, url: str, params: dict) -> dict:
+        await maps_budget.acquire(self.api_key)
+        response = await self._http.get(url, params={**params, "key": self.api_key})
+        response.raise_for_status()
+        body = response.json()
+        status = body.get("status", "UNKNOWN_ERROR")
+        if status not in ("OK", "ZERO_RESULTS"):
+            raise MapsApiError(status, body.get("error_message"))
+        return body
+
+    async def geocode(self, address: str) -> list[dict]:
+        """Geocode an address; returns the API's ``results`` list."""
+        body = await self._get(GEOCODE_URL, {"address": address})
+        return body.get("results", [])
+
+    async def places_nearby(
+        self,
+        location: dict | None = None,
+        radius: int | None = None,
+        keyword: str | None = None,
+        page_token: str | None = None,
+    ) -> dict:
+        """Run one Nearby Search request; returns the raw response body.
+
+        A ``page_token`` request must not carry any other search parameters.
+        """
+        if page_token:
+            params = {"pagetoken": page_token}
+        else:
+            params = {
+                "location": f"{location['lat']},{location['lng']}",
+                "radius": radius,
+            }
+            if keyword:
+                params["keyword"] = keyword
+        return await self._get(NEARBY_SEARCH_URL, params)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+
+# Event loop -> api_key -> client; httpx pools are bound to the loop that created them
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncMapsClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def get_maps_client(api_key: str) -> AsyncMapsClient:
+    """Return the running loop's shared client for ``api_key``, creating it on first use.
+
+    httpx connection pools are bound to the event loop that created them, so
+    each loop (the server's, batch and resume runs, each Agent Engine query
+    thread) gets its own clients. A client is never closed from another
+    loop: the loop's owner closes them with close_maps_clients, and clients
+    of loops that are gone are dropped.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = _clients.get(loop)
+        if clients is None:
+            for stale in [other for other in _clients if other.is_closed()]:
+                del _clients[stale]
+            clients = _clients[loop] = {}
+        client = clients.get(api_key)
+        if client is None or client.is_closed:
+            client = clients[api_key] = AsyncMapsClient(api_key)
+    return client
+
+
+async def close_maps_clients() -> None:
+    """Close every pooled client owned by the running event loop."""
+    with _clients_lock:
+        clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
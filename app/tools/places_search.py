@@ -75,57 +75,393 @@
 #             "count": 0,
 #         }
 
+import asyncio
+import logging
 import os
-import googlemaps
+import re
+from collections.abc import AsyncIterator
+from pathlib import Path
+
 from google.adk.tools import ToolContext
 
-def search_places(target_location: str, business_type: str, radius_meters: int = 5000, tool_context: ToolContext = None) -> dict:
+from ..config import (
+    CACHE_DIR,
+    GEOCODE_CACHE_MAX_ENTRIES,
+    GEOCODE_CACHE_TTL_SECONDS,
+    PLACES_CACHE_COORD_PRECISION,
+    PLACES_CACHE_MAX_ENTRIES,
+    PLACES_CACHE_PERSIST,
+    PLACES_CACHE_TTL_SECONDS,
+    SWEEP_MAX_TILES,
+    SWEEP_MAX_WORKERS,
+    SWEEP_TILE_RADIUS_METERS,
+)
+from ..schemas.competitor_schema import CompetitorSet
+from ..utils.cache import TTLCache
+from ..utils.geo import haversine_m, hex_tile_centers
+from .maps_client import AsyncMapsClient, MapsApiError, get_maps_client
+from .request_budget import budget_scope
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+# Nearby Search responses keyed by (rounded lat/lng, radius, keyword, pages).
+# The on-disk tier is optional (PLACES_CACHE_PERSIST).
+places_cache = TTLCache(
+    namespace="places_nearby",
+    max_entries=PLACES_CACHE_MAX_ENTRIES,
+    ttl_seconds=PLACES_CACHE_TTL_SECONDS,
+    db_path=Path(CACHE_DIR) / "maps_cache.sqlite" if PLACES_CACHE_PERSIST else None,
+)
+
+# Raw Nearby Search fields retained in the response cache
+PLACE_FIELDS = (
+    "place_id",
+    "name",
+    "vicinity",
+    "rating",
+    "user_ratings_total",
+    "price_level",
+    "business_status",
+    "types",
+)
+
+# Nearby Search returns at most 20 results per page and 3 pages per query.
+# A next_page_token only becomes valid a couple of seconds after it is issued.
+MAX_NEARBY_PAGES = 3
+PAGE_TOKEN_DELAY_SECONDS = 2.0
+PAGE_TOKEN_MAX_POLLS = 5
+
+# Geocodes of a place name practically never change, so they are cached on disk
+# and shared across runs; call geocode_cache.stats() for hit/miss counters.
+geocode_cache = TTLCache(
+    namespace="geocode",
+    max_entries=GEOCODE_CACHE_MAX_ENTRIES,
+    ttl_seconds=GEOCODE_CACHE_TTL_SECONDS,
+    db_path=Path(CACHE_DIR) / "maps_cache.sqlite",
+)
+
+
+def _normalize_location(target_location: str) -> str:
+    """Normalize free-text location so trivially different spellings share a key."""
+    text = re.sub(r"\s*,\s*", ", ", target_location.strip().lower())
+    text = re.sub(r"\s+", " ", text)
+    return text.strip(" ,.")
+
+
+async def _geocode(gmaps: AsyncMapsClient, target_location: str) -> tuple[dict | None, bool]:
+    """Resolve a location to {"lat", "lng"}, consulting the geocode cache first.
+
+    Returns:
+        tuple: (coordinates or None if not found, whether it was a cache hit)
+    """
+    key = _normalize_location(target_location)
+    cached = geocode_cache.get(key)
+    if cached is not None:
+        return cached, True
+
+    geocode_result = await gmaps.geocode(target_location)
+    if not geocode_result:
+        return None, False
+
+    location_coords = geocode_result[0]["geometry"]["location"]
+    geocode_cache.set(key, location_coords)
+    return location_coords, False
+
+
+async def stream_nearby_pages(
+    gmaps: AsyncMapsClient,
+    location: dict,
+    radius_meters: int,
+    keyword: str,
+    max_pages: int = MAX_NEARBY_PAGES,
+) -> AsyncIterator[list[dict]]:
+    """Yield Nearby Search result pages as soon as each one arrives.
+
+    Follows next_page_token for up to ``max_pages`` pages (60 results). Token
+    activation is awaited with asyncio.sleep so other sessions keep running.
+    """
+    page_token = None
+    for page_number in range(max(1, min(max_pages, MAX_NEARBY_PAGES))):
+        if page_token is None:
+            response = await gmaps.places_nearby(
+                location=location,
+                radius=radius_meters,
+                keyword=keyword,
+            )
+        else:
+            response = await _fetch_next_page(gmaps, page_token)
+
+        results = response.get("results", [])
+        logger.info(f"  Nearby Search '{keyword}' page {page_number + 1}: {len(results)} results")
+        yield results
+
+        page_token = response.get("next_page_token")
+        if not page_token:
+            return
+
+
+async def _fetch_next_page(gmaps: AsyncMapsClient, page_token: str) -> dict:
+    """Fetch a follow-up page, polling until the page token is activated."""
+    for _ in range(PAGE_TOKEN_MAX_POLLS - 1):
+        await asyncio.sleep(PAGE_TOKEN_DELAY_SECONDS)
+        try:
+            return await gmaps.places_nearby(page_token=page_token)
+        except MapsApiError as e:
+            # INVALID_REQUEST means the token is not live yet
+            if e.status != "INVALID_REQUEST":
+                raise
+    # Last poll: any error, including a token that never went live, propagates
+    await asyncio.sleep(PAGE_TOKEN_DELAY_SECONDS)
+    return await gmaps.places_nearby(page_token=page_token)
+
+
+def _slim_place(place: dict) -> dict:
+    """Keep only the Nearby Search fields the pipeline uses (photos etc. dropped)."""
+    slim = {field: place[field] for field in PLACE_FIELDS if field in place}
+    location = place.get("geometry", {}).get("location")
+    if location:
+        slim["geometry"] = {"location": location}
+    return slim
+
+
+def _nearby_cache_key(location: dict, radius_meters: int, keyword: str, max_pages: int) -> str:
+    return "|".join([
+        f"{location['lat']:.{PLACES_CACHE_COORD_PRECISION}f}",
+        f"{location['lng']:.{PLACES_CACHE_COORD_PRECISION}f}",
+        str(int(radius_meters)),
+        _normalize_location(keyword),
+        str(max_pages),
+    ])
+
+
+async def _collect_nearby(
+    gmaps: AsyncMapsClient,
+    location: dict,
+    radius_meters: int,
+    keyword: str,
+    max_pages: int,
+) -> tuple[list[dict], int, bool]:
+    """Drain stream_nearby_pages into a list of places, via the response cache.
+
+    The search center is snapped to the cache grid (PLACES_CACHE_COORD_PRECISION
+    decimals) so a cached entry always matches the query that produced it.
+
+    Returns:
+        tuple: (slimmed raw places, pages fetched from the API, cache hit)
+    """
+    location = {
+        "lat": round(location["lat"], PLACES_CACHE_COORD_PRECISION),
+        "lng": round(location["lng"], PLACES_CACHE_COORD_PRECISION),
+    }
+    key = _nearby_cache_key(location, radius_meters, keyword, max_pages)
+    cached = places_cache.get(key)
+    if cached is not None:
+        return cached, 0, True
+
+    places = []
+    pages_fetched = 0
+    async for page in stream_nearby_pages(
+        gmaps,
+        location=location,
+        radius_meters=radius_meters,
+        keyword=keyword,
+        max_pages=max_pages,
+    ):
+        pages_fetched += 1
+        places.extend(_slim_place(place) for place in page)
+
+    places_cache.set(key, places)
+    return places, pages_fetched, False
+
+
+def _sweep_tiles(location: dict, radius_meters: int) -> tuple[list[tuple[float, float]], float]:
+    """Pick hex sub-centers covering the radius within the SWEEP_MAX_TILES budget."""
+    tile_radius = float(SWEEP_TILE_RADIUS_METERS)
+    while True:
+        tiles = hex_tile_centers(location["lat"], location["lng"], radius_meters, tile_radius)
+        if len(tiles) <= SWEEP_MAX_TILES:
+            return tiles, tile_radius
+        tile_radius *= 1.25
+
+
+async def _sweep_nearby(
+    gmaps: AsyncMapsClient,
+    location: dict,
+    radius_meters: int,
+    keyword: str,
+    max_pages: int,
+) -> tuple[list[dict], int, int, int]:
+    """Query every sweep tile concurrently and merge results by place_id.
+
+    Returns:
+        tuple: (deduplicated places inside the radius, tiles queried,
+            pages fetched from the API, tiles served from cache)
+    """
+    tiles, tile_radius = _sweep_tiles(location, radius_meters)
+    semaphore = asyncio.Semaphore(SWEEP_MAX_WORKERS)
+    logger.info(
+        f"  Sweep search '{keyword}': {len(tiles)} tiles of {tile_radius:.0f}m "
+        f"(max {SWEEP_MAX_WORKERS} concurrent)"
+    )
+
+    async def query_tile(lat: float, lng: float) -> tuple[list[dict], int, bool]:
+        async with semaphore:
+            return await _collect_nearby(
+                gmaps,
+                location={"lat": lat, "lng": lng},
+                radius_meters=int(tile_radius),
+                keyword=keyword,
+                max_pages=max_pages,
+            )
+
+    tile_results = await asyncio.gather(*(query_tile(lat, lng) for lat, lng in tiles))
+
+    # Dedup index: tiles overlap by design, so the same place_id shows up repeatedly
+    index: dict[str, dict] = {}
+    pages_fetched = 0
+    cache_hits = 0
+    for places, pages, cached in tile_results:
+        pages_fetched += pages
+        cache_hits += cached
+        for place in places:
+            place_id = place.get("place_id") or f"{place.get('name')}|{place.get('vicinity')}"
+            if place_id in index:
+                continue
+            coords = place.get("geometry", {}).get("location")
+            if coords and haversine_m(
+                location["lat"], location["lng"], coords["lat"], coords["lng"]
+            ) > radius_meters:
+                continue
+            index[place_id] = place
+
+    return list(index.values()), len(tiles), pages_fetched, cache_hits
+
+
+async def _search_keyword(
+    gmaps: AsyncMapsClient,
+    location: dict,
+    radius_meters: int,
+    keyword: str,
+    max_pages: int,
+    sweep: bool,
+) -> dict:
+    """Run one keyword search (single center or sweep) into a CompetitorSet."""
+    tiles_queried = 1
+    if sweep:
+        raw_places, tiles_queried, pages_fetched, cache_hits = await _sweep_nearby(
+            gmaps, location, radius_meters, keyword, max_pages
+        )
+    else:
+        raw_places, pages_fetched, cached = await _collect_nearby(
+            gmaps, location, radius_meters, keyword, max_pages
+        )
+        cache_hits = int(cached)
+
+    places = CompetitorSet.from_places(raw_places, keyword, location, radius_meters)
+    return {
+        "places": places,
+        "count": len(places),
+        "pages_fetched": pages_fetched,
+        "tiles_queried": tiles_queried,
+        "from_cache": cache_hits == tiles_queried,
+        "cache_hits": cache_hits,
+    }
+
+
+def _payload(search: dict) -> dict:
+    """Serialize a keyword search result for the tool response."""
+    return {**search, "places": search["places"].model_dump(exclude={"center_lat", "center_lng"})}
+
+
+async def search_places(
+    target_location: str,
+    business_type: str,
+    radius_meters: int = 5000,
+    all_pages: bool = False,
+    sweep: bool = False,
+    complementary_types: list[str] | None = None,
+    tool_context: ToolContext = None,
+) -> dict:
     """SOTA Nearby Search: Geocodes location and finds competitors in a radius.
     
     Args:
         target_location: The area to analyze (e.g., 'Noonmati, Guwahati').
         business_type: The primary industry (e.g., 'gym', 'cafe').
         radius_meters: Search radius (default 5km for urban areas).
+        all_pages: Follow pagination to return up to 60 results instead of 20.
+            Use for dense urban areas so one call captures the full landscape.
+        sweep: Cover the radius with a grid of smaller overlapping searches and
+            merge them, for full coverage of large radii in dense cities.
+        complementary_types: Related business categories to search in the same
+            area (e.g., ['sports nutrition', 'yoga studio'] for a gym). They are
+            searched concurrently with business_type.
+
+    Returns:
+        dict: A dictionary containing:
+            - status: "success" or "error"
+            - places: Parallel arrays (ids, names, addresses, lat, lng, rating,
+              reviews, price_level, status, type_mask); index i is one business
+            - count: Number of places found
+            - complementary: Same payload per complementary type (if requested)
+            - center_coords, geocode_cached, from_cache: Search metadata
     """
     try:
         maps_api_key = tool_context.state.get("maps_api_key", "") or os.environ.get("MAPS_API_KEY", "")
         if not maps_api_key:
             return {"status": "error", "error_message": "Maps API key missing."}
 
-        gmaps = googlemaps.Client(key=maps_api_key)
-
-        # Step 1: Geocode the location to get Lat/Lng coordinates
-        geocode_result = gmaps.geocode(target_location)
-        if not geocode_result:
-            return {"status": "error", "error_message": f"Could not find location: {target_location}"}
-        
-        location_coords = geocode_result[0]["geometry"]["location"]
-
-        # Step 2: Perform Nearby Search (More accurate than text search)
-        # We use 'keyword' to catch relevant businesses by name/description
-        result = gmaps.places_nearby(
-            location=location_coords,
-            radius=radius_meters,
-            keyword=business_type
-        )
+        # Charge every Maps request below (across gathered tasks) to this session
+        with budget_scope(tool_context.session.id):
+            # Shared, connection-pooled client for this key
+            gmaps = get_maps_client(maps_api_key)
+
+            # Step 1: Geocode the location to get Lat/Lng coordinates (cached)
+            location_coords, geocode_cached = await _geocode(gmaps, target_location)
+            if not location_coords:
+                return {"status": "error", "error_message": f"Could not find location: {target_location}"}
+
+            # Step 2: Perform Nearby Search (More accurate than text search)
+            # We use 'keyword' to catch relevant businesses by name/description.
+            # Direct and complementary keywords are searched concurrently.
+            max_pages = MAX_NEARBY_PAGES if all_pages else 1
+            keywords = [business_type] + [
+                kw for kw in dict.fromkeys(complementary_types or []) if kw and kw != business_type
+            ]
+            searches = await asyncio.gather(
+                *(
+                    _search_keyword(gmaps, location_coords, radius_meters, kw, max_pages, sweep)
+                    for kw in keywords
+                ),
+                return_exceptions=True,
+            )
+
+            direct = searches[0]
+            if isinstance(direct, BaseException):
+                raise direct
+
+            # Keep every place found this session as one typed columnar set in
+            # state, so downstream stages can compute spatial metrics directly
+            competitor_places = CompetitorSet.from_state(tool_context.state).merge(direct["places"])
+
+            complementary = {}
+            for kw, search in zip(keywords[1:], searches[1:], strict=True):
+                if isinstance(search, BaseException):
+                    complementary[kw] = {"status": "error", "error_message": str(search)}
+                else:
+                    competitor_places = competitor_places.merge(search["places"])
+                    complementary[kw] = {"status": "success", **_payload(search)}
+
+            tool_context.state["competitor_places"] = competitor_places.model_dump()
 
-        places = []
-        for place in result.get("results", []):
-            places.append({
-                "name": place.get("name"),
-                "address": place.get("vicinity"),
-                "rating": place.get("rating", 0),
-                "user_ratings_total": place.get("user_ratings_total", 0),
-                "business_status": place.get("business_status"),
-                "types": place.get("types", [])
-            })
-
-        return {
-            "status": "success",
-            "results": places,
-            "count": len(places),
-            "center_coords": location_coords
-        }
+            result = {
+                "status": "success",
+                **_payload(direct),
+                "center_coords": location_coords,
+                "geocode_cached": geocode_cached,
+            }
+            if complementary:
+                result["complementary"] = complementary
+            return result
 
     except Exception as e:
-        return {"status": "error", "error_message": str(e)}
\ No newline at end of file
+        return {"status": "error", "error_message": str(e)}
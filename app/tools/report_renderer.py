@@ -0,0 +1,317 @@
+"""Deterministic HTML renderer for the executive report.
+
+Builds the same 7-slide McKinsey/BCG style deck that generate_html_report
+asks Gemini for, directly from a LocationIntelligenceReport: precompiled
+string templates, embedded CSS, no scripts and no external resources.
+Rendering takes milliseconds and the layout is identical from run to run.
+Every value from the report is HTML-escaped.
+"""
+
+from datetime import datetime
+from html import escape
+from string import Template
+from typing import Iterable, Optional
+
+from ..schemas.report_schema import LocationIntelligenceReport
+
+_CSS = """
+* { box-sizing: border-box; margin: 0; padding: 0; }
+html { scroll-behavior: smooth; }
+body {
+  font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
+  color: #1f2937; background: #f3f4f6; line-height: 1.55;
+}
+.slide {
+  min-height: 100vh; padding: 64px 8vw; page-break-after: always; break-after: page;
+  display: flex; flex-direction: column; justify-content: center; background: #ffffff;
+  border-bottom: 1px solid #e5e7eb;
+}
+.slide-number { color: #6b7280; font-size: 0.8rem; letter-spacing: 0.12em; text-transform: uppercase; }
+h1 { font-size: 2.6rem; color: #1e3a8a; margin: 8px 0 16px; line-height: 1.15; }
+h2 { font-size: 2rem; color: #1e3a8a; margin: 8px 0 28px; }
+h3 { font-size: 1.05rem; color: #1e3a8a; margin-bottom: 8px; }
+p { margin-bottom: 10px; }
+.muted { color: #6b7280; }
+.hero { background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 100%); color: #ffffff; }
+.hero h1, .hero .slide-number, .hero .muted { color: #ffffff; }
+.hero .muted { opacity: 0.85; }
+.score-ring {
+  width: 150px; height: 150px; border-radius: 50%; margin: 24px 0;
+  display: flex; flex-direction: column; align-items: center; justify-content: center;
+  background: #ffffff; color: #1e3a8a; box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
+}
+.score-ring strong { font-size: 3rem; line-height: 1; }
+.score-ring span { font-size: 0.8rem; color: #6b7280; }
+.grid { display: grid; gap: 20px; grid-template-columns: repeat(auto-fit, minmax(240px, 1fr)); }
+.card {
+  background: #ffffff; border: 1px solid #e5e7eb; border-radius: 12px; padding: 20px 22px;
+  box-shadow: 0 2px 8px rgba(15, 23, 42, 0.06);
+}
+.hero .card { background: rgba(255, 255, 255, 0.12); border-color: rgba(255, 255, 255, 0.25); color: #ffffff; }
+.card.good { border-top: 4px solid #059669; }
+.card.warn { border-top: 4px solid #d97706; }
+.label { font-size: 0.75rem; color: #6b7280; text-transform: uppercase; letter-spacing: 0.08em; }
+.hero .label { color: #dbeafe; }
+.stat { font-size: 2.2rem; font-weight: 700; color: #1e3a8a; }
+.hero .stat { color: #ffffff; }
+.evidence { font-size: 0.9rem; color: #374151; background: #f9fafb; border-radius: 8px; padding: 10px 12px; }
+.mitigation { font-size: 0.9rem; color: #065f46; background: #ecfdf5; border-radius: 8px; padding: 10px 12px; }
+.columns { display: grid; gap: 32px; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); }
+.stack > * + * { margin-top: 16px; }
+.pill {
+  display: inline-block; padding: 3px 12px; border-radius: 999px; font-size: 0.8rem; font-weight: 600;
+  background: #dbeafe; color: #1e3a8a;
+}
+.level-low { background: #e5e7eb; color: #374151; }
+.level-medium { background: #fef3c7; color: #92400e; }
+.level-high { background: #d1fae5; color: #065f46; }
+.bar { height: 8px; border-radius: 999px; background: #e5e7eb; overflow: hidden; margin-top: 10px; }
+.bar > div { height: 100%; background: linear-gradient(90deg, #3b82f6, #10b981); }
+.bar.amber > div { background: linear-gradient(90deg, #f59e0b, #d97706); }
+ul.insights { list-style: none; }
+ul.insights li {
+  padding: 12px 16px; margin-bottom: 10px; border-left: 4px solid #3b82f6; background: #f9fafb; border-radius: 6px;
+}
+ol.steps { padding-left: 22px; }
+ol.steps li { padding: 6px 0 6px 6px; }
+footer { margin-top: 32px; font-size: 0.8rem; color: #6b7280; }
+@media print {
+  body { background: #ffffff; }
+  .slide { min-height: auto; border: none; }
+}
+"""
+
+_PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>$title</title>
+<style>$css</style>
+</head>
+<body>
+$slides
+</body>
+</html>
+""")
+
+_SLIDE = Template("""<section class="slide$extra_class" id="slide-$number">
+<div class="slide-number">$number / 7 &middot; $section</div>
+$body
+</section>""")
+
+_EXECUTIVE_SUMMARY = Template("""<h1>$business_type in $target_location</h1>
+<p class="muted">Location intelligence report &middot; $analysis_date</p>
+<div class="columns">
+  <div>
+    <div class="label">Top recommendation</div>
+    <h2 style="color:#ffffff;margin-bottom:4px">$location_name</h2>
+    <p class="muted">$area &middot; <span class="pill">$opportunity_type</span></p>
+    <div class="score-ring"><strong>$score</strong><span>out of 100</span></div>
+  </div>
+  <div class="stack">
+    <div class="card"><div class="label">Market validation</div><p>$market_validation</p></div>
+    <div class="grid">
+      <div class="card"><div class="label">Competitors found</div><div class="stat">$total_competitors</div></div>
+      <div class="card"><div class="label">Zones analyzed</div><div class="stat">$zones_analyzed</div></div>
+    </div>
+  </div>
+</div>""")
+
+_STRENGTH = Template("""<div class="card good">
+  <h3>$factor</h3>
+  <p>$description</p>
+  <div class="evidence"><strong>Evidence:</strong> $evidence</div>
+</div>""")
+
+_CONCERN = Template("""<div class="card warn">
+  <h3>$risk</h3>
+  <p>$description</p>
+  <div class="mitigation"><strong>Mitigation:</strong> $mitigation</div>
+</div>""")
+
+_RECOMMENDATION_DETAILS = Template("""<h2>$location_name: why it wins</h2>
+<div class="grid" style="margin-bottom:28px">
+  <div class="card"><div class="label">Opportunity type</div><p><span class="pill">$opportunity_type</span></p></div>
+  <div class="card"><div class="label">Best customer segment</div><p>$customer_segment</p></div>
+  <div class="card"><div class="label">Estimated foot traffic</div><p>$foot_traffic</p></div>
+</div>
+<div class="columns">
+  <div class="stack"><h3>Strengths</h3>$strengths</div>
+  <div class="stack"><h3>Concerns &amp; mitigation</h3>$concerns</div>
+</div>""")
+
+_STAT_CARD = Template("""<div class="card">
+  <div class="label">$label</div>
+  <div class="stat">$value</div>
+  $extra
+</div>""")
+
+_COMPETITION = Template("""<h2>Competition in $location_name</h2>
+<div class="grid">$cards</div>""")
+
+_MARKET_CARD = Template("""<div class="card">
+  <div class="label">$label</div>
+  <p>$value</p>
+</div>""")
+
+_MARKET = Template("""<h2>Market characteristics</h2>
+<div class="grid">$cards</div>""")
+
+_ALTERNATIVE = Template("""<div class="card">
+  <div class="label">$area</div>
+  <h3>$location_name</h3>
+  <p><span class="pill">$opportunity_type</span> &nbsp;<strong>$score</strong>/100</p>
+  <div class="bar"><div style="width:$score%"></div></div>
+  <p style="margin-top:14px"><strong>Strength:</strong> $key_strength</p>
+  <p><strong>Concern:</strong> $key_concern</p>
+  <p class="muted"><strong>Why not top:</strong> $why_not_top</p>
+</div>""")
+
+_ALTERNATIVES = Template("""<h2>Alternative locations</h2>
+<div class="grid">$cards</div>""")
+
+_INSIGHTS = Template("""<h2>Key insights &amp; next steps</h2>
+<div class="columns">
+  <div><h3>Strategic insights</h3><ul class="insights">$insights</ul></div>
+  <div><h3>Next steps</h3><ol class="steps">$next_steps</ol></div>
+</div>""")
+
+_METHODOLOGY = Template("""<h2>Methodology</h2>
+<div class="card"><p>$methodology</p></div>
+<footer>Generated on $generated_on from the structured location intelligence report.</footer>""")
+
+
+def _text(value) -> str:
+    return escape(str(value if value is not None else ""))
+
+
+def _number(value: float, digits: int = 1) -> str:
+    return f"{value:,.{digits}f}".rstrip("0").rstrip(".") if digits else f"{value:,.0f}"
+
+
+def _level(value: str) -> str:
+    """Text for Low/Medium/High fields, as a colored pill when it is one of them."""
+    level = str(value).strip().lower()
+    if level in ("low", "medium", "high"):
+        return f'<span class="pill level-{level}">{_text(value)}</span>'
+    return _text(value)
+
+
+def _items(tag: str, values: Iterable[str]) -> str:
+    return "".join(f"<{tag}>{_text(value)}</{tag}>" for value in values)
+
+
+def _slides(report: LocationIntelligenceReport, generated_on: str) -> Iterable[tuple[str, str, str]]:
+    """(section title, extra CSS class, body) for each of the 7 slides."""
+    top = report.top_recommendation
+    competition = top.competition
+    market = top.market
+
+    yield "Executive summary", " hero", _EXECUTIVE_SUMMARY.substitute(
+        business_type=_text(report.business_type),
+        target_location=_text(report.target_location),
+        analysis_date=_text(report.analysis_date),
+        location_name=_text(top.location_name),
+        area=_text(top.area),
+        opportunity_type=_text(top.opportunity_type),
+        score=top.overall_score,
+        market_validation=_text(report.market_validation),
+        total_competitors=report.total_competitors_found,
+        zones_analyzed=report.zones_analyzed,
+    )
+
+    yield "Top recommendation", "", _RECOMMENDATION_DETAILS.substitute(
+        location_name=_text(top.location_name),
+        opportunity_type=_text(top.opportunity_type),
+        customer_segment=_text(top.best_customer_segment),
+        foot_traffic=_text(top.estimated_foot_traffic),
+        strengths="".join(
+            _STRENGTH.substitute(
+                factor=_text(s.factor),
+                description=_text(s.description),
+                evidence=_text(s.evidence_from_analysis),
+            )
+            for s in top.strengths
+        ) or '<p class="muted">No strengths recorded.</p>',
+        concerns="".join(
+            _CONCERN.substitute(
+                risk=_text(c.risk),
+                description=_text(c.description),
+                mitigation=_text(c.mitigation_strategy),
+            )
+            for c in top.concerns
+        ) or '<p class="muted">No concerns recorded.</p>',
+    )
+
+    chain_pct = max(0.0, min(competition.chain_dominance_pct, 100.0))
+    stat_cards = [
+        ("Total competitors", _number(competition.total_competitors, 0), ""),
+        ("Density per km²", _number(competition.density_per_km2), ""),
+        (
+            "Chain dominance",
+            f"{_number(competition.chain_dominance_pct)}%",
+            f'<div class="bar amber"><div style="width:{chain_pct:.0f}%"></div></div>',
+        ),
+        ("Average rating", f"{competition.avg_competitor_rating:.1f} ★", ""),
+        ("High performers (4.5+)", _number(competition.high_performers_count, 0), ""),
+    ]
+    yield "Competition analysis", "", _COMPETITION.substitute(
+        location_name=_text(top.location_name),
+        cards="".join(
+            _STAT_CARD.substitute(label=label, value=value, extra=extra)
+            for label, value, extra in stat_cards
+        ),
+    )
+
+    market_cards = [
+        ("Population density", _level(market.population_density)),
+        ("Income level", _level(market.income_level)),
+        ("Rental cost tier", _level(market.rental_cost_tier)),
+        ("Infrastructure access", _text(market.infrastructure_access)),
+        ("Foot traffic pattern", _text(market.foot_traffic_pattern)),
+    ]
+    yield "Market characteristics", "", _MARKET.substitute(
+        cards="".join(_MARKET_CARD.substitute(label=label, value=value) for label, value in market_cards),
+    )
+
+    yield "Alternatives", "", _ALTERNATIVES.substitute(
+        cards="".join(
+            _ALTERNATIVE.substitute(
+                area=_text(alt.area),
+                location_name=_text(alt.location_name),
+                opportunity_type=_text(alt.opportunity_type),
+                score=alt.overall_score,
+                key_strength=_text(alt.key_strength),
+                key_concern=_text(alt.key_concern),
+                why_not_top=_text(alt.why_not_top),
+            )
+            for alt in report.alternative_locations
+        ) or '<p class="muted">No alternative locations were shortlisted.</p>',
+    )
+
+    yield "Insights & next steps", "", _INSIGHTS.substitute(
+        insights=_items("li", report.key_insights),
+        next_steps=_items("li", top.next_steps),
+    )
+
+    yield "Methodology", "", _METHODOLOGY.substitute(
+        methodology=_text(report.methodology_summary),
+        generated_on=_text(generated_on),
+    )
+
+
+def render_report_html(
+    report: LocationIntelligenceReport, generated_on: Optional[str] = None
+) -> str:
+    """Render the 7-slide executive deck for ``report`` as a self-contained HTML page."""
+    generated_on = generated_on or datetime.now().strftime("%Y-%m-%d")
+    slides = "\n".join(
+        _SLIDE.substitute(number=number, section=escape(section), extra_class=extra_class, body=body)
+        for number, (section, extra_class, body) in enumerate(_slides(report, generated_on), start=1)
+    )
+    return _PAGE.substitute(
+        title=_text(f"{report.business_type} in {report.target_location}: Location Intelligence Report"),
+        css=_CSS,
+        slides=slides,
+    )
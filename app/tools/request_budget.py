@@ -0,0 +1,307 @@
+"""Process-wide request budget for the Google Maps web services.
+
+Every Maps HTTP request in the process passes through one RequestBudgeter:
+
+- A token bucket per API key bounds the request rate (MAPS_RATE_LIMIT_QPS,
+  bursting up to MAPS_RATE_LIMIT_BURST).
+- When a bucket is empty, requests wait in a queue instead of failing. The
+  queue is served round-robin across sessions, so one session sweeping a
+  large city cannot starve the others.
+- Each session may issue at most MAPS_SESSION_REQUEST_CAP requests, no
+  matter how many search_places calls its agents decide to make.
+
+The session a request belongs to is carried in a context variable that
+search_places sets via budget_scope(); it propagates into gathered tasks.
+
+Token state is shared by every thread and event loop in the process and
+guarded by a lock. Futures and tasks are bound to their event loop, so each
+loop (the server's, batch and resume runs, Agent Engine query threads) has
+its own wait queue and dispatcher drawing from the shared bucket.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from ..config import (
+    MAPS_QUEUE_TIMEOUT_SECONDS,
+    MAPS_RATE_LIMIT_BURST,
+    MAPS_RATE_LIMIT_QPS,
+    MAPS_SESSION_REQUEST_CAP,
+)
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+# Session the current Maps request is charged to
+_current_session: ContextVar[str] = ContextVar("maps_budget_session", default="default")
+
+# Per-session request counts kept for at most this many recent sessions
+_MAX_TRACKED_SESSIONS = 4096
+
+
+class BudgetExceededError(Exception):
+    """A Maps request was refused by the request budget."""
+
+
+@contextmanager
+def budget_scope(session_id: str | None) -> Iterator[None]:
+    """Charge Maps requests made inside the block to ``session_id``."""
+    token = _current_session.set(session_id or "default")
+    try:
+        yield
+    finally:
+        _current_session.reset(token)
+
+
+class _LoopQueue:
+    """Fair wait queue of one event loop for one API key; only used on that loop."""
+
+    def __init__(self) -> None:
+        # session_id -> waiting futures; order of keys is the round-robin order
+        self.waiters: OrderedDict[str, deque[asyncio.Future]] = OrderedDict()
+        self.dispatcher: asyncio.Task | None = None
+
+    def queue_depth(self) -> int:
+        return sum(len(queue) for queue in self.waiters.values())
+
+    def discard(self, session_id: str, future: asyncio.Future) -> None:
+        """Drop an abandoned waiter (timed out or cancelled)."""
+        queue = self.waiters.get(session_id)
+        if queue is not None and future in queue:
+            queue.remove(future)
+            if not queue:
+                del self.waiters[session_id]
+
+    def next_waiter(self) -> asyncio.Future | None:
+        """Pop the next live waiter, rotating sessions round-robin."""
+        while self.waiters:
+            session_id, queue = next(iter(self.waiters.items()))
+            future = queue.popleft()
+            if queue:
+                self.waiters.move_to_end(session_id)
+            else:
+                del self.waiters[session_id]
+            if not future.done():
+                return future
+        return None
+
+
+class _KeyBucket:
+    """Token bucket for one API key, shared by every thread and event loop."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        # Guards the tokens and the set of queues; each queue's contents
+        # are also only changed under it so stats() can read them
+        self.lock = threading.Lock()
+        self.queues: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopQueue] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self) -> float:
+        """Take a token if one is available; else the seconds until one is."""
+        self.refill()
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+    def queue_for(self, loop: asyncio.AbstractEventLoop) -> _LoopQueue:
+        queue = self.queues.get(loop)
+        if queue is None:
+            # Queues of loops that have shut down can never be served
+            for stale in [other for other in self.queues if other.is_closed()]:
+                del self.queues[stale]
+            queue = self.queues[loop] = _LoopQueue()
+        return queue
+
+    def queue_depth(self) -> int:
+        return sum(queue.queue_depth() for queue in self.queues.values())
+
+    def sessions_waiting(self) -> int:
+        return sum(len(queue.waiters) for queue in self.queues.values())
+
+
+class RequestBudgeter:
+    """Token-bucket rate limiting per key with fair queuing and session caps."""
+
+    def __init__(
+        self,
+        rate_per_second: float = MAPS_RATE_LIMIT_QPS,
+        burst: int = MAPS_RATE_LIMIT_BURST,
+        session_cap: int = MAPS_SESSION_REQUEST_CAP,
+        queue_timeout_seconds: float = MAPS_QUEUE_TIMEOUT_SECONDS,
+    ) -> None:
+        """
+        :param rate_per_second: Sustained requests per second per API key.
+        :param burst: Bucket capacity, i.e. requests allowed back to back.
+        :param session_cap: Maximum requests per session (0 disables the cap).
+        :param queue_timeout_seconds: Longest a request may wait for a token.
+        """
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self.session_cap = session_cap
+        self.queue_timeout_seconds = queue_timeout_seconds
+
+        self._buckets: dict[str, _KeyBucket] = {}
+        self._session_requests: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._granted = 0
+        self._throttled = 0
+        self._rejected_cap = 0
+        self._rejected_timeout = 0
+        self._max_queue_depth = 0
+        self._wait_seconds = 0.0
+
+    def _bucket(self, api_key: str) -> _KeyBucket:
+        with self._lock:
+            bucket = self._buckets.get(api_key)
+            if bucket is None:
+                bucket = self._buckets[api_key] = _KeyBucket(self.rate_per_second, self.burst)
+            return bucket
+
+    def _charge_session(self, session_id: str) -> None:
+        with self._lock:
+            used = self._session_requests.pop(session_id, 0)
+            if self.session_cap and used >= self.session_cap:
+                self._session_requests[session_id] = used
+                self._rejected_cap += 1
+                raise BudgetExceededError(
+                    f"Maps request cap of {self.session_cap} reached for this session"
+                )
+            self._session_requests[session_id] = used + 1
+            while len(self._session_requests) > _MAX_TRACKED_SESSIONS:
+                self._session_requests.popitem(last=False)
+
+    def _refund_session(self, session_id: str) -> None:
+        with self._lock:
+            if self._session_requests.get(session_id):
+                self._session_requests[session_id] -= 1
+
+    async def acquire(self, api_key: str) -> None:
+        """Wait until a request with ``api_key`` may be sent.
+
+        Raises:
+            BudgetExceededError: The session cap is reached, or no token
+                became available within the queue timeout.
+        """
+        session_id = _current_session.get()
+        self._charge_session(session_id)
+
+        bucket = self._bucket(api_key)
+        loop = asyncio.get_running_loop()
+        queue = future = None
+        with bucket.lock:
+            # Queued requests on any loop are served before new arrivals
+            depth = bucket.queue_depth()
+            if depth or bucket.take() > 0.0:
+                queue = bucket.queue_for(loop)
+                future = loop.create_future()
+                queue.waiters.setdefault(session_id, deque()).append(future)
+                depth += 1
+        if queue is None or future is None:
+            with self._lock:
+                self._granted += 1
+            return
+
+        with self._lock:
+            self._throttled += 1
+            self._max_queue_depth = max(self._max_queue_depth, depth)
+        if queue.dispatcher is None or queue.dispatcher.done():
+            queue.dispatcher = loop.create_task(self._dispatch(bucket, queue))
+
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(future, timeout=self.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._rejected_timeout += 1
+            self._refund_session(session_id)
+            with bucket.lock:
+                queue.discard(session_id, future)
+            raise BudgetExceededError(
+                f"Maps quota exhausted; no request slot within {self.queue_timeout_seconds:g}s"
+            ) from None
+        except BaseException:
+            self._refund_session(session_id)
+            with bucket.lock:
+                queue.discard(session_id, future)
+            raise
+        finally:
+            with self._lock:
+                self._wait_seconds += time.monotonic() - started
+        with self._lock:
+            self._granted += 1
+
+    async def _dispatch(self, bucket: _KeyBucket, queue: _LoopQueue) -> None:
+        """Hand out tokens to one loop's queued requests as the bucket refills."""
+        while True:
+            with bucket.lock:
+                if not queue.waiters:
+                    return
+                delay = bucket.take()
+                future = None
+                if not delay:
+                    future = queue.next_waiter()
+                    if future is None:
+                        # Every waiter was abandoned; return the token
+                        bucket.tokens += 1.0
+                        return
+            if future is None:
+                await asyncio.sleep(delay)
+            else:
+                future.set_result(None)
+
+    def session_requests(self, session_id: str) -> int:
+        """Requests charged to ``session_id`` so far."""
+        with self._lock:
+            return self._session_requests.get(session_id, 0)
+
+    def stats(self) -> dict:
+        """Counters for operators: throughput, throttling and queue depth."""
+        keys = {}
+        with self._lock:
+            buckets = list(self._buckets.values())
+        for i, bucket in enumerate(buckets):
+            with bucket.lock:
+                bucket.refill()
+                # API keys are secrets; report buckets by position only
+                keys[f"key_{i}"] = {
+                    "tokens_available": round(bucket.tokens, 2),
+                    "queue_depth": bucket.queue_depth(),
+                    "sessions_waiting": bucket.sessions_waiting(),
+                }
+        with self._lock:
+            sessions_tracked = len(self._session_requests)
+        return {
+            "rate_per_second": self.rate_per_second,
+            "burst": self.burst,
+            "session_cap": self.session_cap,
+            "granted": self._granted,
+            "throttled": self._throttled,
+            "rejected_session_cap": self._rejected_cap,
+            "rejected_timeout": self._rejected_timeout,
+            "queue_depth": sum(key["queue_depth"] for key in keys.values()),
+            "max_queue_depth": self._max_queue_depth,
+            "total_wait_seconds": round(self._wait_seconds, 3),
+            "sessions_tracked": sessions_tracked,
+            "keys": keys,
+        }
+
+
+# Shared by every session in the process
+maps_budget = RequestBudgeter()
@@ -0,0 +1,132 @@
+"""Artifact references kept in session state instead of artifact bytes.
+
+The HTML report and the infographic are saved with save_artifact; session
+state only records where to find them (app, user, session, filename and
+version) plus their MIME type, size and SHA-256. State snapshots, AG-UI
+state syncs and persisted sessions then carry a few hundred bytes per
+deliverable instead of the whole document, and clients fetch the bytes on
+demand (the AG-UI backend serves them at /artifacts/{session_id}/{filename}).
+
+Saves are deduplicated by content: the reference to the latest version of
+each filename is kept in state under ``artifact_ref:<filename>``, and saving
+bytes with the same SHA-256 returns that reference instead of uploading a
+new, identical version (cached and re-run stages produce the same report
+JSON, deck and infographic).
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Any, Optional, Union
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.artifacts import BaseArtifactService
+from google.adk.tools import ToolContext
+from google.genai import types
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+# State keys holding the references to the pipeline's deliverables
+HTML_REPORT_REF_KEY = "html_report_artifact"
+INFOGRAPHIC_REF_KEY = "infographic_artifact"
+# Every saved encoding of the infographic (full size first, then WebP and thumbnails)
+INFOGRAPHIC_VARIANTS_KEY = "infographic_variants"
+# Per-filename key of the latest saved version's reference; one key per file
+# so parallel branches saving different artifacts never overwrite each other
+ARTIFACT_REF_PREFIX = "artifact_ref:"
+
+
+class ArtifactStats:
+    """Artifact saves, and the ones skipped because the content was unchanged."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.saved = 0
+        self.deduplicated = 0
+        self.bytes_saved = 0
+        self.bytes_skipped = 0
+
+    def record(self, size: int, deduplicated: bool) -> None:
+        with self._lock:
+            if deduplicated:
+                self.deduplicated += 1
+                self.bytes_skipped += size
+            else:
+                self.saved += 1
+                self.bytes_saved += size
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "saved": self.saved,
+                "deduplicated": self.deduplicated,
+                "bytes_saved": self.bytes_saved,
+                "bytes_skipped": self.bytes_skipped,
+            }
+
+
+artifact_stats = ArtifactStats()
+
+
+async def save_artifact_ref(
+    context: Union[ToolContext, CallbackContext],
+    filename: str,
+    data: bytes,
+    mime_type: str,
+) -> dict[str, Any]:
+    """Save ``data`` as an artifact of the current session and return its reference.
+
+    If the latest saved version of ``filename`` in this session has the same
+    content and MIME type, nothing is uploaded and its reference is returned.
+    """
+    sha256 = hashlib.sha256(data).hexdigest()
+    session = context.session
+    latest = context.state.get(ARTIFACT_REF_PREFIX + filename)
+    if (
+        latest
+        and latest.get("sha256") == sha256
+        and latest.get("mime_type") == mime_type
+        and latest.get("session_id") == session.id
+        and latest.get("user_id") == session.user_id
+    ):
+        artifact_stats.record(len(data), deduplicated=True)
+        logger.info(f"Artifact {filename} unchanged; reusing version {latest['version']}")
+        return dict(latest)
+
+    version = await context.save_artifact(
+        filename=filename,
+        artifact=types.Part.from_bytes(data=data, mime_type=mime_type),
+    )
+    artifact_stats.record(len(data), deduplicated=False)
+    ref = {
+        "filename": filename,
+        "version": version,
+        "mime_type": mime_type,
+        "size_bytes": len(data),
+        "sha256": sha256,
+        "app_name": session.app_name,
+        "user_id": session.user_id,
+        "session_id": session.id,
+    }
+    context.state[ARTIFACT_REF_PREFIX + filename] = ref
+    return dict(ref)
+
+
+async def load_artifact_ref(
+    artifact_service: BaseArtifactService, ref: dict[str, Any]
+) -> Optional[tuple[bytes, str]]:
+    """Bytes and MIME type of a referenced artifact, or None if it is gone or changed."""
+    part = await artifact_service.load_artifact(
+        app_name=ref["app_name"],
+        user_id=ref["user_id"],
+        session_id=ref["session_id"],
+        filename=ref["filename"],
+        version=ref.get("version"),
+    )
+    if part is None or part.inline_data is None or part.inline_data.data is None:
+        return None
+    data = part.inline_data.data
+    if ref.get("sha256") and hashlib.sha256(data).hexdigest() != ref["sha256"]:
+        logger.warning(f"Artifact {ref['filename']} v{ref.get('version')} does not match its reference hash")
+        return None
+    return data, part.inline_data.mime_type or ref.get("mime_type") or "application/octet-stream"
@@ -0,0 +1,181 @@
+"""Small TTL + LRU cache with an optional SQLite backing store.
+
+The in-process LRU absorbs repeat lookups inside a run, while the SQLite
+file (when a path is given) keeps entries across runs and processes.
+Values must be JSON-serializable.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("LocationStrategyPipeline")
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry and hit/miss counters."""
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600,
+        db_path: str | Path | None = None,
+    ) -> None:
+        """
+        :param namespace: Logical cache name; rows in a shared SQLite file are
+            partitioned by it.
+        :param max_entries: Maximum number of entries kept in memory.
+        :param ttl_seconds: Lifetime of an entry after it is written.
+        :param db_path: Optional SQLite file used as a persistent second tier.
+        """
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "evictions": 0,
+            "writes": 0,
+        }
+        if db_path:
+            self._db = self._open_db(Path(db_path))
+
+    def _open_db(self, path: Path) -> sqlite3.Connection | None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(path), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            # A read-only or missing cache directory must never break a run
+            logger.warning(f"Cache '{self.namespace}' running memory-only: {e}")
+            return None
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key`` or None if absent or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+                    return value
+                del self._entries[key]
+                self._counters["expired"] += 1
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                        (self.namespace, key),
+                    ).fetchone()
+                    if row is not None:
+                        if row[1] > now:
+                            value = json.loads(row[0])
+                            self._remember(key, row[1], value)
+                            self._counters["disk_hits"] += 1
+                            return value
+                        self._counters["expired"] += 1
+                        self._db.execute(
+                            "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                            (self.namespace, key),
+                        )
+                        self._db.commit()
+                except (sqlite3.Error, ValueError) as e:
+                    # A locked or corrupt cache file is a miss, not a failed run
+                    logger.warning(f"Cache '{self.namespace}' disk read failed: {e}")
+
+            self._counters["misses"] += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """Store ``value`` under ``key`` in memory and, if enabled, on disk."""
+        expires_at = time.time() + (ttl_seconds if ttl_seconds is not None else self.ttl_seconds)
+        with self._lock:
+            self._remember(key, expires_at, value)
+            self._counters["writes"] += 1
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at)"
+                        " VALUES (?, ?, ?, ?)",
+                        (self.namespace, key, json.dumps(value), expires_at),
+                    )
+                    self._db.commit()
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    logger.warning(f"Cache '{self.namespace}' disk write failed: {e}")
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def keys(self, prefix: str = "") -> list[str]:
+        """Unexpired keys starting with ``prefix``, from memory and disk."""
+        now = time.time()
+        with self._lock:
+            found = {
+                key for key, (expires_at, _) in self._entries.items()
+                if expires_at > now and key.startswith(prefix)
+            }
+            if self._db is not None:
+                rows = self._db.execute(
+                    "SELECT key FROM cache WHERE namespace = ? AND expires_at > ? AND key LIKE ? ESCAPE '\\'",
+                    (self.namespace, now, _like_prefix(prefix)),
+                ).fetchall()
+                found.update(row[0] for row in rows)
+        return sorted(found)
+
+    def clear(self) -> None:
+        """Drop every entry in this namespace, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM cache WHERE namespace = ?", (self.namespace,))
+                self._db.commit()
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and the current hit rate."""
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._entries)
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        lookups = hits + counters["misses"]
+        return {
+            "namespace": self.namespace,
+            "hits": hits,
+            **counters,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": size,
+            "persistent": self._db is not None,
+        }
+
+
+def _like_prefix(prefix: str) -> str:
+    """SQL LIKE pattern matching keys that start with ``prefix`` literally."""
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
@@ -0,0 +1,263 @@
+"""Vectorized spatial index over competitor locations.
+
+Points are projected once onto a local equirectangular plane (meters) and
+bucketed into a square grid. Queries are answered with NumPy broadcasting
+in bounded chunks of spatially sorted queries. Radius and k-nearest queries
+only look at points inside each chunk's bounding box (grown cell by cell for
+k-nearest until the neighbours are found), which keeps them fast for
+thousands of points and queries.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from ..schemas.competitor_schema import CompetitorSet
+from .geo import EARTH_RADIUS_M
+
+# Upper bound on query x point distance pairs evaluated at once (~16 MB)
+_CHUNK_ELEMENTS = 2_000_000
+
+
+class SpatialIndex:
+    """Radius-count, k-nearest and grid density queries over lat/lng points.
+
+    Points with a missing (NaN) or infinite coordinate are not indexed; they
+    are never counted or returned as neighbours, but indices still refer to
+    positions in the arrays the index was built from.
+    """
+
+    def __init__(
+        self,
+        lat: Any,
+        lng: Any,
+        cell_size_m: float = 500.0,
+        origin: tuple[float, float] | None = None,
+    ) -> None:
+        """
+        :param lat: Point latitudes (any array-like).
+        :param lng: Point longitudes (any array-like).
+        :param cell_size_m: Edge length of the density grid cells in meters.
+        :param origin: (lat, lng) of the projection origin; defaults to the
+            centroid of the points.
+        """
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lng = np.asarray(lng, dtype=np.float64)
+        if self.lat.shape != self.lng.shape:
+            raise ValueError("lat and lng must have the same length")
+
+        finite = np.isfinite(self.lat) & np.isfinite(self.lng)
+        # Input position of each indexed point
+        self.point_ids = np.flatnonzero(finite)
+
+        if origin is None:
+            origin = (
+                (float(self.lat[finite].mean()), float(self.lng[finite].mean()))
+                if self.point_ids.size else (0.0, 0.0)
+            )
+        if not np.all(np.isfinite(origin)):
+            raise ValueError(f"origin must be finite, got {origin}")
+        self.origin = origin
+        self._cos_lat0 = np.cos(np.radians(origin[0]))
+        self.cell_size_m = float(cell_size_m)
+
+        self.x, self.y = self.project(self.lat[finite], self.lng[finite])
+        self.cell_x = np.floor(self.x / self.cell_size_m).astype(np.int64)
+        self.cell_y = np.floor(self.y / self.cell_size_m).astype(np.int64)
+
+    def __len__(self) -> int:
+        """Number of indexed points (those with finite coordinates)."""
+        return int(self.point_ids.size)
+
+    @classmethod
+    def from_competitors(
+        cls, competitors: CompetitorSet, cell_size_m: float = 500.0
+    ) -> "SpatialIndex":
+        """Build an index over a CompetitorSet, projected around its search center."""
+        origin = None
+        if competitors.center_lat is not None and competitors.center_lng is not None:
+            origin = (competitors.center_lat, competitors.center_lng)
+        return cls(competitors.lat, competitors.lng, cell_size_m=cell_size_m, origin=origin)
+
+    def project(self, lat: Any, lng: Any) -> tuple[np.ndarray, np.ndarray]:
+        """Project lat/lng to local (x east, y north) meters around the origin."""
+        lat = np.asarray(lat, dtype=np.float64)
+        lng = np.asarray(lng, dtype=np.float64)
+        x = np.radians(lng - self.origin[1]) * EARTH_RADIUS_M * self._cos_lat0
+        y = np.radians(lat - self.origin[0]) * EARTH_RADIUS_M
+        return x, y
+
+    def _chunk_step(self) -> int:
+        """Queries per chunk so a chunk's distance matrix stays bounded."""
+        return max(1, _CHUNK_ELEMENTS // max(1, len(self)))
+
+    def _project_queries(self, lat: Any, lng: Any) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Projected query points and the positions of those with finite coordinates."""
+        qx, qy = self.project(np.atleast_1d(lat), np.atleast_1d(lng))
+        return qx, qy, np.flatnonzero(np.isfinite(qx) & np.isfinite(qy))
+
+    def _nearest_among(
+        self, qx: np.ndarray, qy: np.ndarray, candidates: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Positions in ``candidates`` and squared distances of each query's k nearest, nearest first."""
+        dx = qx[:, None] - self.x[candidates][None, :]
+        dy = qy[:, None] - self.y[candidates][None, :]
+        d2 = dx * dx + dy * dy
+        if k < candidates.size:
+            part = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        else:
+            part = np.broadcast_to(np.arange(candidates.size), d2.shape).copy()
+        part_d2 = np.take_along_axis(d2, part, axis=1)
+        ordering = np.argsort(part_d2, axis=1)
+        return np.take_along_axis(part, ordering, axis=1), np.take_along_axis(part_d2, ordering, axis=1)
+
+    def radius_count(self, lat: Any, lng: Any, radius_m: float) -> np.ndarray:
+        """Number of indexed points within ``radius_m`` of each query point.
+
+        Queries with a non-finite coordinate count zero points.
+        """
+        qx, qy, valid = self._project_queries(lat, lng)
+        counts = np.zeros(qx.size, dtype=np.int64)
+        if not len(self) or not valid.size:
+            return counts
+
+        # Spatially coherent chunks make the bounding-box prefilter effective
+        order = valid[np.lexsort((qy[valid], qx[valid]))]
+        step = self._chunk_step()
+        r2 = radius_m * radius_m
+        for start in range(0, order.size, step):
+            rows = order[start:start + step]
+            cx, cy = qx[rows], qy[rows]
+            near = (
+                (self.x >= cx.min() - radius_m) & (self.x <= cx.max() + radius_m)
+                & (self.y >= cy.min() - radius_m) & (self.y <= cy.max() + radius_m)
+            )
+            if not near.any():
+                continue
+            dx = cx[:, None] - self.x[near][None, :]
+            dy = cy[:, None] - self.y[near][None, :]
+            counts[rows] = np.count_nonzero(dx * dx + dy * dy <= r2, axis=1)
+        return counts
+
+    def k_nearest(self, lat: Any, lng: Any, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """Distances (meters) and indices of the ``k`` nearest points per query.
+
+        Both arrays have shape (n_queries, k), sorted nearest first. When fewer
+        than ``k`` points are indexed, and for queries with a non-finite
+        coordinate, missing slots hold inf and -1.
+
+        Each chunk of queries starts with the points inside its bounding box
+        grown by one grid cell; queries whose k-th candidate lies farther than
+        that margin are retried with the margin doubled. Once the grown box
+        covers every indexed point, the remaining queries are compared with
+        all of them.
+        """
+        qx, qy, valid = self._project_queries(lat, lng)
+        distances = np.full((qx.size, k), np.inf)
+        indices = np.full((qx.size, k), -1, dtype=np.int64)
+        n = len(self)
+        if not n or not valid.size or k < 1:
+            return distances, indices
+
+        kk = min(k, n)
+        x_min, x_max = self.x.min(), self.x.max()
+        y_min, y_max = self.y.min(), self.y.max()
+        order = valid[np.lexsort((qy[valid], qx[valid]))]
+        step = self._chunk_step()
+        for start in range(0, order.size, step):
+            pending = order[start:start + step]
+            margin = self.cell_size_m
+            while pending.size:
+                cx, cy = qx[pending], qy[pending]
+                left, right = cx.min() - margin, cx.max() + margin
+                bottom, top = cy.min() - margin, cy.max() + margin
+                if left <= x_min and right >= x_max and bottom <= y_min and top >= y_max:
+                    part, part_d2 = self._nearest_among(cx, cy, np.arange(n), kk)
+                    indices[pending, :kk] = self.point_ids[part]
+                    distances[pending, :kk] = np.sqrt(part_d2)
+                    break
+
+                candidates = np.flatnonzero(
+                    (self.x >= left) & (self.x <= right) & (self.y >= bottom) & (self.y <= top)
+                )
+                if candidates.size < kk:
+                    margin *= 2
+                    continue
+                part, part_d2 = self._nearest_among(cx, cy, candidates, kk)
+                # Points outside the grown box are farther than ``margin``
+                done = part_d2[:, -1] <= margin * margin
+                rows = pending[done]
+                indices[rows, :kk] = self.point_ids[candidates[part[done]]]
+                distances[rows, :kk] = np.sqrt(part_d2[done])
+                pending = pending[~done]
+                margin *= 2
+        return distances, indices
+
+    def nearest_distance(self, lat: Any, lng: Any) -> np.ndarray:
+        """Distance in meters from each query point to its nearest indexed point."""
+        distances, _ = self.k_nearest(lat, lng, k=1)
+        return distances[:, 0]
+
+    def cell_density(self) -> dict[str, np.ndarray]:
+        """Per-cell point counts and densities over the occupied grid cells.
+
+        Returns:
+            dict: Parallel arrays ``cell_x``, ``cell_y`` (grid coordinates),
+            ``lat``, ``lng`` (cell centers), ``count`` and ``per_km2``.
+        """
+        if not len(self):
+            empty = np.zeros(0)
+            return {"cell_x": empty, "cell_y": empty, "lat": empty, "lng": empty,
+                    "count": empty.astype(np.int64), "per_km2": empty}
+
+        cells = np.stack([self.cell_x, self.cell_y], axis=1)
+        unique, counts = np.unique(cells, axis=0, return_counts=True)
+        center_x = (unique[:, 0] + 0.5) * self.cell_size_m
+        center_y = (unique[:, 1] + 0.5) * self.cell_size_m
+        center_lat = self.origin[0] + np.degrees(center_y / EARTH_RADIUS_M)
+        center_lng = self.origin[1] + np.degrees(center_x / (EARTH_RADIUS_M * self._cos_lat0))
+        cell_km2 = (self.cell_size_m / 1000.0) ** 2
+        return {
+            "cell_x": unique[:, 0],
+            "cell_y": unique[:, 1],
+            "lat": center_lat,
+            "lng": center_lng,
+            "count": counts,
+            "per_km2": counts / cell_km2,
+        }
+
+    def cell_of(self, lat: Any, lng: Any) -> tuple[np.ndarray, np.ndarray]:
+        """Grid cell coordinates containing each query point (finite coordinates only)."""
+        qx, qy = self.project(np.atleast_1d(lat), np.atleast_1d(lng))
+        return (
+            np.floor(qx / self.cell_size_m).astype(np.int64),
+            np.floor(qy / self.cell_size_m).astype(np.int64),
+        )
+
+
+# Indexes are built once per distinct competitor set and reused across stages
+_index_cache: OrderedDict[str, SpatialIndex] = OrderedDict()
+_index_lock = threading.Lock()
+_INDEX_CACHE_SIZE = 32
+
+
+def index_for(competitors: CompetitorSet, cell_size_m: float = 500.0) -> SpatialIndex:
+    """Return a (memoized) SpatialIndex for a CompetitorSet."""
+    digest = hashlib.sha1(
+        "|".join([*competitors.ids, str(cell_size_m)]).encode("utf-8")
+    ).hexdigest()
+    with _index_lock:
+        index = _index_cache.get(digest)
+        if index is not None:
+            _index_cache.move_to_end(digest)
+            return index
+
+    index = SpatialIndex.from_competitors(competitors, cell_size_m=cell_size_m)
+    with _index_lock:
+        _index_cache[digest] = index
+        while len(_index_cache) > _INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
@@ -0,0 +1,217 @@
+"""Per-stage latency, token, cost and retry accounting for the pipeline.
+
+Stage callbacks open a ledger entry when a stage starts and close it when it
+finishes. In between, tools attribute extra usage (their own Gemini calls)
+and retries to the running stage through a context variable, which ADK
+carries from the before callback into the agent's tool calls. Each closed
+entry is emitted as an OpenTelemetry span plus metrics, and the session's
+ledger is returned for storage in state.
+
+OpenTelemetry calls are no-ops unless an SDK/exporter is configured (for
+example by Agent Engine or ``opentelemetry-instrument``).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Optional
+
+from opentelemetry import metrics, trace
+from opentelemetry.trace import Status, StatusCode
+
+# Approximate list prices in USD per 1M tokens as (input, output). Thinking
+# tokens are billed as output. Used for cost estimates only.
+MODEL_PRICES_USD_PER_MTOK: dict[str, tuple[float, float]] = {
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+    "gemini-2.5-flash-image": (0.30, 30.00),
+    "gemini-2.0-flash": (0.10, 0.40),
+}
+
+_tracer = trace.get_tracer("locus.pipeline")
+_meter = metrics.get_meter("locus.pipeline")
+_duration = _meter.create_histogram(
+    "locus.stage.duration", unit="s", description="Wall-clock duration of a pipeline stage"
+)
+_tokens = _meter.create_counter(
+    "locus.stage.tokens", unit="{token}", description="Tokens used by a pipeline stage"
+)
+_cost = _meter.create_counter(
+    "locus.stage.cost", unit="USD", description="Estimated model cost of a pipeline stage"
+)
+_tool_calls = _meter.create_counter(
+    "locus.stage.tool_calls", unit="{call}", description="Tool calls made by a pipeline stage"
+)
+_retries = _meter.create_counter(
+    "locus.stage.retries", unit="{retry}", description="Retried API calls within a pipeline stage"
+)
+
+# (session_id, stage) of the stage running in the current task
+_current_stage: ContextVar[Optional[tuple[str, str]]] = ContextVar("locus_stage", default=None)
+
+_lock = threading.Lock()
+# (session_id, stage) -> open entry
+_open: dict[tuple[str, str], dict[str, Any]] = {}
+# session_id -> {stage: closed entry}
+_ledgers: OrderedDict[str, dict[str, dict[str, Any]]] = OrderedDict()
+_MAX_TRACKED_SESSIONS = 1024
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """Estimated USD cost of a model's token usage (0 for unknown models)."""
+    name = model.split("/")[-1]
+    prices = MODEL_PRICES_USD_PER_MTOK.get(name)
+    if prices is None:
+        # Versioned names such as gemini-2.5-flash-lite-preview-09-2025
+        matches = [key for key in MODEL_PRICES_USD_PER_MTOK if name.startswith(key)]
+        if not matches:
+            return 0.0
+        prices = MODEL_PRICES_USD_PER_MTOK[max(matches, key=len)]
+    return (input_tokens * prices[0] + output_tokens * prices[1]) / 1_000_000
+
+
+def start_stage(session_id: str, stage: str, agent: str, model: str) -> None:
+    """Open a ledger entry and span for ``stage`` and make it the current stage."""
+    span = _tracer.start_span(
+        f"pipeline.stage {stage}",
+        attributes={"locus.stage": stage, "locus.agent": agent, "gen_ai.request.model": model},
+    )
+    with _lock:
+        _open[(session_id, stage)] = {
+            "stage": stage,
+            "agent": agent,
+            "model": model,
+            "started_at": datetime.now().isoformat(),
+            "_start": time.perf_counter(),
+            "_span": span,
+            "usage": {},
+            "retries": 0,
+        }
+    _current_stage.set((session_id, stage))
+
+
+def record_usage(model: str, usage: Any) -> None:
+    """Attribute a response's usage metadata to the current stage."""
+    key = _current_stage.get()
+    if key is None or usage is None:
+        return
+    with _lock:
+        entry = _open.get(key)
+        if entry is not None:
+            _add_usage(entry["usage"], model, usage)
+
+
+def record_retry() -> None:
+    """Count one retried API call against the current stage."""
+    key = _current_stage.get()
+    if key is None:
+        return
+    with _lock:
+        entry = _open.get(key)
+        if entry is not None:
+            entry["retries"] += 1
+
+
+def _add_usage(usage_by_model: dict[str, dict[str, int]], model: str, usage: Any) -> None:
+    totals = usage_by_model.setdefault(model, {"input": 0, "output": 0, "thinking": 0, "calls": 0})
+    totals["input"] += getattr(usage, "prompt_token_count", None) or 0
+    totals["output"] += getattr(usage, "candidates_token_count", None) or 0
+    totals["thinking"] += getattr(usage, "thoughts_token_count", None) or 0
+    totals["calls"] += 1
+
+
+def finish_stage(
+    session_id: str,
+    stage: str,
+    status: str = "ok",
+    events: Optional[list] = None,
+    error: Optional[str] = None,
+) -> dict[str, dict[str, Any]]:
+    """Close ``stage``, emit its span and metrics, and return the session ledger.
+
+    Args:
+        session_id: Session the stage ran in.
+        stage: Pipeline stage key.
+        status: "ok", "error", or how the stage was skipped (e.g. "checkpoint").
+        events: The stage agent's events; LLM usage and tool calls are read
+            from them.
+        error: Error message for a failed stage.
+    """
+    with _lock:
+        entry = _open.pop((session_id, stage), None)
+    if entry is None:
+        return get_ledger(session_id)
+
+    span = entry.pop("_span")
+    duration = time.perf_counter() - entry.pop("_start")
+    usage_by_model = entry.pop("usage")
+    tool_calls = 0
+    for event in events or []:
+        if event.usage_metadata is not None:
+            _add_usage(usage_by_model, entry["model"], event.usage_metadata)
+        tool_calls += len(event.get_function_calls())
+
+    input_tokens = sum(u["input"] for u in usage_by_model.values())
+    output_tokens = sum(u["output"] for u in usage_by_model.values())
+    thinking_tokens = sum(u["thinking"] for u in usage_by_model.values())
+    cost = sum(
+        estimate_cost(model, u["input"], u["output"] + u["thinking"])
+        for model, u in usage_by_model.items()
+    )
+    record = {
+        **entry,
+        "status": status,
+        "duration_s": round(duration, 3),
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "thinking_tokens": thinking_tokens,
+        "llm_calls": sum(u["calls"] for u in usage_by_model.values()),
+        "tool_calls": tool_calls,
+        "est_cost_usd": round(cost, 6),
+        "models": sorted(model for model in usage_by_model if model),
+    }
+    if error:
+        record["error"] = error
+
+    attributes = {"locus.stage": stage, "locus.status": status}
+    span.set_attributes({
+        "locus.status": status,
+        "locus.duration_s": record["duration_s"],
+        "gen_ai.usage.input_tokens": input_tokens,
+        "gen_ai.usage.output_tokens": output_tokens,
+        "locus.usage.thinking_tokens": thinking_tokens,
+        "locus.tool_calls": tool_calls,
+        "locus.retries": record["retries"],
+        "locus.est_cost_usd": record["est_cost_usd"],
+    })
+    if status == "error":
+        span.set_status(Status(StatusCode.ERROR, error))
+    span.end()
+
+    _duration.record(duration, attributes)
+    for kind, count in (("input", input_tokens), ("output", output_tokens), ("thinking", thinking_tokens)):
+        if count:
+            _tokens.add(count, {**attributes, "locus.token_type": kind})
+    if cost:
+        _cost.add(cost, attributes)
+    if tool_calls:
+        _tool_calls.add(tool_calls, attributes)
+    if record["retries"]:
+        _retries.add(record["retries"], attributes)
+
+    with _lock:
+        ledger = _ledgers.pop(session_id, {})
+        ledger[stage] = record
+        _ledgers[session_id] = ledger
+        while len(_ledgers) > _MAX_TRACKED_SESSIONS:
+            _ledgers.popitem(last=False)
+        return dict(ledger)
+
+
+def get_ledger(session_id: str) -> dict[str, dict[str, Any]]:
+    """Closed stage entries recorded for ``session_id`` in this process."""
+    with _lock:
+        return dict(_ledgers.get(session_id, {}))
@@ -0,0 +1,568 @@
+"""Benchmark the full pipeline offline against fake Gemini and Maps backends.
+
+Usage:
+    uv run python benchmarks/pipeline_bench.py [--repeats 5] [--entry pipeline|root]
+        [--llm-latency-ms 50] [--maps-latency-ms 20] [--genai-latency-ms 50]
+        [--output results.json]
+
+Every LlmAgent's model is swapped for a deterministic fake that replays a
+scripted turn (tool call, then final answer) after a fixed delay; the Maps
+client gets a canned HTTP transport and the report/image tools a fake genai
+client. Everything else - callbacks, tools, caches, checkpoints, the request
+budget and ADK's orchestration - runs for real, so the simulated latency can
+be subtracted from each stage's wall time to get its orchestration overhead.
+
+Reported per run (median over repeats):
+  - wall time and per-stage duration, simulated latency and overhead
+  - time spent in each agent callback
+  - final state size and the cost of serializing state, deltas and session
+  - peak traced memory (from a separate tracemalloc run)
+
+Caches are cleared before every repeat, so runs are cold and comparable
+across commits; the JSON includes the commit and configuration.
+"""
+
+import argparse
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import os
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import weakref
+import zlib
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, ClassVar
+from unittest import mock
+
+import httpx
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Keep the benchmark's checkpoints and caches away from the user's
+os.environ.setdefault("LOCUS_CACHE_DIR", tempfile.mkdtemp(prefix="locus-bench-"))
+os.environ.setdefault("GOOGLE_API_KEY", "offline-benchmark")
+
+from google.adk.agents import BaseAgent, LlmAgent  # noqa: E402
+from google.adk.models.base_llm import BaseLlm  # noqa: E402
+from google.adk.models.llm_request import LlmRequest  # noqa: E402
+from google.adk.models.llm_response import LlmResponse  # noqa: E402
+from google.adk.runners import InMemoryRunner  # noqa: E402
+from google.genai import types  # noqa: E402
+
+from app.agent import location_strategy_pipeline, root_agent  # noqa: E402
+from app.callbacks.checkpoints import checkpoint_store  # noqa: E402
+from app.callbacks.stage_cache import stage_cache  # noqa: E402
+from app.config import APP_NAME, PARALLEL_OUTPUTS, PARALLEL_RESEARCH  # noqa: E402
+from app.sub_agents.intake_agent.agent import intake_agent  # noqa: E402
+from app.tools import genai_client, places_search  # noqa: E402
+from app.tools.maps_client import AsyncMapsClient  # noqa: E402
+
+MAPS_KEY = "offline-benchmark"
+
+AGENT_STAGES = {
+    "MarketResearchAgent": "market_research",
+    "CompetitorMappingAgent": "competitor_mapping",
+    "GapAnalysisAgent": "gap_analysis",
+    "StrategyAdvisorAgent": "strategy_synthesis",
+    "ReportGeneratorAgent": "report_generation",
+    "InfographicGeneratorAgent": "infographic_generation",
+}
+
+# stage -> seconds the fakes spent sleeping for it in the current run
+simulated: dict[str, float] = defaultdict(float)
+
+
+class Scenario:
+    """Canned request, market data and competitors for one synthetic city."""
+
+    target_location = "Indiranagar, Bangalore"
+    business_type = "coffee shop"
+    center: ClassVar[dict[str, float]] = {"lat": 12.9784, "lng": 77.6408}
+    zones: ClassVar[list[dict[str, Any]]] = [
+        {"name": "Indiranagar", "population_density": 8, "income_score": 8, "infrastructure": 9,
+         "rental_cost_tier": "High", "lat": 12.9784, "lng": 77.6408, "radius_meters": 1200},
+        {"name": "Domlur", "population_density": 6, "income_score": 7, "infrastructure": 7,
+         "rental_cost_tier": "Medium", "lat": 12.9610, "lng": 77.6387, "radius_meters": 1200},
+        {"name": "HAL", "population_density": 7, "income_score": 6, "infrastructure": 6,
+         "rental_cost_tier": "Medium", "lat": 12.9600, "lng": 77.6600, "radius_meters": 1200},
+        {"name": "Jeevan Bima Nagar", "population_density": 7, "income_score": 5, "infrastructure": 6,
+         "rental_cost_tier": "Low", "lat": 12.9700, "lng": 77.6560, "radius_meters": 1200},
+    ]
+    brands: ClassVar[list[str]] = ["Third Wave Coffee", "Starbucks", "Blue Tokai", "Cafe Coffee Day", "Chai Point"]
+
+    def __init__(self, places: int, findings_chars: int, seed: int) -> None:
+        rng = np.random.default_rng(seed)
+        self.places = []
+        for i in range(places):
+            zone = self.zones[i % len(self.zones)]
+            independent = rng.random() < 0.5
+            name = f"Cafe {i}" if independent else self.brands[i % len(self.brands)]
+            self.places.append({
+                "place_id": f"place-{i}",
+                "name": name,
+                "vicinity": f"{i} Main Road, {zone['name']}, Bangalore",
+                "rating": round(float(rng.uniform(3.4, 4.9)), 1),
+                "user_ratings_total": int(rng.integers(5, 3000)),
+                "price_level": int(rng.integers(1, 4)),
+                "business_status": "OPERATIONAL",
+                "types": ["cafe", "food", "establishment"],
+                "geometry": {"location": {
+                    "lat": zone["lat"] + float(rng.normal(0, 0.004)),
+                    "lng": zone["lng"] + float(rng.normal(0, 0.004)),
+                }},
+            })
+        paragraph = (
+            "Indiranagar combines dense young professional housing with strong evening "
+            "footfall along 100 Feet Road and 12th Main; rents are high but demand is deep. "
+        )
+        text = (paragraph * (findings_chars // len(paragraph) + 1))[:findings_chars]
+        self.area_findings = f"## AREA PROFILE\n{text[:findings_chars // 2]}"
+        self.business_findings = f"## BUSINESS MARKET\n{text[findings_chars // 2:]}"
+
+    def report(self) -> dict:
+        """A LocationIntelligenceReport as the strategy advisor would return it."""
+        top, *alternatives = self.zones
+        return {
+            "target_location": self.target_location,
+            "business_type": self.business_type,
+            "analysis_date": "2025-01-01",
+            "market_validation": "Strong demand with room for a specialty independent.",
+            "total_competitors_found": len(self.places),
+            "zones_analyzed": len(self.zones),
+            "top_recommendation": {
+                "location_name": top["name"],
+                "area": "East Bangalore",
+                "overall_score": 82,
+                "opportunity_type": "Premium Specialty",
+                "strengths": [{"factor": "Footfall", "description": "High evening footfall",
+                               "evidence_from_analysis": "Highest demand signal of all zones"}],
+                "concerns": [{"risk": "Rent", "description": "High rental costs",
+                              "mitigation_strategy": "Smaller format on a side street"}],
+                "competition": {"total_competitors": len(self.places) // 4, "density_per_km2": 4.2,
+                                "chain_dominance_pct": 45.0, "avg_competitor_rating": 4.2,
+                                "high_performers_count": 3},
+                "market": {"population_density": "High", "income_level": "High",
+                           "infrastructure_access": "Metro and arterial roads",
+                           "foot_traffic_pattern": "Evening and weekend peaks",
+                           "rental_cost_tier": "High"},
+                "best_customer_segment": "Young professionals",
+                "estimated_foot_traffic": "2,000+ per day",
+                "next_steps": ["Shortlist sites", "Negotiate rent", "Plan launch"],
+            },
+            "alternative_locations": [
+                {"location_name": zone["name"], "area": "East Bangalore", "overall_score": 70 - i * 5,
+                 "opportunity_type": "Residential", "key_strength": "Lower rent",
+                 "key_concern": "Lower footfall", "why_not_top": "Weaker demand signal"}
+                for i, zone in enumerate(alternatives)
+            ],
+            "key_insights": ["Evening demand is under-served", "Chains cluster on 100 Feet Road"],
+            "methodology_summary": "Live research, Maps competitors and deterministic zone scoring.",
+        }
+
+
+def _function_call(name: str, args: dict) -> types.Content:
+    return types.Content(role="model", parts=[types.Part(function_call=types.FunctionCall(name=name, args=args))])
+
+
+def _text(text: str) -> types.Content:
+    return types.Content(role="model", parts=[types.Part(text=text)])
+
+
+def scripted_turn(agent_name: str, llm_request: LlmRequest, scenario: Scenario) -> types.Content:
+    """The fake model's reply: call the agent's tool once, then answer."""
+    last = llm_request.contents[-1] if llm_request.contents else None
+    responded = {
+        part.function_response.name
+        for part in (last.parts or [] if last else [])
+        if part.function_response
+    }
+
+    if agent_name == APP_NAME:
+        if "IntakeAgent" not in responded:
+            return _function_call("IntakeAgent", {
+                "request": f"I want to open a {scenario.business_type} in {scenario.target_location}",
+            })
+        return _function_call("transfer_to_agent", {"agent_name": location_strategy_pipeline.name})
+    if agent_name == "IntakeAgent":
+        return _text(json.dumps({
+            "target_location": scenario.target_location,
+            "business_type": scenario.business_type,
+        }))
+    if agent_name == "MarketResearchAgent":
+        if "## Known Area Profile" in str(llm_request.config.system_instruction or ""):
+            return _text(scenario.business_findings)
+        return _text(f"{scenario.area_findings}\n\n{scenario.business_findings}")
+    if agent_name == "CompetitorMappingAgent":
+        if not responded:
+            return _function_call("search_places", {
+                "target_location": scenario.target_location,
+                "business_type": scenario.business_type,
+            })
+        return _text(f"Found {len(scenario.places)} competitors; chains dominate the main roads.")
+    if agent_name == "GapAnalysisAgent":
+        if not responded:
+            return _function_call("compute_gap_scores", {"zones": scenario.zones})
+        return _text("Indiranagar ranks first on viability; HAL is the best value alternative.")
+    if agent_name == "StrategyAdvisorAgent":
+        return _text(json.dumps(scenario.report()))
+    if agent_name == "ReportGeneratorAgent":
+        if not responded:
+            return _function_call("generate_html_report", {"report_data": json.dumps(scenario.report())})
+        return _text("The executive HTML report has been generated.")
+    if agent_name == "InfographicGeneratorAgent":
+        if not responded:
+            return _function_call("generate_infographic", {
+                "data_summary": f"Top zone: {scenario.zones[0]['name']} (82/100)",
+            })
+        return _text("The infographic has been generated.")
+    raise ValueError(f"No script for agent {agent_name}")
+
+
+def _usage(prompt_chars: int, output_chars: int) -> types.GenerateContentResponseUsageMetadata:
+    # ~4 characters per token, close enough to exercise the cost ledger
+    return types.GenerateContentResponseUsageMetadata(
+        prompt_token_count=prompt_chars // 4,
+        candidates_token_count=output_chars // 4,
+        total_token_count=(prompt_chars + output_chars) // 4,
+    )
+
+
+class FakeLlm(BaseLlm):
+    """Deterministic stand-in for a Gemini model, bound to a single agent."""
+
+    agent_name: str
+    latency_s: float
+    scenario: Scenario
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        await asyncio.sleep(self.latency_s)
+        simulated[AGENT_STAGES.get(self.agent_name, "orchestrator")] += self.latency_s
+
+        content = scripted_turn(self.agent_name, llm_request, self.scenario)
+        prompt_chars = len(str(llm_request.config.system_instruction or "")) + sum(
+            len(part.text or "") for c in llm_request.contents for part in c.parts or []
+        )
+        output_chars = sum(len(part.text or "") for part in content.parts or [])
+        yield LlmResponse(content=content, usage_metadata=_usage(prompt_chars, output_chars))
+
+
+def _png(width: int, height: int) -> bytes:
+    """A solid-color RGB PNG, standing in for a generated infographic."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    row = b"\x00" + bytes((30, 58, 138)) * width
+    return b"".join([
+        b"\x89PNG\r\n\x1a\n",
+        chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)),
+        chunk(b"IDAT", zlib.compress(row * height)),
+        chunk(b"IEND", b""),
+    ])
+
+
+class FakeGenaiClient:
+    """Replaces google.genai.Client for the report and infographic tools."""
+
+    latency_s = 0.0
+    html = "<!DOCTYPE html><html><body>" + "<section>Slide</section>" * 200 + "</body></html>"
+    image = _png(320, 180)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.aio = type("Aio", (), {"models": self._AsyncModels()})()
+
+    @classmethod
+    def response(cls, config: types.GenerateContentConfig | None) -> types.GenerateContentResponse:
+        if config is not None and "IMAGE" in (config.response_modalities or []):
+            simulated["infographic_generation"] += cls.latency_s
+            part = types.Part(inline_data=types.Blob(mime_type="image/png", data=cls.image))
+        else:
+            simulated["report_generation"] += cls.latency_s
+            part = types.Part(text=cls.html)
+        return types.GenerateContentResponse(
+            candidates=[types.Candidate(content=types.Content(role="model", parts=[part]))],
+            usage_metadata=_usage(4000, len(cls.html)),
+        )
+
+    class _AsyncModels:
+        async def generate_content(
+            self, model: str, contents: Any, config: Any = None
+        ) -> types.GenerateContentResponse:
+            await asyncio.sleep(FakeGenaiClient.latency_s)
+            return FakeGenaiClient.response(config)
+
+
+def maps_transport(scenario: Scenario, latency_s: float) -> httpx.MockTransport:
+    """Canned Geocoding and Nearby Search responses (one page of results)."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency_s)
+        simulated["competitor_mapping"] += latency_s
+        if request.url.path.endswith("/geocode/json"):
+            return httpx.Response(200, json={
+                "status": "OK",
+                "results": [{"geometry": {"location": scenario.center}}],
+            })
+        return httpx.Response(200, json={"status": "OK", "results": scenario.places[:20]})
+
+    return httpx.MockTransport(handler)
+
+
+def _walk(agent: BaseAgent) -> Iterator[BaseAgent]:
+    yield agent
+    for sub_agent in agent.sub_agents:
+        yield from _walk(sub_agent)
+
+
+def _timed(fn: Callable[..., Any], totals: dict[str, list[float]]) -> Callable[..., Any]:
+    """Wrap a callback so every call adds its duration to ``totals``."""
+    name = getattr(fn, "__name__", repr(fn))
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                totals[name].append(time.perf_counter() - start)
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            totals[name].append(time.perf_counter() - start)
+    return wrapper
+
+
+@contextmanager
+def _swapped(obj: Any, attr: str, value: Any) -> Iterator[None]:
+    original = getattr(obj, attr)
+    setattr(obj, attr, value)
+    try:
+        yield
+    finally:
+        setattr(obj, attr, original)
+
+
+@contextmanager
+def offline_backends(
+    entry: BaseAgent,
+    scenario: Scenario,
+    args: argparse.Namespace,
+    callback_times: dict[str, list[float]],
+) -> Iterator[None]:
+    """Swap in the fake model, Maps and genai backends plus callback timers."""
+    FakeGenaiClient.latency_s = args.genai_latency_ms / 1000
+    with ExitStack() as stack:
+        agents = {id(agent): agent for agent in [*_walk(entry), intake_agent]}.values()
+        for agent in agents:
+            if isinstance(agent, LlmAgent):
+                stack.enter_context(_swapped(agent, "model", FakeLlm(
+                    model=str(getattr(agent.model, "model", agent.model)),
+                    agent_name=agent.name,
+                    latency_s=args.llm_latency_ms / 1000,
+                    scenario=scenario,
+                )))
+            for attr in ("before_agent_callback", "after_agent_callback"):
+                callback = getattr(agent, attr)
+                if callback is None:
+                    continue
+                wrapped: Any = (
+                    [_timed(fn, callback_times) for fn in callback]
+                    if isinstance(callback, list)
+                    else _timed(callback, callback_times)
+                )
+                stack.enter_context(_swapped(agent, attr, wrapped))
+        stack.enter_context(mock.patch("google.genai.Client", FakeGenaiClient))
+        # Drop the shared client so the tools lazily build a fake one
+        stack.enter_context(mock.patch.object(genai_client, "_clients", weakref.WeakKeyDictionary()))
+        yield
+
+
+def _clear_caches() -> None:
+    for cache in (places_search.places_cache, places_search.geocode_cache, stage_cache, checkpoint_store):
+        if cache is not None:
+            cache.clear()
+
+
+def _best_ms(fn: Callable[[], Any], repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def run_once(entry: BaseAgent, scenario: Scenario, args: argparse.Namespace) -> dict:
+    """Run the pipeline once on cold caches and measure it."""
+    _clear_caches()
+    simulated.clear()
+    callback_times: dict[str, list[float]] = defaultdict(list)
+    maps_client = AsyncMapsClient(MAPS_KEY, transport=maps_transport(scenario, args.maps_latency_ms / 1000))
+
+    with offline_backends(entry, scenario, args, callback_times), \
+            mock.patch.object(places_search, "get_maps_client", lambda api_key: maps_client):
+        runner = InMemoryRunner(agent=entry, app_name=APP_NAME)
+        state: dict[str, Any] = {"maps_api_key": MAPS_KEY}
+        if entry is location_strategy_pipeline:
+            state.update({
+                "target_location": scenario.target_location,
+                "business_type": scenario.business_type,
+                "stages_completed": ["intake"],
+            })
+        session = await runner.session_service.create_session(app_name=APP_NAME, user_id="bench", state=state)
+        message = types.Content(role="user", parts=[types.Part(
+            text=f"I want to open a {scenario.business_type} in {scenario.target_location}"
+        )])
+
+        start = time.perf_counter()
+        async for _ in runner.run_async(user_id="bench", session_id=session.id, new_message=message):
+            pass
+        wall_s = time.perf_counter() - start
+
+        finished = await runner.session_service.get_session(
+            app_name=APP_NAME, user_id="bench", session_id=session.id
+        )
+    await maps_client.aclose()
+    if finished is None:
+        raise RuntimeError(f"Benchmark session {session.id} disappeared")
+    session = finished
+
+    ledger = session.state.get("stage_ledger", {})
+    stages = {}
+    for stage, entry_record in ledger.items():
+        stages[stage] = {
+            "status": entry_record["status"],
+            "duration_ms": entry_record["duration_s"] * 1000,
+            "simulated_ms": simulated.get(stage, 0.0) * 1000,
+            "overhead_ms": (entry_record["duration_s"] - simulated.get(stage, 0.0)) * 1000,
+            "llm_calls": entry_record["llm_calls"],
+            "tool_calls": entry_record["tool_calls"],
+            "input_tokens": entry_record["input_tokens"],
+        }
+
+    state = dict(session.state)
+    deltas = [event.actions.state_delta for event in session.events if event.actions.state_delta]
+    return {
+        "wall_ms": wall_s * 1000,
+        "simulated_ms": sum(simulated.values()) * 1000,
+        "stages_completed": state.get("stages_completed", []),
+        "stages": stages,
+        "callbacks": {
+            name: {"calls": len(times), "ms": sum(times) * 1000}
+            for name, times in callback_times.items()
+        },
+        "state": {
+            "keys": len(state),
+            "state_bytes": len(json.dumps(state, default=str)),
+            "state_json_ms": _best_ms(lambda: json.dumps(state, default=str)),
+            "events": len(session.events),
+            "delta_bytes": sum(len(json.dumps(delta, default=str)) for delta in deltas),
+            "deltas_json_ms": _best_ms(lambda: [json.dumps(delta, default=str) for delta in deltas]),
+            "session_bytes": len(session.model_dump_json()),
+            "session_json_ms": _best_ms(session.model_dump_json),
+        },
+    }
+
+
+def _median(samples: list[dict]) -> dict:
+    """Median of every numeric leaf across runs with the same shape."""
+    merged = {}
+    for key, value in samples[0].items():
+        values = [sample[key] for sample in samples if key in sample]
+        if isinstance(value, dict):
+            merged[key] = _median(values)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            merged[key] = round(statistics.median(values), 3)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> dict:
+    entry = root_agent if args.entry == "root" else location_strategy_pipeline
+    scenario = Scenario(args.places, args.findings_chars, args.seed)
+
+    await run_once(entry, scenario, args)  # warm-up: imports, pydantic schemas, sqlite files
+    samples = [await run_once(entry, scenario, args) for _ in range(args.repeats)]
+
+    tracemalloc.start()
+    await run_once(entry, scenario, args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "benchmark": "pipeline",
+        "commit": _commit(),
+        "config": {
+            "entry": args.entry,
+            "repeats": args.repeats,
+            "llm_latency_ms": args.llm_latency_ms,
+            "maps_latency_ms": args.maps_latency_ms,
+            "genai_latency_ms": args.genai_latency_ms,
+            "places": args.places,
+            "findings_chars": args.findings_chars,
+            "parallel_research": PARALLEL_RESEARCH,
+            "parallel_outputs": PARALLEL_OUTPUTS,
+            "python": sys.version.split()[0],
+        },
+        "results": {**_median(samples), "peak_memory_mb": round(peak / 2**20, 2)},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entry", choices=["pipeline", "root"], default="pipeline",
+                        help="Run location_strategy_pipeline directly or via root_agent and intake")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0)
+    parser.add_argument("--maps-latency-ms", type=float, default=20.0)
+    parser.add_argument("--genai-latency-ms", type=float, default=50.0)
+    parser.add_argument("--places", type=int, default=20, help="Synthetic competitors in the city")
+    parser.add_argument("--findings-chars", type=int, default=8000, help="Size of the market research text")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    for name in ("LocationStrategyPipeline", "httpx"):
+        logging.getLogger(name).setLevel(args.log_level)
+    results = asyncio.run(run(args))
+    text = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
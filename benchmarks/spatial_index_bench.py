@@ -0,0 +1,97 @@
+"""Benchmark the competitor SpatialIndex with synthetic city-scale data.
+
+Usage:
+    uv run python benchmarks/spatial_index_bench.py [--points 1000 5000 20000]
+
+Points are scattered over a ~10 km square with a few dense clusters, roughly
+what a sweep search returns for a large city. Each query type is timed over
+several repeats and checked against a brute-force haversine reference.
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.geo import haversine_m
+from app.utils.spatial_index import SpatialIndex
+
+CENTER = (12.9716, 77.5946)
+
+T = TypeVar("T")
+
+
+def synthetic_points(n: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """Half uniform background, half in five Gaussian clusters."""
+    spread = 0.045  # ~5 km in degrees
+    uniform = n // 2
+    lat = [rng.uniform(-spread, spread, uniform)]
+    lng = [rng.uniform(-spread, spread, uniform)]
+    centers = rng.uniform(-spread, spread, (5, 2))
+    for i, chunk in enumerate(np.array_split(np.arange(n - uniform), 5)):
+        lat.append(rng.normal(centers[i, 0], 0.004, chunk.size))
+        lng.append(rng.normal(centers[i, 1], 0.004, chunk.size))
+    return CENTER[0] + np.concatenate(lat), CENTER[1] + np.concatenate(lng)
+
+
+def timed(fn: Callable[[], T], repeats: int) -> tuple[float, T]:
+    best = float("inf")
+    for _ in range(max(1, repeats)):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def run(n_points: int, n_queries: int, repeats: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    lat, lng = synthetic_points(n_points, rng)
+    q_lat, q_lng = synthetic_points(n_queries, rng)
+
+    build_ms, index = timed(lambda: SpatialIndex(lat, lng, origin=CENTER), repeats)
+    radius_ms, counts = timed(lambda: index.radius_count(q_lat, q_lng, 1000.0), repeats)
+    knn_ms, (dist, _) = timed(lambda: index.k_nearest(q_lat, q_lng, k=5), repeats)
+    density_ms, cells = timed(index.cell_density, repeats)
+
+    # Spot-check against exact haversine on a sample of queries
+    max_count_error = 0
+    max_nn_error_m = 0.0
+    for q in rng.choice(n_queries, size=min(20, n_queries), replace=False):
+        exact = np.array([haversine_m(q_lat[q], q_lng[q], a, b) for a, b in zip(lat, lng, strict=True)])
+        max_count_error = max(max_count_error, abs(int((exact <= 1000.0).sum()) - int(counts[q])))
+        max_nn_error_m = max(max_nn_error_m, abs(float(np.sort(exact)[0]) - float(dist[q, 0])))
+
+    return {
+        "points": n_points,
+        "queries": n_queries,
+        "build_ms": round(build_ms, 3),
+        "radius_count_ms": round(radius_ms, 3),
+        "k_nearest_ms": round(knn_ms, 3),
+        "cell_density_ms": round(density_ms, 3),
+        "occupied_cells": int(cells["count"].size),
+        "max_count_error": max_count_error,
+        "max_nn_error_m": round(max_nn_error_m, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    results = [run(n, args.queries, args.repeats, args.seed) for n in args.points]
+    print(json.dumps({"benchmark": "spatial_index", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
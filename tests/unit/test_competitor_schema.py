@@ -0,0 +1,52 @@
+"""Unit tests for merging per-keyword competitor sets."""
+
+from typing import Any
+
+import numpy as np
+
+from app.schemas.competitor_schema import CompetitorSet
+from app.utils.spatial_index import SpatialIndex
+
+
+def _place(place_id: str, name: str, types: list[str], lat: float | None = 22.55) -> dict:
+    place: dict[str, Any] = {"place_id": place_id, "name": name, "vicinity": "Park Street, Kolkata", "types": types}
+    if lat is not None:
+        place["geometry"] = {"location": {"lat": lat, "lng": 88.35}}
+    return place
+
+
+def test_merge_categorizes_by_best_match_regardless_of_order() -> None:
+    shared = _place("p1", "Iron Temple Gym", ["gym", "health"])
+    yoga = CompetitorSet.from_places([shared], "yoga studios")
+    gym = CompetitorSet.from_places([shared, _place("p2", "Anytime Fitness", ["gym"])], "gym")
+
+    for merged in (yoga.merge(gym), gym.merge(yoga)):
+        assert len(merged) == 2
+        assert merged.keywords[merged.category[merged.ids.index("p1")]] == "gym"
+        assert sorted(merged.select("gym").ids) == ["p1", "p2"]
+        assert len(merged.select("yoga studios")) == 0
+
+
+def test_merge_ties_go_to_the_first_keyword() -> None:
+    shared = _place("p1", "Corner House", ["food"])
+    merged = CompetitorSet.from_places([shared], "cafe").merge(
+        CompetitorSet.from_places([shared], "bakery")
+    )
+
+    assert merged.keywords == ["cafe", "bakery"]
+    assert merged.category == [0]
+
+
+def test_missing_coordinates_are_not_placed_at_origin() -> None:
+    partial = CompetitorSet.from_places([_place("p1", "Corner House", ["cafe"], lat=None)], "cafe")
+    assert partial.lat == [None] and partial.lng == [None]
+
+    restored = CompetitorSet.model_validate(partial.model_dump())
+    other = CompetitorSet.from_places([_place("p2", "Flurys", ["cafe"])], "cafe")
+    index = SpatialIndex.from_competitors(restored.merge(other))
+    assert len(index) == 1
+    assert index.point_ids.tolist() == [1]
+
+    filled = partial.merge(CompetitorSet.from_places([_place("p1", "Corner House", ["cafe"])], "cafe"))
+    assert filled.lat == [22.55] and filled.lng == [88.35]
+    assert np.isfinite(np.asarray(filled.lat, dtype=np.float64)).all()
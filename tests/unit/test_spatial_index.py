@@ -0,0 +1,79 @@
+"""Unit tests for the spatial index's k-nearest and radius queries."""
+
+import numpy as np
+import pytest
+
+from app.utils.spatial_index import SpatialIndex
+
+
+def _brute_force(index: SpatialIndex, lat: np.ndarray, lng: np.ndarray, k: int) -> np.ndarray:
+    qx, qy = index.project(lat, lng)
+    d = np.hypot(qx[:, None] - index.x[None, :], qy[:, None] - index.y[None, :])
+    return np.sort(d, axis=1)[:, :k]
+
+
+@pytest.fixture
+def points() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(7)
+    return 22.55 + rng.normal(0, 0.02, 500), 88.35 + rng.normal(0, 0.02, 500)
+
+
+def test_k_nearest_matches_brute_force(points: tuple[np.ndarray, np.ndarray]) -> None:
+    index = SpatialIndex(*points)
+    rng = np.random.default_rng(11)
+    lat = np.concatenate([22.55 + rng.normal(0, 0.05, 300), [23.5, 20.0]])
+    lng = np.concatenate([88.35 + rng.normal(0, 0.05, 300), [88.0, 90.0]])
+
+    distances, indices = index.k_nearest(lat, lng, k=5)
+
+    np.testing.assert_allclose(distances, _brute_force(index, lat, lng, 5))
+    qx, qy = index.project(lat, lng)
+    np.testing.assert_allclose(
+        np.hypot(qx[:, None] - index.x[indices], qy[:, None] - index.y[indices]), distances
+    )
+
+
+def test_k_nearest_nan_query_returns_no_neighbours(points: tuple[np.ndarray, np.ndarray]) -> None:
+    index = SpatialIndex(*points)
+
+    distances, indices = index.k_nearest([np.nan, 22.55, 22.56], [88.35, np.nan, 88.36], k=3)
+
+    assert np.isinf(distances[:2]).all()
+    assert (indices[:2] == -1).all()
+    assert np.isfinite(distances[2]).all()
+    assert (indices[2] >= 0).all()
+
+
+def test_k_nearest_skips_nan_points_when_k_exceeds_count() -> None:
+    index = SpatialIndex([22.55, np.nan, 22.56], [88.35, 88.36, np.inf])
+
+    distances, indices = index.k_nearest([22.55], [88.35], k=3)
+
+    assert len(index) == 1
+    assert indices[0].tolist() == [0, -1, -1]
+    assert distances[0, 0] == pytest.approx(0.0)
+    assert np.isinf(distances[0, 1:]).all()
+
+
+def test_nan_points_keep_input_positions() -> None:
+    index = SpatialIndex([np.nan, 22.55, 22.60], [88.35, 88.35, 88.35])
+
+    _, indices = index.k_nearest([22.59, 22.56], [88.35, 88.35], k=1)
+
+    assert indices[:, 0].tolist() == [2, 1]
+
+
+def test_radius_count_ignores_nan(points: tuple[np.ndarray, np.ndarray]) -> None:
+    lat, lng = points
+    index = SpatialIndex(np.append(lat, np.nan), np.append(lng, 88.35))
+
+    counts = index.radius_count([22.55, np.nan], [88.35, 88.35], 1000.0)
+
+    qx, qy = index.project(np.array([22.55]), np.array([88.35]))
+    expected = np.count_nonzero(np.hypot(qx[0] - index.x, qy[0] - index.y) <= 1000.0)
+    assert counts.tolist() == [expected, 0]
+
+
+def test_non_finite_origin_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        SpatialIndex([22.55], [88.35], origin=(np.nan, 88.35))